@@ -1,9 +1,143 @@
 # -*- coding: utf-8 -*-
+import argparse
+import sys
 
 
-def main():
-    print("Hello World Python!!!")
+def build_parser():
+    """Command line of ``hello-world-python``"""
+    parser = argparse.ArgumentParser(prog='hello-world-python')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='并行运行课程演示')
+    run_parser.add_argument('modules', nargs='*',
+                            help='主题、课程或演示名，例如 concurrency 或 oop.polymorphism，默认全部')
+    run_parser.add_argument('-j', '--jobs', type=int, default=None, help='工作进程数')
+    run_parser.add_argument('--output', choices=('terminal', 'buffered', 'null'), default='terminal',
+                            help='演示输出方式：立即打印、缓冲后一次写出或完全丢弃')
+    run_parser.add_argument('--profile', metavar='DIR', default=None,
+                            help='对每个演示进行 cProfile 与 tracemalloc 分析，报告写入该目录')
+    run_parser.add_argument('--profile-top', type=int, default=20, help='热点表与内存分配表的行数')
+    run_parser.set_defaults(handler=_run)
+
+    serve_parser = subparsers.add_parser('serve', help='启动问候 HTTP 服务')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8080)
+    serve_parser.set_defaults(handler=_serve)
+
+    loadgen_parser = subparsers.add_parser('loadgen', help='压测问候服务')
+    loadgen_parser.add_argument('--host', default='127.0.0.1')
+    loadgen_parser.add_argument('--port', type=int, default=None, help='已运行服务的端口，默认启动一个子进程服务')
+    loadgen_parser.add_argument('-c', '--concurrency', type=int, nargs='+', default=[1, 8, 64], help='并发连接数')
+    loadgen_parser.add_argument('-n', '--requests', type=int, default=20000, help='每个并发级别的请求总数')
+    loadgen_parser.add_argument('-p', '--pipeline', type=int, default=1, help='每个连接一次发送的请求数')
+    loadgen_parser.set_defaults(handler=_loadgen)
+
+    startup_parser = subparsers.add_parser('startup', help='测量各课程的导入时间、首次调用延迟和峰值内存')
+    startup_parser.add_argument('modules', nargs='*', help='主题、课程或演示名，默认全部')
+    startup_parser.add_argument('--no-calls', dest='calls', action='store_false', help='只测量导入，不调用演示')
+    startup_parser.add_argument('--baseline', default=None, help='JSON 基线文件')
+    startup_parser.add_argument('--save', action='store_true', help='把本次结果保存为基线')
+    startup_parser.add_argument('--threshold', type=float, default=0.2, help='退化阈值，0.2 表示 20%%')
+    startup_parser.set_defaults(handler=_startup)
+
+    bench_parser = subparsers.add_parser('bench', help='运行微基准测试并保存 JSON 结果')
+    bench_parser.add_argument('names', nargs='*', help='基准名或前缀，默认全部')
+    bench_parser.add_argument('-o', '--output-file', default=None, help='结果文件，默认 benchmarks/bench-v<版本>-<时间>.json')
+    bench_parser.add_argument('-r', '--repeat', type=int, default=20, help='每个基准的采样次数')
+    bench_parser.add_argument('--min-time', type=float, default=0.01, help='每次采样的最短秒数')
+    bench_parser.set_defaults(handler=_bench)
+
+    compare_parser = subparsers.add_parser('bench-compare', help='比较两次微基准结果')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.set_defaults(handler=_bench_compare)
+
+    footprint_parser = subparsers.add_parser('footprint', help='测量领域类每个实例的内存占用和构造速度')
+    footprint_parser.add_argument('names', nargs='*', help='类名，例如 Car 或 polymorphism.Dog，默认全部')
+    footprint_parser.add_argument('-n', '--count', type=int, default=1_000_000, help='每个类构造的实例数')
+    footprint_parser.set_defaults(handler=_footprint)
+
+    transfers_parser = subparsers.add_parser('transfers', help='并发转账压测，检查总余额守恒')
+    transfers_parser.add_argument('-a', '--accounts', type=int, default=1000, help='账户数')
+    transfers_parser.add_argument('-n', '--transfers', type=int, default=200_000, help='转账笔数')
+    transfers_parser.add_argument('-w', '--workers', type=int, default=8, help='线程数')
+    transfers_parser.add_argument('--chunk-size', type=int, default=256, help='每次交给线程的转账笔数')
+    transfers_parser.add_argument('--seed', type=int, default=None, help='随机种子')
+    transfers_parser.set_defaults(handler=_transfers)
+
+    replay_parser = subparsers.add_parser('replay', help='重放账户事件日志，报告每秒事件数')
+    replay_parser.add_argument('log', help='事件日志文件')
+    replay_parser.add_argument('--checkpoint', default=None, help='检查点文件，存在时从中继续并在结束时更新')
+    replay_parser.add_argument('--every', type=int, default=None, help='每重放这么多事件写一次检查点')
+    replay_parser.set_defaults(handler=_replay)
+
+    totals_parser = subparsers.add_parser('shape-totals', help='多进程汇总形状总面积与总周长，报告 1 到 N 个进程的吞吐')
+    totals_parser.add_argument('-n', '--shapes', type=int, default=10_000_000, help='形状个数')
+    totals_parser.add_argument('-w', '--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='进程数')
+    totals_parser.add_argument('--chunk-size', type=int, default=1 << 16, help='每条记录包含的形状数')
+    totals_parser.set_defaults(handler=_shape_totals)
+    return parser
+
+
+def _run(args):
+    from src.hello_world_python import runner
+    return runner.main(args.modules, jobs=args.jobs, profile_dir=args.profile, profile_top=args.profile_top,
+                       output_mode=args.output)
+
+
+def _serve(args):
+    from src.hello_world_python import service
+    service.serve(args.host, args.port)
+    return 0
+
+
+def _loadgen(args):
+    from src.hello_world_python import loadgen
+    return loadgen.main(args.host, args.port, args.concurrency, args.requests, args.pipeline)
+
+
+def _startup(args):
+    from src.hello_world_python import startup
+    return startup.main(args.modules, args.calls, args.baseline, args.save, args.threshold)
+
+
+def _bench(args):
+    from src.hello_world_python import bench
+    return bench.main(args.names, args.output_file, args.repeat, args.min_time)
+
+
+def _bench_compare(args):
+    from src.hello_world_python import bench
+    return bench.compare_main(args.old, args.new)
+
+
+def _footprint(args):
+    from src.hello_world_python import footprint
+    return footprint.main(args.names, args.count)
+
+
+def _transfers(args):
+    from src.hello_world_python import transfers
+    return transfers.main(args.accounts, args.transfers, args.workers, args.chunk_size, args.seed)
+
+
+def _replay(args):
+    from src.hello_world_python import eventlog
+    return eventlog.main(args.log, args.checkpoint, args.every)
+
+
+def _shape_totals(args):
+    from src.hello_world_python import totals
+    return totals.main(args.shapes, args.workers, args.chunk_size)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        print("Hello World Python!!!")
+        return 0
+    return args.handler(args)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -41,9 +41,9 @@ def importing_techniques():
     from math import cos as cosine
     print(f"  from math import cos as cosine: {cosine(0)}")
     
-    # 5. 导入模块中的所有内容（不推荐）
-    from math import *
-    print(f"  from math import *: {tan(0)}")
+    # 5. 导入模块中的所有内容（不推荐，且只允许在模块顶层使用）
+    #    from math import *  # 写在函数内部会引发 SyntaxError
+    print(f"  from math import *: 只能在模块顶层使用，tan(0) = {math.tan(0)}")
 
 
 def standard_library_examples():
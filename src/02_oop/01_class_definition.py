@@ -10,6 +10,9 @@ class Car:
     wheels = 4
     engine_type = "内燃机"
     
+    # 实例属性名单 - 实例不再带 __dict__，每个对象更省内存
+    __slots__ = ("brand", "model", "color", "is_running", "speed")
+    
     def __init__(self, brand, model, color):
         """
         构造方法 - 初始化对象属性
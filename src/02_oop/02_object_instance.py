@@ -9,6 +9,9 @@ class Smartphone:
     # 类属性
     operating_systems = ["Android", "iOS"]
     
+    # 固定的实例属性，省去每个实例的 __dict__
+    __slots__ = ("brand", "model", "os_type", "is_powered_on", "apps", "battery_level")
+    
     def __init__(self, brand, model, os_type):
         """初始化手机对象"""
         self.brand = brand
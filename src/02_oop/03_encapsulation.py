@@ -3,35 +3,241 @@ Python 面向对象编程 - 封装
 将数据和操作数据的方法绑定在一起，隐藏内部实现细节
 """
 
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, compress, islice
+
+# 交易类型 - 账本中只保存类型编号
+DEPOSIT, WITHDRAWAL, TRANSFER_IN, TRANSFER_OUT, INTEREST = range(5)
+KIND_LABELS = ("存款", "取款", "转入", "转出", "利息")
+CREDIT_KINDS = (DEPOSIT, TRANSFER_IN, INTEREST)
+DEBIT_KINDS = (WITHDRAWAL, TRANSFER_OUT)
+# 按类型筛选行的字节翻译表：类型编号翻译为 1，其余翻译为 0
+_SELECT = tuple(bytes(int(value == code) for value in range(256)) for code in range(len(KIND_LABELS)))
+
+
+def format_account_number(number):
+    """把整数号码格式化为 ACC 开头的账户号码"""
+    return f"ACC{number:06d}"
+
+
+def parse_account_number(account_number):
+    """把账户号码还原为整数，格式不符时返回 None"""
+    digits = account_number[3:]
+    if account_number.startswith("ACC") and digits.isdigit():
+        return int(digits)
+    return None
+
+
+def to_cents(amount):
+    """把金额（元）换算成整数分"""
+    return round(amount * 100)
+
+
+def from_cents(cents):
+    """把整数分换算回元，整元保持整数"""
+    return cents // 100 if cents % 100 == 0 else cents / 100
+
+
+def format_cents(cents):
+    """把整数分格式化为元，整元不带小数"""
+    if cents % 100 == 0:
+        return str(cents // 100)
+    return f"{cents / 100:.2f}"
+
+
+class Ledger:
+    """
+    只追加的交易账本 - 封装内部存储
+    每条交易按列保存在 array.array 中：类型、金额（分）、时间戳、对方账户，
+    追加是均摊 O(1)；只有在查询时才格式化成字符串。
+    按时间范围求和依赖按需补齐的分类型前缀和，整列计算，不需要逐行创建 Python 对象。
+    """
+    
+    __slots__ = ("_kinds", "_amounts", "_timestamps", "_parties",
+                 "_party_names", "_party_index", "_prefix", "_indexed")
+    
+    def __init__(self):
+        self._kinds = array("B")
+        self._amounts = array("q")       # 金额，单位为分，始终为正
+        self._timestamps = array("d")    # 单调不减，便于二分查找
+        self._parties = array("l")       # 对方账户在 _party_names 中的下标，-1 表示没有
+        self._party_names = []
+        self._party_index = {}
+        self._prefix = None      # 每种类型的 (行号, 前缀和)，第一次求和时才创建
+        self._indexed = 0
+    
+    def __len__(self):
+        return len(self._kinds)
+    
+    def append(self, kind, cents, counterparty=None, timestamp=None):
+        """追加一条交易，金额为整数分"""
+        if timestamp is None:
+            timestamp = time.time()
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            timestamp = self._timestamps[-1]  # 系统时钟回拨时保持有序
+        party = -1
+        if counterparty is not None:
+            party = self._party_index.get(counterparty)
+            if party is None:
+                party = self._party_index[counterparty] = len(self._party_names)
+                self._party_names.append(counterparty)
+        self._kinds.append(kind)
+        self._amounts.append(cents)
+        self._timestamps.append(timestamp)
+        self._parties.append(party)
+    
+    def rows(self, start=None, end=None):
+        """返回时间范围 [start, end) 对应的行号区间 (lo, hi)"""
+        lo = 0 if start is None else bisect_left(self._timestamps, start)
+        hi = len(self) if end is None else bisect_left(self._timestamps, end)
+        return lo, max(lo, hi)
+    
+    def _extend_prefix(self):
+        """
+        把前缀和补齐到最新一行，每行只处理一次
+        每种类型只保存属于它的行号和金额前缀和，用 compress/accumulate 整列计算，
+        不在 Python 层逐行循环
+        """
+        if self._prefix is None:
+            self._prefix = tuple((array("q"), array("q", [0])) for _ in KIND_LABELS)
+        start, end = self._indexed, len(self._kinds)
+        if start == end:
+            return
+        kinds, amounts = self._kinds[start:end].tobytes(), self._amounts[start:end]
+        for code, (rows, prefix) in enumerate(self._prefix):
+            selected = kinds.translate(_SELECT[code])  # 该类型的行为 1，其余为 0
+            rows.extend(compress(range(start, end), selected))
+            prefix.extend(islice(accumulate(compress(amounts, selected), initial=prefix[-1]), 1, None))
+        self._indexed = end
+    
+    def _kind_sum(self, kind, lo, hi):
+        """某种类型在行号区间 [lo, hi) 内的合计"""
+        rows, prefix = self._prefix[kind]
+        return prefix[bisect_left(rows, hi)] - prefix[bisect_left(rows, lo)]
+    
+    def sum_cents(self, kinds=None, start=None, end=None):
+        """
+        时间范围内的金额合计（分）
+        :param kinds: 交易类型的序列，None 表示计算净流入（收入减支出）
+        """
+        lo, hi = self.rows(start, end)
+        self._extend_prefix()
+        if kinds is None:
+            return (sum(self._kind_sum(k, lo, hi) for k in CREDIT_KINDS)
+                    - sum(self._kind_sum(k, lo, hi) for k in DEBIT_KINDS))
+        return sum(self._kind_sum(k, lo, hi) for k in kinds)
+    
+    def entry(self, row):
+        """返回一行交易 (类型, 金额分, 时间戳, 对方账户)"""
+        party = self._parties[row]
+        return (self._kinds[row], self._amounts[row], self._timestamps[row],
+                None if party < 0 else self._party_names[party])
+    
+    def format(self, start=None, end=None):
+        """把时间范围内的交易格式化为 "存款: +500" 形式的字符串"""
+        lo, hi = self.rows(start, end)
+        lines = []
+        for row in range(lo, hi):
+            kind, cents, _, party = self.entry(row)
+            sign = "+" if kind in CREDIT_KINDS else "-"
+            line = f"{KIND_LABELS[kind]}: {sign}{format_cents(cents)}"
+            lines.append(line if party is None else f"{line} ({party})")
+        return lines
+
+
 class BankAccount:
     """银行账户类 - 演示封装概念"""
     
-    def __init__(self, account_holder, initial_balance=0):
+    # 类属性 - 所有账户共享的号码分配器，号码按顺序发放，不会重复
+    _next_number = 100000
+    _number_lock = threading.Lock()
+    
+    # 没有观察者时共用这个空元组，订阅后实例才有自己的列表
+    _observers = ()
+    
+    # 转账和计息期间 deposit/withdraw 按这个 (类型, 对方账户) 记账，平时为 None
+    _booking = None
+    
+    def __init__(self, account_holder, initial_balance=0, account_number=None):
         """
         初始化银行账户
         :param account_holder: 账户持有人
         :param initial_balance: 初始余额
+        :param account_number: 已有的账户号码（例如从快照恢复），默认新分配一个
         """
         # 使用双下划线前缀表示私有属性
         self.__account_holder = account_holder  # 私有属性
         self.__balance = initial_balance        # 私有属性
-        self.__transaction_history = []         # 私有属性
-        self._account_number = self._generate_account_number()  # 受保护属性
+        self.__ledger = Ledger()                # 私有属性 - 交易账本
+        if account_number is None:
+            account_number = self._generate_account_number()
+        self._account_number = account_number  # 受保护属性
+    
+    @classmethod
+    def _reserve_numbers(cls, count=1, align=1):
+        """
+        预留一段连续的账户号码 - 受保护方法，返回第一个号码（整数）
+        :param align: 起始号码对齐到它的整数倍
+        """
+        with BankAccount._number_lock:
+            start = -(-BankAccount._next_number // align) * align
+            BankAccount._next_number = start + count
+        return start
+    
+    @classmethod
+    def _skip_numbers(cls, number):
+        """保证之后发放的号码都大于 number（例如恢复旧账户之后）- 受保护方法"""
+        with BankAccount._number_lock:
+            BankAccount._next_number = max(BankAccount._next_number, number + 1)
     
     def _generate_account_number(self):
-        """生成账户号码 - 受保护方法"""
-        import random
-        return f"ACC{random.randint(100000, 999999)}"
+        """生成账户号码 - 受保护方法，O(1) 且不会重复"""
+        return format_account_number(self._reserve_numbers())
+    
+    def subscribe(self, observer):
+        """
+        订阅余额变动 - 公共接口
+        :param observer: observer(account, kind, cents, target)，转账时转出方和转入方
+            各通知一次，target 为对方账户，其余变动的 target 为 None
+        """
+        if not self._observers:
+            self._observers = []
+        self._observers.append(observer)
+    
+    def unsubscribe(self, observer):
+        """取消订阅"""
+        self._observers.remove(observer)
+    
+    def _notify(self, kind, cents, target=None):
+        """通知观察者 - 受保护方法"""
+        for observer in self._observers:
+            observer(self, kind, cents, target)
     
     def deposit(self, amount):
         """存款方法 - 公共接口"""
         if amount > 0:
             self.__balance += amount
-            self.__transaction_history.append(f"存款: +{amount}")
+            kind, counterparty = self._booking or (DEPOSIT, None)
+            self._book(kind, to_cents(amount), counterparty)
             print(f"成功存入 {amount} 元，当前余额: {self.__balance} 元")
         else:
             print("存款金额必须大于0")
     
+    def _book(self, kind, cents, counterparty=None, timestamp=None):
+        """记入账本并通知观察者 - 受保护方法，余额由调用方修改"""
+        party = None if counterparty is None else counterparty._account_number
+        self.__ledger.append(kind, cents, party, timestamp)
+        if self._observers:
+            self._notify(kind, cents, counterparty)
+    
+    def _credit_cents(self, cents, kind=DEPOSIT, timestamp=None):
+        """按整数分入账，不打印 - 受保护方法，供批量操作使用"""
+        self.__balance += from_cents(cents)
+        self._book(kind, cents, None, timestamp)
+    
     def withdraw(self, amount):
         """取款方法 - 公共接口"""
         if amount <= 0:
@@ -40,7 +246,8 @@ class BankAccount:
         
         if amount <= self.__balance:
             self.__balance -= amount
-            self.__transaction_history.append(f"取款: -{amount}")
+            kind, counterparty = self._booking or (WITHDRAWAL, None)
+            self._book(kind, to_cents(amount), counterparty)
             print(f"成功取出 {amount} 元，当前余额: {self.__balance} 元")
             return True
         else:
@@ -51,6 +258,14 @@ class BankAccount:
         """查询余额 - 公共接口"""
         return self.__balance
     
+    def get_transaction_history(self, start=None, end=None):
+        """查询交易记录 - 只在这里格式化"""
+        return self.__ledger.format(start, end)
+    
+    def get_ledger(self):
+        """获取交易账本，用于范围查询和求和"""
+        return self.__ledger
+    
     def get_account_info(self):
         """获取账户信息 - 公共接口"""
         return {
@@ -65,27 +280,46 @@ class BankAccount:
         return amount > 0 and amount <= self.__balance
     
     def transfer(self, target_account, amount):
-        """转账方法"""
+        """转账方法 - 通过公共接口 withdraw/deposit 完成，账本记为转出/转入"""
         if self.__validate_transaction(amount):
-            if self.withdraw(amount):
-                target_account.deposit(amount)
+            self._booking = (TRANSFER_OUT, target_account)
+            try:
+                withdrawn = self.withdraw(amount)
+            finally:
+                self._booking = None
+            if withdrawn:
+                target_account._booking = (TRANSFER_IN, self)
+                try:
+                    target_account.deposit(amount)
+                finally:
+                    target_account._booking = None
                 print(f"成功转账 {amount} 元到账户 {target_account._account_number}")
-        else:
-            print("转账失败，余额不足或金额无效")
+                return True
+            return False
+        print("转账失败，余额不足或金额无效")
+        return False
 
 
 class EnhancedBankAccount(BankAccount):
     """增强版银行账户 - 演示受保护属性和方法的访问"""
     
-    def __init__(self, account_holder, initial_balance=0):
-        super().__init__(account_holder, initial_balance)
-        self.__interest_rate = 0.02  # 私有属性
+    def __init__(self, account_holder, initial_balance=0, account_number=None, interest_rate=0.02):
+        super().__init__(account_holder, initial_balance, account_number)
+        self.__interest_rate = interest_rate  # 私有属性
+    
+    def get_interest_rate(self):
+        """查询利率 - 公共接口"""
+        return self.__interest_rate
     
     def add_interest(self):
         """添加利息"""
         # 可以访问父类的受保护属性
         interest = self.get_balance() * self.__interest_rate
-        self.deposit(interest)
+        self._booking = (INTEREST, None)
+        try:
+            self.deposit(interest)
+        finally:
+            self._booking = None
         print(f"添加利息 {interest:.2f} 元")
 
 
@@ -120,6 +354,14 @@ def encapsulation_demo():
     print(f"\n转账后 {account1.get_account_info()['account_holder']} 余额: {account1.get_balance()} 元")
     print(f"转账后 {account2.get_account_info()['account_holder']} 余额: {account2.get_balance()} 元")
     
+    # 查看交易记录 - 账本只在查询时格式化
+    print(f"\n{account1.get_account_info()['account_holder']} 的交易记录:")
+    for line in account1.get_transaction_history():
+        print(f"  {line}")
+    ledger = account1.get_ledger()
+    print(f"存款合计: {format_cents(ledger.sum_cents([DEPOSIT]))} 元，"
+          f"净流入: {format_cents(ledger.sum_cents())} 元")
+    
     # 演示增强版账户
     print("\n--- 增强版账户演示 ---")
     enhanced_account = EnhancedBankAccount("王五", 2000)
@@ -6,6 +6,8 @@ Python 面向对象编程 - 继承
 class Animal:
     """动物基类"""
     
+    __slots__ = ("name", "species", "energy")
+    
     def __init__(self, name, species):
         self.name = name
         self.species = species
@@ -33,6 +35,8 @@ class Animal:
 class Dog(Animal):
     """狗类 - 继承自动物类"""
     
+    __slots__ = ("breed",)
+    
     def __init__(self, name, breed):
         # 调用父类构造方法
         super().__init__(name, "犬科")
@@ -56,6 +60,8 @@ class Dog(Animal):
 class Cat(Animal):
     """猫类 - 继承自动物类"""
     
+    __slots__ = ("color", "lives")
+    
     def __init__(self, name, color):
         super().__init__(name, "猫科")
         self.color = color
@@ -79,6 +85,8 @@ class Cat(Animal):
 class Bird(Animal):
     """鸟类 - 继承自动物类"""
     
+    __slots__ = ("wingspan",)
+    
     def __init__(self, name, wingspan):
         super().__init__(name, "鸟类")
         self.wingspan = wingspan  # 翼展
@@ -104,6 +112,8 @@ class Bird(Animal):
 class PetDog(Dog):
     """宠物狗类 - 多层继承"""
     
+    __slots__ = ("owner",)
+    
     def __init__(self, name, breed, owner):
         super().__init__(name, breed)
         self.owner = owner  # 主人
@@ -4,10 +4,39 @@ Python 面向对象编程 - 多态
 """
 
 import math
+import operator
+from array import array
+
+
+def _dimension(name):
+    """几何属性：读取由 C 实现的 attrgetter 完成，重新赋值时清空缓存"""
+    slot = "_" + name
+    
+    def set_dimension(self, value):
+        setattr(self, slot, value)
+        self._area = self._perimeter = self._description = None
+    
+    return property(operator.attrgetter(slot), set_dimension)
+
+
+def _is_triangle(a, b, c):
+    """三边能否构成三角形：排序后最短边为正且大于另两边之差（接近退化时这个差值没有舍入误差）"""
+    a, b, c = sorted((a, b, c), reverse=True)
+    return c > 0 and c > a - b
+
+
+def _heron(a, b, c):
+    """数值稳定的海伦公式：边从大到小排序后按固定括号计算，近退化三角形也不会丢失精度"""
+    a, b, c = sorted((a, b, c), reverse=True)
+    return 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+
 
 class Shape:
     """形状基类 - 定义通用接口"""
     
+    # 面积、周长和描述的缓存，None 表示需要重新计算
+    __slots__ = ("_area", "_perimeter", "_description")
+    
     def area(self):
         """计算面积 - 抽象方法"""
         raise NotImplementedError("子类必须实现area方法")
@@ -24,76 +53,128 @@ class Shape:
 class Rectangle(Shape):
     """矩形类"""
     
+    __slots__ = ("_width", "_height")
+    width = _dimension("width")
+    height = _dimension("height")
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
     
     def area(self):
-        """计算矩形面积"""
-        return self.width * self.height
+        """计算矩形面积（缓存）"""
+        if self._area is None:
+            self._area = self.width * self.height
+        return self._area
     
     def perimeter(self):
-        """计算矩形周长"""
-        return 2 * (self.width + self.height)
+        """计算矩形周长（缓存）"""
+        if self._perimeter is None:
+            self._perimeter = 2 * (self.width + self.height)
+        return self._perimeter
     
     def describe(self):
-        """描述矩形"""
-        return f"这是一个矩形，宽: {self.width}, 高: {self.height}"
+        """描述矩形（缓存）"""
+        if self._description is None:
+            self._description = f"这是一个矩形，宽: {self.width}, 高: {self.height}"
+        return self._description
 
 
 class Circle(Shape):
     """圆形类"""
     
+    __slots__ = ("_radius",)
+    radius = _dimension("radius")
+    
     def __init__(self, radius):
         self.radius = radius
     
     def area(self):
-        """计算圆形面积"""
-        return math.pi * self.radius ** 2
+        """计算圆形面积（缓存）"""
+        if self._area is None:
+            self._area = math.pi * self.radius ** 2
+        return self._area
     
     def perimeter(self):
-        """计算圆形周长"""
-        return 2 * math.pi * self.radius
+        """计算圆形周长（缓存）"""
+        if self._perimeter is None:
+            self._perimeter = 2 * math.pi * self.radius
+        return self._perimeter
     
     def describe(self):
-        """描述圆形"""
-        return f"这是一个圆形，半径: {self.radius}"
+        """描述圆形（缓存）"""
+        if self._description is None:
+            self._description = f"这是一个圆形，半径: {self.radius}"
+        return self._description
 
 
 class Triangle(Shape):
     """三角形类"""
     
+    __slots__ = ("_a", "_b", "_c")
+    a = _dimension("a")
+    b = _dimension("b")
+    c = _dimension("c")
+    
     def __init__(self, a, b, c):
         # 检查是否能构成三角形
-        if a + b <= c or a + c <= b or b + c <= a:
+        if not _is_triangle(a, b, c):
             raise ValueError("三边不能构成三角形")
         self.a = a
         self.b = b
         self.c = c
     
+    @classmethod
+    def from_sides(cls, a, b, c):
+        """
+        批量构造：一次遍历三列边长，不抛出异常
+        返回 (三角形列表, 被拒绝的行号 array('L'))
+        """
+        triangles, rejected = [], array("L")
+        new = object.__new__
+        for row, sides in enumerate(zip(a, b, c)):
+            if not _is_triangle(*sides):
+                rejected.append(row)
+                continue
+            # 已经校验过，直接写入槽位，跳过 __init__ 和属性的 setter
+            triangle = new(cls)
+            triangle._a, triangle._b, triangle._c = sides
+            triangle._area = triangle._perimeter = triangle._description = None
+            triangles.append(triangle)
+        return triangles, rejected
+    
     def area(self):
-        """使用海伦公式计算三角形面积"""
-        s = (self.a + self.b + self.c) / 2  # 半周长
-        return math.sqrt(s * (s - self.a) * (s - self.b) * (s - self.c))
+        """使用海伦公式计算三角形面积（缓存）"""
+        if self._area is None:
+            self._area = _heron(self.a, self.b, self.c)
+        return self._area
     
     def perimeter(self):
-        """计算三角形周长"""
-        return self.a + self.b + self.c
+        """计算三角形周长（缓存）"""
+        if self._perimeter is None:
+            self._perimeter = self.a + self.b + self.c
+        return self._perimeter
     
     def describe(self):
-        """描述三角形"""
-        return f"这是一个三角形，三边长: {self.a}, {self.b}, {self.c}"
+        """描述三角形（缓存）"""
+        if self._description is None:
+            self._description = f"这是一个三角形，三边长: {self.a}, {self.b}, {self.c}"
+        return self._description
 
 
 class Square(Rectangle):
     """正方形类 - 继承自矩形"""
     
+    __slots__ = ()
+    
     def __init__(self, side):
         super().__init__(side, side)
     
     def describe(self):
-        """描述正方形"""
-        return f"这是一个正方形，边长: {self.width}"
+        """描述正方形（缓存）"""
+        if self._description is None:
+            self._description = f"这是一个正方形，边长: {self.width}"
+        return self._description
 
 
 def print_shape_info(shape):
@@ -129,11 +210,17 @@ def polymorphism_demo():
     # 计算总周长
     total_perimeter = sum(shape.perimeter() for shape in shapes)
     print(f"所有形状的总周长: {total_perimeter:.2f}")
+    
+    # 批量构造三角形：不合法的行只被记录下来，不会抛出异常
+    triangles, rejected = Triangle.from_sides([3, 1, 5], [4, 1, 5], [5, 3, 8])
+    print(f"批量构造了 {len(triangles)} 个三角形，被拒绝的行: {list(rejected)}")
 
 
 class Animal:
     """动物基类 - 演示方法多态"""
     
+    __slots__ = ("name",)
+    
     def __init__(self, name):
         self.name = name
     
@@ -149,6 +236,8 @@ class Animal:
 class Dog(Animal):
     """狗类"""
     
+    __slots__ = ()
+    
     def make_sound(self):
         """重写父类方法"""
         print(f"{self.name} 汪汪叫")
@@ -157,6 +246,8 @@ class Dog(Animal):
 class Cat(Animal):
     """猫类"""
     
+    __slots__ = ()
+    
     def make_sound(self):
         """重写父类方法"""
         print(f"{self.name} 喵喵叫")
@@ -165,6 +256,8 @@ class Cat(Animal):
 class Bird(Animal):
     """鸟类"""
     
+    __slots__ = ()
+    
     def make_sound(self):
         """重写父类方法"""
         print(f"{self.name} 啾啾叫")
@@ -174,16 +267,52 @@ class Bird(Animal):
         print(f"{self.name} 在天空中飞翔")
 
 
-def animal_concert(animals):
-    """动物音乐会 - 演示多态"""
+def group_by_type(objects):
+    """
+    按具体类把对象分组，只遍历一次
+    组按类第一次出现的顺序排列，组内保持原来的顺序，所以结果是稳定的
+    """
+    groups = {}
+    for obj in objects:
+        groups.setdefault(type(obj), []).append(obj)
+    return groups
+
+
+def _call_grouped(objects, method_name):
+    """
+    每个类只查找一次方法，再对整组对象调用同一个函数
+    objects 可以是 group_by_type 的结果，这样分组只需做一次
+    """
+    groups = objects if isinstance(objects, dict) else group_by_type(objects)
+    for cls, members in groups.items():
+        method = getattr(cls, method_name)
+        for obj in members:
+            method(obj)
+
+
+def animal_concert(animals, grouped=False):
+    """
+    动物音乐会 - 演示多态
+    grouped=True 时按类型分组执行：先是第一种动物全部叫完，再轮到下一种；
+    animals 也可以是 group_by_type 已经分好的组
+    """
     print("\n--- 动物音乐会 ---")
+    if grouped:
+        _call_grouped(animals, "make_sound")
+        return
     for animal in animals:
         animal.make_sound()
 
 
-def animal_parade(animals):
-    """动物游行 - 演示多态"""
+def animal_parade(animals, grouped=False):
+    """
+    动物游行 - 演示多态
+    grouped=True 时按类型分组执行，顺序与 animal_concert 相同
+    """
     print("\n--- 动物游行 ---")
+    if grouped:
+        _call_grouped(animals, "move")
+        return
     for animal in animals:
         animal.move()
 
@@ -202,6 +331,11 @@ def advanced_polymorphism_demo():
     # 同一方法在不同对象上有不同表现
     animal_concert(animals)
     animal_parade(animals)
+    
+    # 按类型分组执行：同一种动物连续出场，组的顺序按第一次出现的顺序
+    groups = group_by_type(animals + [Dog("小黑"), Cat("花花")])
+    animal_concert(groups, grouped=True)
+    animal_parade(groups, grouped=True)
 
 
 if __name__ == "__main__":
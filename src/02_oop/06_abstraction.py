@@ -4,6 +4,11 @@ Python 面向对象编程 - 抽象
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
+import asyncio
 import math
 
 class Vehicle(ABC):
@@ -199,6 +204,26 @@ def abstraction_demo():
     print(f"预估续航里程: {electric_car.estimate_range():.0f} km")
 
 
+def _make_executor(mode, workers):
+    """按执行方式创建线程池或进程池，"inline" 返回 None"""
+    executors = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+    if mode == "inline":
+        return None
+    if mode not in executors:
+        raise ValueError(f"未知的执行方式: {mode}")
+    return executors[mode](max_workers=workers)
+
+
+async def _aiter(items):
+    """把普通可迭代对象和异步可迭代对象统一成异步迭代"""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class DataProcessor(ABC):
     """数据处理器抽象基类"""
     
@@ -207,13 +232,121 @@ class DataProcessor(ABC):
         """处理数据 - 抽象方法"""
         pass
     
-    def process_batch(self, data_list):
-        """批处理数据 - 具体方法"""
-        results = []
-        for data in data_list:
-            result = self.process(data)
-            results.append(result)
+    def process_batch(self, data_list, mode="inline", workers=None, chunk_size=1024):
+        """
+        批处理数据 - 具体方法，结果顺序与输入相同
+        mode 和 chunk_size 的含义见 process_chunks；"inline" 时不切块，直接处理整批
+        """
+        if mode == "inline":
+            return self._process_chunk(data_list)
+        if not isinstance(data_list, Sequence):
+            data_list = list(data_list)
+        results = [None] * len(data_list)  # 预先分配好结果列表，按块填入
+        for start, chunk in self.process_chunks(data_list, mode, workers, chunk_size):
+            results[start:start + len(chunk)] = chunk
         return results
+    
+    def _process_chunk(self, chunk):
+        """处理一个块 - 在当前线程、工作线程或工作进程中运行"""
+        process = self.process
+        return [process(data) for data in chunk]
+    
+    def process_chunks(self, data_list, mode="inline", workers=None, chunk_size=1024):
+        """
+        把 data_list 切成 chunk_size 大小的块处理，哪个块先完成就先产出
+        (起始下标, 结果列表)
+        mode: "inline" 在当前线程依次处理，"thread" 使用线程池，
+              "process" 使用进程池（处理器对象和数据需要能被 pickle）
+        workers: 线程或进程数，默认由执行器决定
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size 必须为正数")
+        starts = range(0, len(data_list), chunk_size)
+        executor = _make_executor(mode, workers)
+        if executor is None:
+            for start in starts:
+                yield start, self._process_chunk(data_list[start:start + chunk_size])
+            return
+        try:
+            futures = {executor.submit(self._process_chunk, data_list[start:start + chunk_size]): start
+                       for start in starts}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 调用方提前停止迭代时，取消还没开始的块
+            executor.shutdown(cancel_futures=True)
+    
+    def process_stream(self, items, mode="inline", workers=None, chunk_size=256, max_in_flight=4096):
+        """
+        流式处理：边读取 items（可以无限长，例如文件或套接字）边按输入顺序产出结果
+        同时在处理中的元素最多 max_in_flight 个（另加正在产出的一块）；
+        调用方不取结果时不会继续读取输入，慢的消费者自然会拖慢生产者（背压）
+        mode 和 chunk_size 的含义见 process_chunks
+        """
+        if chunk_size < 1 or max_in_flight < chunk_size:
+            raise ValueError("需要 1 <= chunk_size <= max_in_flight")
+        iterator = iter(items)
+        executor = _make_executor(mode, workers)
+        if executor is None:
+            process = self.process
+            for item in iterator:
+                yield process(item)
+            return
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < max_in_flight // chunk_size:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(self._process_chunk, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+    
+    async def aprocess_stream(self, items, mode="inline", workers=None, chunk_size=256, max_in_flight=4096):
+        """
+        process_stream 的异步生成器版本，items 可以是普通或异步可迭代对象
+        "thread"/"process" 模式下 process 在执行器中运行，不阻塞事件循环；
+        结果按块产出，输入很慢时可以把 chunk_size 调小来降低延迟
+        """
+        if chunk_size < 1 or max_in_flight < chunk_size:
+            raise ValueError("需要 1 <= chunk_size <= max_in_flight")
+        executor = _make_executor(mode, workers)
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        
+        def submit(chunk):
+            if executor is None:
+                future = loop.create_future()
+                future.set_result(self._process_chunk(chunk))
+            else:
+                future = loop.run_in_executor(executor, self._process_chunk, chunk)
+            pending.append(future)
+        
+        try:
+            chunk = []
+            async for item in _aiter(items):
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    submit(chunk)
+                    chunk = []
+                    # 在处理中的块已满：先交出最早的一块结果，再继续读取输入
+                    while len(pending) >= max_in_flight // chunk_size:
+                        for result in await pending.popleft():
+                            yield result
+            if chunk:
+                submit(chunk)
+            while pending:
+                for result in await pending.popleft():
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
 
 class NumberProcessor(DataProcessor):
@@ -254,6 +387,20 @@ def processor_demo():
     
     print(f"数字批处理: {num_processor.process_batch(numbers)}")
     print(f"字符串批处理: {str_processor.process_batch(strings)}")
+    
+    # 使用线程池分块处理，结果顺序不变
+    print(f"线程池分块批处理: {num_processor.process_batch(range(10), mode='thread', workers=2, chunk_size=3)}")
+    
+    # 流式处理：输入是生成器，结果边处理边产出，不需要把全部数据放进内存
+    squares = num_processor.process_stream((n for n in range(1, 1_000_000)), mode="thread",
+                                           chunk_size=4, max_in_flight=16)
+    print(f"流式处理的前 5 个结果: {list(islice(squares, 5))}")
+    squares.close()
+    
+    async def upper_words():
+        return [word async for word in str_processor.aprocess_stream(iter(strings), chunk_size=2)]
+    
+    print(f"异步流式处理: {asyncio.run(upper_words())}")
 
 
 if __name__ == "__main__":
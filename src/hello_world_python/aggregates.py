@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Incrementally maintained bank-wide aggregates
+
+``BankAggregates`` subscribes to ``BankAccount`` objects (``oop.encapsulation``)
+and updates its totals from every balance change, so queries no longer walk
+all accounts:
+
+* ``total_balance``, ``total_deposits``, ``total_withdrawals``: O(1)
+* ``top(n)``: the n richest accounts in O(log(accounts) + n)
+
+Balances are ranked in ``SortedKeys``, a list of sorted buckets of at most
+``2 * LOAD`` keys: one change costs two bisects over the bucket maxima and an
+insert/delete inside one bucket, bounded by ``LOAD`` regardless of the number
+of accounts.
+"""
+import threading
+from bisect import bisect_left, insort
+
+from . import lessons
+
+LOAD = 512
+
+
+class SortedKeys:
+    """Sorted multiset of comparable keys kept in bounded-size buckets"""
+
+    def __init__(self, load: int = LOAD):
+        self.load = load
+        self._buckets = []
+        self._maxes = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def add(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+        else:
+            index = bisect_left(self._maxes, key)
+            if index == len(self._maxes):
+                index -= 1
+                self._buckets[index].append(key)
+                self._maxes[index] = key
+            else:
+                insort(self._buckets[index], key)
+            bucket = self._buckets[index]
+            if len(bucket) > 2 * self.load:
+                self._buckets[index:index + 1] = [bucket[:self.load], bucket[self.load:]]
+                self._maxes[index:index + 1] = [bucket[self.load - 1], bucket[-1]]
+        self._len += 1
+
+    def remove(self, key):
+        """
+        :raises KeyError: when ``key`` is not present
+        """
+        index = bisect_left(self._maxes, key)
+        if index < len(self._maxes):
+            bucket = self._buckets[index]
+            position = bisect_left(bucket, key)
+            if position < len(bucket) and bucket[position] == key:
+                del bucket[position]
+                if bucket:
+                    self._maxes[index] = bucket[-1]
+                else:
+                    del self._buckets[index], self._maxes[index]
+                self._len -= 1
+                return
+        raise KeyError(key)
+
+    def largest(self, n):
+        """Up to ``n`` keys, largest first"""
+        keys = []
+        for bucket in reversed(self._buckets):
+            for key in reversed(bucket):
+                if len(keys) == n:
+                    return keys
+                keys.append(key)
+        return keys
+
+
+class BankAggregates:
+    """Totals and ranking of the tracked accounts, updated on every change"""
+
+    def __init__(self, load: int = LOAD):
+        """
+        :param load: bucket size of the balance ranking
+        """
+        self._bank = lessons.load('oop.encapsulation')
+        self._credits = {self._bank.DEPOSIT, self._bank.TRANSFER_IN, self._bank.INTEREST}
+        self._accounts = {}   # account number -> (account, balance in cents)
+        self._ranking = SortedKeys(load)
+        self._lock = threading.Lock()
+        self.balance_cents = 0
+        self.deposit_cents = 0
+        self.withdrawal_cents = 0
+
+    def __len__(self):
+        return len(self._accounts)
+
+    @property
+    def total_balance(self):
+        return self._bank.from_cents(self.balance_cents)
+
+    @property
+    def total_deposits(self):
+        return self._bank.from_cents(self.deposit_cents)
+
+    @property
+    def total_withdrawals(self):
+        return self._bank.from_cents(self.withdrawal_cents)
+
+    def track(self, account):
+        """Include an account and follow its changes"""
+        number = account._account_number  # pylint: disable=protected-access
+        cents = self._bank.to_cents(account.get_balance())
+        with self._lock:
+            if number in self._accounts:
+                raise ValueError(f'账户已在统计中: {number}')
+            self._accounts[number] = (account, cents)
+            self._ranking.add((cents, number))
+            self.balance_cents += cents
+        account.subscribe(self.record)
+
+    def untrack(self, account):
+        number = account._account_number  # pylint: disable=protected-access
+        account.unsubscribe(self.record)
+        with self._lock:
+            _, cents = self._accounts.pop(number)
+            self._ranking.remove((cents, number))
+            self.balance_cents -= cents
+
+    def _move(self, number, delta):
+        entry = self._accounts.get(number)
+        if entry is None:
+            return
+        account, cents = entry
+        self._ranking.remove((cents, number))
+        self._ranking.add((cents + delta, number))
+        self._accounts[number] = (account, cents + delta)
+        self.balance_cents += delta
+
+    def record(self, account, kind, cents, target=None):
+        """Observer callback, see ``BankAccount.subscribe``"""
+        # pylint: disable=protected-access
+        if kind == self._bank.TRANSFER_IN and self.record in target._observers:
+            return  # already moved by the sender's TRANSFER_OUT
+        with self._lock:
+            if kind in self._credits:
+                self._move(account._account_number, cents)
+                if kind == self._bank.DEPOSIT:
+                    self.deposit_cents += cents
+            else:
+                self._move(account._account_number, -cents)
+                if kind == self._bank.WITHDRAWAL:
+                    self.withdrawal_cents += cents
+                elif target is not None:
+                    self._move(target._account_number, cents)
+
+    def top(self, n=10):
+        """``(account, balance)`` of the ``n`` richest accounts, richest first"""
+        with self._lock:
+            keys = self._ranking.largest(n)
+            return [(self._accounts[number][0], self._bank.from_cents(cents)) for cents, number in keys]
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark harness
+
+Stdlib only. Every registered target is warmed up, its loop count calibrated
+so one sample takes at least ``min_time``, then ``repeat`` samples are taken
+with ``timeit``. Samples outside the Tukey fences (1.5 IQR) are rejected and
+the median and IQR of the rest are reported.
+
+Targets register a setup factory returning the zero-argument callable to time::
+
+    @benchmark('Hello.add')
+    def _hello_add():
+        return lambda: Hello.add(2, 3)
+
+Lessons run with ``null`` output (see ``output``) so printing is not timed.
+Results are written to JSON files carrying the format and package version;
+``compare`` reports the change of the medians with a Mann-Whitney U test.
+"""
+import datetime
+import json
+import math
+import platform
+import statistics
+import time
+import timeit
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List
+
+from . import __version__, output
+
+FORMAT_VERSION = 1
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a setup factory under ``name``"""
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+@dataclass
+class Result:
+    """Per-call timings of one benchmark, outliers removed"""
+    name: str
+    loops: int
+    samples: List[float] = field(repr=False)
+    rejected: int = 0
+
+    @property
+    def median(self):
+        return statistics.median(self.samples)
+
+    @property
+    def quartiles(self):
+        if len(self.samples) < 2:
+            return self.samples[0], self.samples[0]
+        q1, _, q3 = statistics.quantiles(self.samples, n=4, method='inclusive')
+        return q1, q3
+
+    @property
+    def iqr(self):
+        q1, q3 = self.quartiles
+        return q3 - q1
+
+    def to_dict(self):
+        return dict(asdict(self), median=self.median, iqr=self.iqr)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data['loops'], data['samples'], data.get('rejected', 0))
+
+
+def reject_outliers(samples):
+    """Split samples into those inside the Tukey fences and the rejected count"""
+    if len(samples) < 4:
+        return list(samples), 0
+    q1, _, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    kept = [sample for sample in samples if low <= sample <= high]
+    return kept, len(samples) - len(kept)
+
+
+def calibrate(timer, min_time):
+    """Smallest loop count (roughly) whose run takes at least ``min_time``"""
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            return loops
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.2))
+
+
+def measure(name, func, repeat=20, min_time=0.01, warmup=0.05):
+    """
+    Time ``func()``
+    :param repeat: samples to take
+    :param min_time: seconds each sample runs at least
+    :param warmup: seconds spent calling ``func`` before measuring
+    """
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        func()
+    timer = timeit.Timer(func)
+    loops = calibrate(timer, min_time)
+    samples, rejected = reject_outliers([elapsed / loops for elapsed in timer.repeat(repeat, loops)])
+    return Result(name, loops, samples, rejected)
+
+
+def run(names=(), repeat=20, min_time=0.01, warmup=0.05, progress=None):
+    """
+    Run registered benchmarks
+    :param names: benchmark names or prefixes, empty means all
+    :return: JSON-serializable result document
+    """
+    from . import benchmarks  # pylint: disable=import-outside-toplevel,unused-import
+    selected = [name for name in BENCHMARKS if not names or any(name.startswith(prefix) for prefix in names)]
+    if names and not selected:
+        raise ValueError(f"没有匹配的基准: {', '.join(names)}")
+    results = {}
+    with output.use('null'):
+        for name in selected:
+            result = measure(name, BENCHMARKS[name](), repeat, min_time, warmup)
+            results[name] = result.to_dict()
+            if progress is not None:
+                progress(result)
+    return {
+        'format_version': FORMAT_VERSION,
+        'package_version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'benchmarks': results,
+    }
+
+
+def load(path):
+    """Read a result document, checking its format version"""
+    document = json.loads(Path(path).read_text(encoding='utf-8'))
+    if document.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: 不支持的结果格式版本 {document.get('format_version')}")
+    return document
+
+
+def save(document, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def default_path(directory='benchmarks'):
+    """``bench-v<version>-<timestamp>.json`` below ``directory``"""
+    stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+    return Path(directory) / f'bench-v{__version__}-{stamp}.json'
+
+
+def mann_whitney(a, b):
+    """Two-sided p value of the Mann-Whitney U test (normal approximation)"""
+    if not a or not b:
+        return 1.0
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    rank_sum = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        rank_sum += average_rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        i = j + 1
+    n1, n2 = len(a), len(b)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sigma == 0:
+        return 1.0
+    z = (u - n1 * n2 / 2) / sigma
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def significance(p):
+    """``***`` p < 0.001, ``**`` p < 0.01, ``*`` p < 0.05, else empty"""
+    for limit, marker in ((0.001, '***'), (0.01, '**'), (0.05, '*')):
+        if p < limit:
+            return marker
+    return ''
+
+
+def compare(old, new):
+    """
+    Compare two result documents
+    :return: ``[(name, old_median, new_median, change, p)]`` for shared benchmarks
+    """
+    rows = []
+    for name, data in new['benchmarks'].items():
+        if name not in old['benchmarks']:
+            continue
+        before, after = Result.from_dict(old['benchmarks'][name]), Result.from_dict(data)
+        change = (after.median - before.median) / before.median
+        rows.append((name, before.median, after.median, change, mann_whitney(before.samples, after.samples)))
+    return rows
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
+
+
+def _print_result(result):
+    print(f"{result.name:<45}{format_time(result.median):>14}  ± {format_time(result.iqr):<12}"
+          f"loops={result.loops:<8} rejected={result.rejected}")
+
+
+def main(names=(), out_path=None, repeat=20, min_time=0.01):
+    """Entry point of ``hello-world-python bench``"""
+    print(f"{'基准':<45}{'中位数':>14}  {'IQR':<14}")
+    document = run(names, repeat, min_time, progress=_print_result)
+    print(f"结果已保存到 {save(document, out_path or default_path())}")
+    return 0
+
+
+def compare_main(old_path, new_path):
+    """Entry point of ``hello-world-python bench-compare``"""
+    old, new = load(old_path), load(new_path)
+    print(f"{old_path} (v{old['package_version']}) -> {new_path} (v{new['package_version']})")
+    for name, before, after, change, p in compare(old, new):
+        print(f"{name:<45}{format_time(before):>14}{format_time(after):>14}{change:>+9.1%} {significance(p):<3}"
+              f" p={p:.3g}")
+    print("显著性: *** p<0.001, ** p<0.01, * p<0.05 (Mann-Whitney U)")
+    return 0
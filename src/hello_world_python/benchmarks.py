@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Benchmark targets
+
+Hot paths of the package and the lessons, registered with ``bench.benchmark``.
+Each factory builds its fixtures once and returns the callable that is timed.
+"""
+import tempfile
+from pathlib import Path
+
+from . import lessons, output
+from .bench import benchmark
+from .hello import Hello
+
+
+@benchmark('Hello.add')
+def _hello_add():
+    return lambda: Hello.add(2, 3)
+
+
+@benchmark('DataProcessor.process_batch[1000]')
+def _process_batch():
+    processor = lessons.load('oop.abstraction').NumberProcessor()
+    data = list(range(1000))
+    return lambda: processor.process_batch(data)
+
+
+def _process_batch_mode(mode):
+    processor = lessons.load('oop.abstraction').NumberProcessor()
+    data = list(range(100_000))
+    return lambda: processor.process_batch(data, mode=mode, workers=4, chunk_size=8192)
+
+
+@benchmark('DataProcessor.process_batch[inline, 100k]')
+def _process_batch_inline():
+    return _process_batch_mode('inline')
+
+
+@benchmark('DataProcessor.process_batch[thread, 100k]')
+def _process_batch_thread():
+    return _process_batch_mode('thread')
+
+
+@benchmark('DataProcessor.process_batch[process, 100k]')
+def _process_batch_process():
+    return _process_batch_mode('process')
+
+
+def _process_stream_mode(mode):
+    processor = lessons.load('oop.abstraction').NumberProcessor()
+
+    def stream():
+        for _ in processor.process_stream(iter(range(100_000)), mode=mode, workers=4, chunk_size=1024):
+            pass
+    return stream
+
+
+@benchmark('DataProcessor.process_stream[inline, 100k]')
+def _process_stream_inline():
+    return _process_stream_mode('inline')
+
+
+@benchmark('DataProcessor.process_stream[thread, 100k]')
+def _process_stream_thread():
+    return _process_stream_mode('thread')
+
+
+@benchmark('BankAccount.transfer[round trip]')
+def _transfer():
+    bank = lessons.load('oop.encapsulation')
+    first, second = bank.BankAccount('张三', 1000), bank.BankAccount('李四', 1000)
+
+    def round_trip():
+        first.transfer(second, 1)
+        second.transfer(first, 1)
+    return round_trip
+
+
+@benchmark('Ledger.append')
+def _ledger_append():
+    bank = lessons.load('oop.encapsulation')
+    ledger = bank.Ledger()
+    return lambda: ledger.append(bank.DEPOSIT, 100, 'ACC100000')
+
+
+@benchmark('Ledger.sum_cents[100k rows]')
+def _ledger_sum():
+    bank = lessons.load('oop.encapsulation')
+    ledger = bank.Ledger()
+    for row in range(100_000):
+        ledger.append(row % 5, 100, timestamp=float(row))
+    return lambda: ledger.sum_cents(start=25_000.0, end=75_000.0)
+
+
+@benchmark('AccountRegistry.open')
+def _registry_open():
+    from .registry import AccountRegistry  # pylint: disable=import-outside-toplevel
+    accounts = AccountRegistry()
+    return lambda: accounts.open('张三', 100)
+
+
+@benchmark('AccountRegistry.get[100k accounts]')
+def _registry_get():
+    from .registry import AccountRegistry  # pylint: disable=import-outside-toplevel
+    accounts = AccountRegistry()
+    for i in range(100_000):
+        accounts.open(f'客户{i}')
+    number = accounts.by_holder('客户54321')[0].get_account_info()['account_number']
+    return lambda: accounts.get(number)
+
+
+def _interest_accounts(count):
+    bank = lessons.load('oop.encapsulation')
+    return [bank.EnhancedBankAccount(f'客户{i}', 1000 + i) for i in range(count)]
+
+
+@benchmark('EnhancedBankAccount.add_interest[10k accounts]')
+def _add_interest():
+    accounts = _interest_accounts(10_000)
+
+    def add_interest():
+        for account in accounts:
+            account.add_interest()
+    return add_interest
+
+
+@benchmark('interest.accrue[10k accounts]')
+def _accrue():
+    from .interest import accrue  # pylint: disable=import-outside-toplevel
+    accounts = _interest_accounts(10_000)
+    return lambda: accrue(accounts)
+
+
+def _snapshot_file(count):
+    """Temporary directory (kept alive by the caller) and a snapshot of ``count`` accounts"""
+    from . import snapshot  # pylint: disable=import-outside-toplevel
+    bank = lessons.load('oop.encapsulation')
+    directory = tempfile.TemporaryDirectory(prefix='hello-bench-')
+    path = Path(directory.name) / 'accounts.snap'
+    accounts = [bank.BankAccount(f'客户{i}', i) for i in range(count)]
+    snapshot.write(path, accounts)
+    return directory, path, accounts[count // 2].get_account_info()['account_number']
+
+
+@benchmark('Snapshot.open+get_balance[100k accounts]')
+def _snapshot_startup():
+    from .snapshot import Snapshot  # pylint: disable=import-outside-toplevel
+    directory, path, number = _snapshot_file(100_000)
+
+    def startup():
+        with Snapshot(path) as snap:
+            return snap.get_balance(number), directory
+    return startup
+
+
+@benchmark('snapshot.write[10k accounts]')
+def _snapshot_write():
+    from . import snapshot  # pylint: disable=import-outside-toplevel
+    bank = lessons.load('oop.encapsulation')
+    directory = tempfile.TemporaryDirectory(prefix='hello-bench-')
+    path = Path(directory.name) / 'accounts.snap'
+    accounts = [bank.BankAccount(f'客户{i}', i) for i in range(10_000)]
+    return lambda: (snapshot.write(path, accounts), directory)
+
+
+@benchmark('eventlog.replay[100k events]')
+def _replay():
+    from . import eventlog, transfers  # pylint: disable=import-outside-toplevel
+    bank = lessons.load('oop.encapsulation')
+    directory = tempfile.TemporaryDirectory(prefix='hello-bench-')
+    path = Path(directory.name) / 'events.log'
+    accounts = [bank.BankAccount(f'客户{i}', 1000) for i in range(1000)]
+    with output.use('null'), eventlog.EventLog(path) as log:
+        for account in accounts:
+            log.attach(account)
+        for source, target, amount in transfers.random_transfers(accounts, 99_000, seed=1):
+            source.transfer(target, amount)
+    return lambda: (eventlog.replay(path), directory)
+
+
+def _tracked_accounts(count):
+    from .aggregates import BankAggregates  # pylint: disable=import-outside-toplevel
+    bank = lessons.load('oop.encapsulation')
+    stats = BankAggregates()
+    accounts = [bank.BankAccount(f'客户{i}', i % 10_000) for i in range(count)]
+    for account in accounts:
+        stats.track(account)
+    return stats, accounts
+
+
+def _deposit_withdraw(account):
+    def round_trip():
+        account.deposit(5)
+        account.withdraw(5)
+    return round_trip
+
+
+@benchmark('BankAccount.deposit+withdraw[untracked]')
+def _untracked_round_trip():
+    return _deposit_withdraw(lessons.load('oop.encapsulation').BankAccount('张三', 5000))
+
+
+@benchmark('BankAccount.deposit+withdraw[tracked, 100k accounts]')
+def _tracked_round_trip():
+    stats, accounts = _tracked_accounts(100_000)
+    account = accounts[5000]
+    round_trip = _deposit_withdraw(account)
+    return lambda: (round_trip(), stats)
+
+
+@benchmark('BankAggregates.top(10)[100k accounts]')
+def _top():
+    stats, _ = _tracked_accounts(100_000)
+    return lambda: stats.top(10)
+
+
+def _mixed_shapes(count):
+    """``count`` shapes cycling through rectangles, squares, circles and triangles"""
+    lesson = lessons.load('oop.polymorphism')
+    kinds = (lambda i: lesson.Rectangle(i % 50 + 1, i % 7 + 1), lambda i: lesson.Square(i % 30 + 1),
+             lambda i: lesson.Circle(i % 20 + 1), lambda i: lesson.Triangle(3 + i % 5, 4 + i % 5, 5 + i % 5))
+    return [kinds[i % 4](i) for i in range(count)]
+
+
+@benchmark('shapes.total_area[objects, 100k]')
+def _object_total_area():
+    objects = _mixed_shapes(100_000)
+    return lambda: sum(shape.area() for shape in objects)
+
+
+@benchmark('shapes.total_area[ShapeCollection, 100k]')
+def _collection_total_area():
+    from .shapes import ShapeCollection  # pylint: disable=import-outside-toplevel
+    collection = ShapeCollection(_mixed_shapes(100_000))
+    return collection.total_area
+
+
+@benchmark('Shape.area+perimeter[read-heavy, 1k shapes]')
+def _read_heavy():
+    objects = _mixed_shapes(1000)
+
+    def read():
+        for shape in objects:
+            shape.area()
+            shape.perimeter()
+    return read
+
+
+@benchmark('Shape.area[write-heavy, 1k circles]')
+def _write_heavy():
+    lesson = lessons.load('oop.polymorphism')
+    circles = [lesson.Circle(i % 20 + 1) for i in range(1000)]
+
+    def write():
+        for circle in circles:
+            circle.radius += 1
+            circle.area()
+    return write
+
+
+@benchmark('streaming.AreaQuery.extend[100k shapes]')
+def _area_query():
+    from .streaming import AreaQuery  # pylint: disable=import-outside-toplevel
+    objects = _mixed_shapes(100_000)
+    return lambda: AreaQuery(k=100).extend(objects)
+
+
+@benchmark('sorted(areas)[100k shapes]')
+def _sorted_areas():
+    objects = _mixed_shapes(100_000)
+    return lambda: sorted(shape.area() for shape in objects)
+
+
+def _animals(count):
+    lesson = lessons.load('oop.polymorphism')
+    kinds = (lesson.Dog, lesson.Cat, lesson.Bird)
+    return lesson, [kinds[i % 3](f'动物{i}') for i in range(count)]
+
+
+@benchmark('animal_concert[per object, 10k animals]')
+def _concert_per_object():
+    lesson, animals = _animals(10_000)
+    return lambda: lesson.animal_concert(animals)
+
+
+@benchmark('animal_concert[grouped once, 10k animals]')
+def _concert_grouped():
+    lesson, animals = _animals(10_000)
+    groups = lesson.group_by_type(animals)
+    return lambda: lesson.animal_concert(groups, grouped=True)
+
+
+@benchmark('animal_concert[grouped per call, 10k animals]')
+def _concert_grouped_per_call():
+    lesson, animals = _animals(10_000)
+    return lambda: lesson.animal_concert(animals, grouped=True)
+
+
+@benchmark('fibonacci[memoized, practical_examples]')
+def _fibonacci():
+    return lessons.load('basics.decorators').practical_examples
+
+
+@benchmark('regex.basic_regex')
+def _basic_regex():
+    return lessons.load('data_processing.regex_examples').basic_regex
+
+
+@benchmark('regex.regex_groups')
+def _regex_groups():
+    return lessons.load('data_processing.regex_examples').regex_groups
+
+
+@benchmark('regex.regex_substitution')
+def _regex_substitution():
+    return lessons.load('data_processing.regex_examples').regex_substitution
+
+
+@benchmark('regex.regex_compilation')
+def _regex_compilation():
+    return lessons.load('data_processing.regex_examples').regex_compilation
+
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Event-sourced account log
+
+``EventLog`` subscribes to ``BankAccount`` objects (``oop.encapsulation``) and
+appends every balance change to a file of fixed-width records::
+
+    header  8s magic, I version, I record size
+    event   d timestamp, q cents, B kind, 16s account number,
+            16s counterparty number (transfers only), 7x padding
+
+Attaching an account first logs an ``OPEN`` event carrying its balance. A
+transfer is a single ``TRANSFER_OUT`` event naming both accounts, or a
+``TRANSFER_IN`` event when only the receiving account is attached. Replay
+credits the receiver of a ``TRANSFER_OUT`` only if the log opened it.
+
+``replay`` streams the file in chunks and rebuilds every balance keeping one
+dict entry per account. With a checkpoint path it resumes after the events
+recorded in the checkpoint and writes a new checkpoint every
+``checkpoint_every`` events and at the end. A torn record at the end of the
+log (a crash mid-write) is ignored by ``replay`` and cut off when the log is
+opened again for writing.
+"""
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import lessons
+
+MAGIC = b'HWPEVNT1'
+CHECKPOINT_MAGIC = b'HWPCKPT1'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+EVENT = struct.Struct('<dqB16s16s7x')
+CHECKPOINT_HEADER = struct.Struct('<8sIQQ')
+BALANCE = struct.Struct('<16sq')
+NUMBER_SIZE = 16
+OPEN = 255
+NO_ACCOUNT = bytes(NUMBER_SIZE)
+READ_EVENTS = 8192
+
+
+def _number_key(account_number):
+    encoded = account_number.encode('utf-8')
+    if len(encoded) > NUMBER_SIZE:
+        raise ValueError(f'账户号码超过 {NUMBER_SIZE} 字节: {account_number}')
+    return encoded.ljust(NUMBER_SIZE, b'\0')
+
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise ValueError(f'{path}: 不是事件日志')
+    magic, version, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or size != EVENT.size:
+        raise ValueError(f'{path}: 不是事件日志或版本不受支持')
+
+
+class EventLog:
+    """Append-only log of the balance changes of attached accounts"""
+
+    def __init__(self, path, buffer_events: int = 1024):
+        """
+        :param buffer_events: events kept in memory before writing
+        :raises ValueError: when ``path`` exists but is not an event log
+        """
+        self.path = Path(path)
+        self.buffer_events = buffer_events
+        self._file = open(self.path, 'a+b')  # pylint: disable=consider-using-with
+        size = self._file.seek(0, os.SEEK_END)
+        if size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, EVENT.size))
+        else:
+            self._file.seek(0)
+            try:
+                _check_header(self._file.read(HEADER.size), self.path)
+            except ValueError:
+                self._file.close()
+                raise
+            torn = (size - HEADER.size) % EVENT.size
+            if torn:
+                self._file.truncate(size - torn)
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._bank = lessons.load('oop.encapsulation')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def attach(self, account):
+        """Log the account's current balance and then each of its changes"""
+        self._append(OPEN, self._bank.to_cents(account.get_balance()), account, None)
+        account.subscribe(self.record)
+
+    def detach(self, account):
+        account.unsubscribe(self.record)
+
+    def record(self, account, kind, cents, target=None):
+        """Observer callback, see ``BankAccount.subscribe``"""
+        # pylint: disable=protected-access
+        if kind == self._bank.TRANSFER_IN and self.record in target._observers:
+            return  # already logged as the sender's TRANSFER_OUT
+        self._append(kind, cents, account, target)
+
+    def _append(self, kind, cents, account, target):
+        # pylint: disable=protected-access
+        party = NO_ACCOUNT if target is None else _number_key(target._account_number)
+        event = EVENT.pack(time.time(), cents, kind, _number_key(account._account_number), party)
+        with self._lock:
+            self._buffer += event
+            if len(self._buffer) >= self.buffer_events * EVENT.size:
+                self._write()
+
+    def _write(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def flush(self):
+        """Write buffered events and flush the file"""
+        with self._lock:
+            self._write()
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+@dataclass
+class ReplayResult:
+    """Balances in cents by account number after ``offset`` events"""
+    balances: dict
+    events: int
+    offset: int
+    seconds: float
+
+    @property
+    def events_per_second(self):
+        return self.events / self.seconds if self.seconds else float('inf')
+
+    def __str__(self):
+        return (f"重放 {self.events} 个事件（累计 {self.offset} 个），{len(self.balances)} 个账户，"
+                f"耗时 {self.seconds:.3f} 秒，{self.events_per_second:,.0f} 事件/秒")
+
+
+def write_checkpoint(path, balances, offset):
+    """
+    Store raw balances (number key -> cents) and the events they include
+    """
+    path = Path(path)
+    partial = path.with_name(path.name + '.tmp')
+    with open(partial, 'wb') as file:
+        file.write(CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, VERSION, offset, len(balances)))
+        file.write(b''.join(BALANCE.pack(number, cents) for number, cents in balances.items()))
+    partial.replace(path)
+
+
+def read_checkpoint(path):
+    """
+    :return: ``(balances, offset)`` with raw number keys
+    :raises ValueError: when ``path`` is not a checkpoint
+    """
+    data = Path(path).read_bytes()
+    if len(data) < CHECKPOINT_HEADER.size:
+        raise ValueError(f'{path}: 不是检查点')
+    magic, version, offset, count = CHECKPOINT_HEADER.unpack_from(data)
+    if magic != CHECKPOINT_MAGIC or version != VERSION \
+            or len(data) != CHECKPOINT_HEADER.size + count * BALANCE.size:
+        raise ValueError(f'{path}: 不是检查点或版本不受支持')
+    return dict(BALANCE.iter_unpack(memoryview(data)[CHECKPOINT_HEADER.size:])), offset
+
+
+def replay(path, checkpoint=None, checkpoint_every=None):
+    """
+    Rebuild all balances from an event log
+    :param checkpoint: checkpoint file to resume from (if present) and update
+    :param checkpoint_every: also checkpoint after roughly this many events
+    :return: ``ReplayResult`` with balances keyed by account number
+    """
+    bank = lessons.load('oop.encapsulation')
+    credits = {bank.DEPOSIT, bank.TRANSFER_IN, bank.INTEREST}
+    withdrawal, transfer_out = bank.WITHDRAWAL, bank.TRANSFER_OUT
+    balances, offset = {}, 0
+    if checkpoint is not None and Path(checkpoint).exists():
+        balances, offset = read_checkpoint(checkpoint)
+    start = time.perf_counter()
+    events = 0
+    last_checkpoint = offset
+    get = balances.get
+    with open(path, 'rb') as file:
+        _check_header(file.read(HEADER.size), path)
+        file.seek(HEADER.size + offset * EVENT.size)
+        while True:
+            chunk = file.read(EVENT.size * READ_EVENTS)
+            usable = len(chunk) - len(chunk) % EVENT.size
+            for _, cents, kind, account, party in EVENT.iter_unpack(memoryview(chunk)[:usable]):
+                if kind in credits:
+                    balances[account] = get(account, 0) + cents
+                elif kind == withdrawal:
+                    balances[account] = get(account, 0) - cents
+                elif kind == transfer_out:
+                    balances[account] = get(account, 0) - cents
+                    if party in balances:  # only accounts opened in this log
+                        balances[party] += cents
+                elif kind == OPEN:
+                    balances[account] = cents
+            events += usable // EVENT.size
+            if checkpoint is not None and checkpoint_every and offset + events - last_checkpoint >= checkpoint_every:
+                last_checkpoint = offset + events
+                write_checkpoint(checkpoint, balances, last_checkpoint)
+            if usable < EVENT.size * READ_EVENTS:
+                break
+    if checkpoint is not None and offset + events != last_checkpoint:
+        write_checkpoint(checkpoint, balances, offset + events)
+    decoded = {number.rstrip(b'\0').decode('utf-8'): cents for number, cents in balances.items()}
+    return ReplayResult(decoded, events, offset + events, time.perf_counter() - start)
+
+
+def main(path, checkpoint=None, checkpoint_every=None):
+    """Entry point of ``hello-world-python replay``"""
+    print(replay(path, checkpoint, checkpoint_every))
+    return 0
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Instance footprint benchmark
+
+The domain classes (``Hello``, ``Car``, ``Smartphone``, the animals and the
+shapes) declare ``__slots__``, so their instances carry no ``__dict__``. This
+module measures what that buys: for every class it builds ``count`` instances
+and reports
+
+* ``bytes``: traced allocation per instance (tracemalloc), list slot excluded
+* ``per_second``: construction throughput without tracing
+
+next to the same numbers for a ``__dict__`` twin, an empty subclass without
+``__slots__`` that shares every method.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from . import lessons
+
+DEFAULT_COUNT = 1_000_000
+
+
+def _hello():
+    from .hello import Hello  # pylint: disable=import-outside-toplevel
+    return Hello
+
+
+def _lesson_class(lesson, name):
+    return lambda: getattr(lessons.load(lesson), name)
+
+
+# name -> (class factory, constructor arguments)
+TARGETS = {
+    'Hello': (_hello, ('world',)),
+    'Car': (_lesson_class('oop.class_definition', 'Car'), ('丰田', '卡罗拉', '白色')),
+    'Smartphone': (_lesson_class('oop.object_instance', 'Smartphone'), ('苹果', 'iPhone 15', 'iOS')),
+    'inheritance.Animal': (_lesson_class('oop.inheritance', 'Animal'), ('小白', '兔科')),
+    'inheritance.Dog': (_lesson_class('oop.inheritance', 'Dog'), ('旺财', '金毛')),
+    'inheritance.Cat': (_lesson_class('oop.inheritance', 'Cat'), ('咪咪', '橘色')),
+    'inheritance.Bird': (_lesson_class('oop.inheritance', 'Bird'), ('小鸟', 30)),
+    'polymorphism.Animal': (_lesson_class('oop.polymorphism', 'Animal'), ('小白',)),
+    'polymorphism.Dog': (_lesson_class('oop.polymorphism', 'Dog'), ('旺财',)),
+    'polymorphism.Cat': (_lesson_class('oop.polymorphism', 'Cat'), ('咪咪',)),
+    'polymorphism.Bird': (_lesson_class('oop.polymorphism', 'Bird'), ('小鸟',)),
+    'Rectangle': (_lesson_class('oop.polymorphism', 'Rectangle'), (5, 3)),
+    'Circle': (_lesson_class('oop.polymorphism', 'Circle'), (4,)),
+    'Triangle': (_lesson_class('oop.polymorphism', 'Triangle'), (3, 4, 5)),
+    'Square': (_lesson_class('oop.polymorphism', 'Square'), (6,)),
+}
+
+
+@dataclass
+class Footprint:
+    """Per-instance memory and construction rate of one class"""
+    name: str
+    bytes: float
+    per_second: float
+    dict_bytes: float
+    dict_per_second: float
+
+    @property
+    def saving(self):
+        return 1 - self.bytes / self.dict_bytes if self.dict_bytes else 0.0
+
+
+def dict_variant(cls):
+    """Subclass of ``cls`` whose instances get a ``__dict__`` (and weakref slot)"""
+    return type(cls.__name__, (cls,), {'__module__': cls.__module__, '__qualname__': cls.__qualname__})
+
+
+def construction_rate(cls, args, count):
+    """Instances of ``cls(*args)`` built per second"""
+    gc.collect()
+    start = time.perf_counter()
+    instances = [cls(*args) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    del instances
+    return count / elapsed if elapsed else float('inf')
+
+
+def bytes_per_instance(cls, args, count):
+    """Traced bytes allocated per ``cls(*args)``, excluding the holding list"""
+    gc.collect()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        instances = [cls(*args) for _ in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def measure(name, count=DEFAULT_COUNT):
+    """Footprint of one of ``TARGETS``, slotted and with ``__dict__``"""
+    factory, args = TARGETS[name]
+    cls = factory()
+    twin = dict_variant(cls)
+    return Footprint(name, bytes_per_instance(cls, args, count), construction_rate(cls, args, count),
+                     bytes_per_instance(twin, args, count), construction_rate(twin, args, count))
+
+
+def main(names=(), count=DEFAULT_COUNT):
+    """Entry point of ``hello-world-python footprint``"""
+    unknown = [name for name in names if name not in TARGETS]
+    if unknown:
+        print(f"未知的类: {', '.join(unknown)}，可选: {', '.join(TARGETS)}")
+        return 2
+    print(f"每个类构造 {count} 个实例")
+    print(f"{'类':<22}{'字节/实例':>12}{'__dict__':>12}{'节省':>8}{'构造/秒':>14}{'__dict__':>14}")
+    for name in names or TARGETS:
+        result = measure(name, count)
+        print(f"{result.name:<22}{result.bytes:>12.1f}{result.dict_bytes:>12.1f}{result.saving:>8.0%}"
+              f"{result.per_second:>14,.0f}{result.dict_per_second:>14,.0f}")
+    return 0
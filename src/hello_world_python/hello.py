@@ -1,23 +1,204 @@
 # -*- coding: utf-8 -*-
 """Test hello"""
+import functools
+import io
+import itertools
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from operator import add
+
+INT64_MASK = (1 << 64) - 1
+OVERFLOW_MODES = ('raise', 'wrap')
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """Optional accelerator, imported on first bulk call"""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+def _int64_array(values):
+    """Copy ints from a sequence or buffer into ``array('q')``"""
+    if isinstance(values, array) and values.typecode == 'q':
+        return values
+    try:
+        values = memoryview(values).tolist()
+    except TypeError:
+        pass
+    return array('q', values)
+
+
+def _add_many_python(a, b, overflow):
+    sums = map(add, _int64_array(a), _int64_array(b))
+    if overflow == 'raise':
+        return array('q', sums)
+    result = array('q')
+    result.frombytes(array('Q', [s & INT64_MASK for s in sums]).tobytes())
+    return result
+
+
+def _add_many_numpy(np, a, b, overflow):
+    """Return the sums, or None when the inputs are not int64 compatible"""
+    x, y = np.asarray(a), np.asarray(b)
+    if x.ndim != 1 or y.ndim != 1 or not (np.can_cast(x.dtype, np.int64) and np.can_cast(y.dtype, np.int64)):
+        return None
+    x, y = x.astype(np.int64, copy=False), y.astype(np.int64, copy=False)
+    sums = x + y
+    if overflow == 'raise' and (((x ^ sums) & (y ^ sums)) < 0).any():
+        raise OverflowError('int64 overflow in add_many')
+    result = array('q')
+    result.frombytes(sums.tobytes())
+    return result
+
+
+@dataclass
+class RenderStats:
+    """Throughput of one bulk render"""
+    lines: int
+    size: int  # bytes for binary sinks, characters for text sinks
+    flushes: int
+    seconds: float
+
+    @property
+    def lines_per_second(self):
+        return self.lines / self.seconds if self.seconds else float('inf')
+
+    def __str__(self):
+        return (f'{self.lines} lines, {self.size} units, {self.flushes} flushes '
+                f'in {self.seconds:.3f}s ({self.lines_per_second:,.0f} lines/s)')
+
+
+class GreetingRenderer:
+    """
+    Render ``'hello, %s'`` lines for many names into one sink
+    Lines are collected in a reusable buffer and written once the buffer
+    reaches ``flush_threshold``, so a sink sees one write per flush instead
+    of one per greeting.
+    """
+
+    def __init__(self, sink, flush_threshold: int = 1 << 16, batch_size: int = 1024,
+                 encoding: str = 'utf-8'):
+        """
+        :param sink: text or binary file-like object with ``write``
+        :param flush_threshold: buffered size that triggers a write
+        :param batch_size: names formatted per join
+        :param encoding: used for binary sinks
+        """
+        if flush_threshold <= 0 or batch_size <= 0:
+            raise ValueError('flush_threshold and batch_size must be positive')
+        self.sink = sink
+        self.flush_threshold = flush_threshold
+        self.batch_size = batch_size
+        self.encoding = encoding
+        self.binary = not (isinstance(sink, io.TextIOBase) or hasattr(sink, 'encoding'))
+        # binary sinks reuse one preallocated bytearray, text sinks a list of chunks
+        self._buffer = bytearray(flush_threshold) if self.binary else []
+        self._buffered = 0
+        self._flushes = 0
+
+    def _flush(self):
+        if not self._buffered:
+            return
+        if self.binary:
+            with memoryview(self._buffer) as view, view[:self._buffered] as data:
+                self.sink.write(data)
+        else:
+            self.sink.write(''.join(self._buffer))
+            self._buffer.clear()
+        self._buffered = 0
+        self._flushes += 1
+
+    def render(self, names) -> RenderStats:
+        """
+        Write one greeting per name, each name formatted with ``str``
+        :return: lines, size, flushes and elapsed time of this call
+        """
+        start = time.perf_counter()
+        lines = size = 0
+        self._flushes = 0
+        names = iter(names)
+        while True:
+            batch = list(itertools.islice(names, self.batch_size))
+            if not batch:
+                break
+            chunk = 'hello, ' + '\nhello, '.join(map(str, batch)) + '\n'
+            if self.binary:
+                chunk = chunk.encode(self.encoding)
+                self._buffer[self._buffered:self._buffered + len(chunk)] = chunk
+            else:
+                self._buffer.append(chunk)
+            lines += len(batch)
+            size += len(chunk)
+            self._buffered += len(chunk)
+            if self._buffered >= self.flush_threshold:
+                self._flush()
+        self._flush()
+        if hasattr(self.sink, 'flush'):
+            self.sink.flush()
+        return RenderStats(lines, size, self._flushes, time.perf_counter() - start)
 
 
 class Hello:
     """hello"""
 
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
+    def greeting(self) -> str:
+        """
+        greeting text without printing it
+        """
+        return 'hello, %s' % self.name
+
     def say_hello(self):
         """
         say hello
         """
-        print('hello, %s' % self.name)
+        print(self.greeting())
+
+    @classmethod
+    def say_hello_many(cls, names, sink=None, **options) -> RenderStats:
+        """
+        say hello to many names through a buffered ``GreetingRenderer``
+        :param names: iterable of names
+        :param sink: text or binary file-like object, defaults to ``sys.stdout``
+        :param options: ``flush_threshold``, ``batch_size`` and ``encoding``
+        """
+        return GreetingRenderer(sys.stdout if sink is None else sink, **options).render(names)
 
     @classmethod
     def add(cls, a: int, b: int) -> int:
         return a + b
 
+    @classmethod
+    def add_many(cls, a, b, overflow: str = 'raise') -> array:
+        """
+        add pairs of int64 values in one call
+        :param a: sequence, ``array.array`` or any buffer of ints
+        :param b: same length as ``a``
+        :param overflow: ``'raise'`` raises OverflowError when a sum leaves the
+            int64 range, ``'wrap'`` wraps around like C int64 arithmetic
+        :return: ``array('q')`` of sums; numpy is used when installed
+        """
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f'overflow must be one of {OVERFLOW_MODES}, got {overflow!r}')
+        if len(a) != len(b):
+            raise ValueError(f'length mismatch: {len(a)} != {len(b)}')
+        np = _numpy()
+        if np is not None:
+            result = _add_many_numpy(np, a, b, overflow)
+            if result is not None:
+                return result
+        return _add_many_python(a, b, overflow)
+
 
 def main():
     """Main function"""
@@ -25,4 +206,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Lesson registry
+
+The lesson packages (``src/01_basics`` ... ``src/06_testing_debugging``) start
+with digits and can not be imported directly. This module exposes every lesson
+under a valid import name by dropping the numeric prefixes, e.g.
+``05_concurrency/01_threading_examples.py`` becomes
+``hello_world_python.lessons.concurrency.threading_examples``::
+
+    from hello_world_python.lessons import concurrency
+    concurrency.threading_examples.basic_threading()
+
+Lesson modules are loaded lazily: importing them only builds a (cached) module
+spec, the source is executed on first attribute access. Their ``print`` calls
+go through ``hello_world_python.output``; the rewritten code is cached next to
+the regular bytecode under its own optimization tag.
+"""
+import functools
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import re
+import struct
+import sys
+from pathlib import Path
+
+LESSON_ROOT = Path(__file__).resolve().parent.parent
+
+_NUMBERED = re.compile(r'^\d+_(?P<name>\w+)$')
+
+# bump when the compile-time rewrite of lessons changes
+CODE_CACHE_TAG = 'lesson1'
+
+# Make this module a package so ``import <prefix>.lessons.<topic>`` works;
+# submodules are served by ``LessonFinder`` instead of the file system.
+__path__ = []
+
+_specs = {}
+
+
+def _valid_name(stem):
+    """Strip the numeric prefix of a lesson file or directory name"""
+    match = _NUMBERED.match(stem)
+    if match is None or not match.group('name').isidentifier():
+        return None
+    return match.group('name')
+
+
+@functools.lru_cache(maxsize=None)
+def lesson_index():
+    """
+    Map every lesson name (``topic`` or ``topic.lesson``) to its source file
+    """
+    index = {}
+    with os.scandir(LESSON_ROOT) as topics:
+        for topic in sorted(topics, key=lambda entry: entry.name):
+            topic_name = _valid_name(topic.name)
+            init = os.path.join(topic.path, '__init__.py')
+            if topic_name is None or not topic.is_dir() or not os.path.isfile(init):
+                continue
+            index[topic_name] = Path(init)
+            with os.scandir(topic.path) as lessons:
+                for lesson in sorted(lessons, key=lambda entry: entry.name):
+                    stem, ext = os.path.splitext(lesson.name)
+                    lesson_name = _valid_name(stem)
+                    if lesson_name is not None and ext == '.py':
+                        index[f'{topic_name}.{lesson_name}'] = Path(lesson.path)
+    return index
+
+
+def iter_lessons():
+    """Yield the names of all lesson modules (not topics) in learning order"""
+    return (name for name in lesson_index() if '.' in name)
+
+
+def lesson_spec(name):
+    """
+    Return the cached module spec of a topic or lesson, ``None`` if unknown
+    :param name: relative name such as ``concurrency.threading_examples``
+    """
+    spec = _specs.get(name)
+    # LazyLoader swaps in the real loader once a module executes; that spec
+    # now belongs to the loaded module, later imports need a fresh lazy one
+    if spec is None or ('.' in name and not isinstance(spec.loader, importlib.util.LazyLoader)):
+        path = lesson_index().get(name)
+        if path is None:
+            return None
+        fullname = f'{__name__}.{name}'
+        if '.' in name:
+            loader = _LessonLoader(fullname, str(path))
+            spec = importlib.util.spec_from_file_location(fullname, path, loader=loader)
+            spec.loader = importlib.util.LazyLoader(loader)
+        else:
+            loader = _TopicLoader(fullname, str(path))
+            spec = importlib.util.spec_from_file_location(
+                fullname, path, loader=loader, submodule_search_locations=[])
+        _specs[name] = spec
+    return spec
+
+
+def load(name):
+    """
+    Import a lesson module by its relative name
+    :param name: relative name such as ``concurrency.threading_examples``
+    """
+    return importlib.import_module(f'{__name__}.{name}')
+
+
+def _import_child(parent, name):
+    """Resolve ``parent.name`` as a submodule, for module ``__getattr__``"""
+    if name.startswith('__'):
+        raise AttributeError(f"module {parent!r} has no attribute {name!r}")
+    fullname = f'{parent}.{name}'
+    try:
+        return importlib.import_module(fullname)
+    except ModuleNotFoundError as exc:
+        if exc.name != fullname:
+            raise
+        raise AttributeError(f"module {parent!r} has no attribute {name!r}") from None
+
+
+def __getattr__(name):
+    return _import_child(__name__, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | {name for name in lesson_index() if '.' not in name})
+
+
+class _LessonLoader(importlib.machinery.SourceFileLoader):
+    """Compile lessons with guarded ``print`` statements bound to the output router"""
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        from . import output  # pylint: disable=import-outside-toplevel
+        import ast  # pylint: disable=import-outside-toplevel
+        tree = output.guard_prints(ast.parse(data, path))
+        return compile(tree, path, 'exec', dont_inherit=True, optimize=_optimize)
+
+    def get_code(self, fullname):
+        source_path = self.get_filename(fullname)
+        cache_path = importlib.util.cache_from_source(source_path, optimization=CODE_CACHE_TAG)
+        stat = os.stat(source_path)
+        header = importlib.util.MAGIC_NUMBER + struct.pack('<qq', stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(cache_path, 'rb') as file:
+                data = file.read()
+            if data.startswith(header):
+                return marshal.loads(memoryview(data)[len(header):])
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+        code = self.source_to_code(self.get_data(source_path), source_path)
+        if not sys.dont_write_bytecode:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                partial = f'{cache_path}.{os.getpid()}.tmp'
+                with open(partial, 'wb') as file:
+                    file.write(header + marshal.dumps(code))
+                os.replace(partial, cache_path)
+            except OSError:
+                pass
+        return code
+
+    def exec_module(self, module):
+        from . import output  # pylint: disable=import-outside-toplevel
+        output.bind(module.__dict__)
+        super().exec_module(module)
+
+
+class _TopicLoader(importlib.machinery.SourceFileLoader):
+    """Load a topic package whose lessons resolve on attribute access"""
+
+    def exec_module(self, module):
+        super().exec_module(module)
+        module.__getattr__ = functools.partial(_import_child, module.__name__)
+
+
+class LessonFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder serving lesson modules below a package prefix"""
+
+    def __init__(self, prefix):
+        self.prefix = prefix + '.'
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(self.prefix):
+            return None
+        return lesson_spec(fullname[len(self.prefix):])
+
+
+if not any(isinstance(finder, LessonFinder) and finder.prefix == __name__ + '.'
+           for finder in sys.meta_path):
+    sys.meta_path.append(LessonFinder(__name__))
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Load generator for the greeting service
+
+Opens ``concurrency`` keep-alive connections, each sending ``pipeline``
+requests per round trip, and reports requests per second with p50/p99
+latency. Without a port a service is started in a child process, so the
+numbers describe what one server core can do on localhost.
+"""
+import asyncio
+import itertools
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from . import service
+
+DEFAULT_PATHS = ('/hello?name=world', '/add?a=2&b=3')
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of already sorted values, ``q`` in [0, 100]"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one load level"""
+    concurrency: int
+    pipeline: int
+    requests: int
+    errors: int
+    seconds: float
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def rps(self):
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    @property
+    def p50(self):
+        return percentile(self.latencies, 50)
+
+    @property
+    def p99(self):
+        return percentile(self.latencies, 99)
+
+    def __str__(self):
+        return (f'concurrency={self.concurrency:<4} pipeline={self.pipeline:<3} '
+                f'requests={self.requests:<7} errors={self.errors:<4} '
+                f'rps={self.rps:>10,.0f}  p50={self.p50 * 1000:.3f}ms  p99={self.p99 * 1000:.3f}ms')
+
+
+async def _read_response(reader):
+    """Read one response and return its status code"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    length = 0
+    for line in head.split(b'\r\n'):
+        if line[:15].lower() == b'content-length:':
+            length = int(line[15:])
+    if length:
+        await reader.readexactly(length)
+    return int(head[9:12])
+
+
+async def _client(host, port, requests, count, pipeline, latencies):
+    """Send ``count`` requests over one connection, return the error count"""
+    reader, writer = await asyncio.open_connection(host, port)
+    errors = 0
+    try:
+        while count > 0:
+            batch = min(pipeline, count)
+            start = time.perf_counter()
+            writer.write(b''.join(itertools.islice(requests, batch)))
+            await writer.drain()
+            for _ in range(batch):
+                if await _read_response(reader) != 200:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+            count -= batch
+    finally:
+        writer.close()
+    return errors
+
+
+async def measure(host, port, concurrency=1, requests=10000, pipeline=1, paths=DEFAULT_PATHS):
+    """
+    Run one load level against a running service
+    :param requests: total requests, spread evenly over the connections
+    :param pipeline: requests written before reading their responses
+    """
+    templates = [f'GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n'.encode('latin-1') for path in paths]
+    shares = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    latencies = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _client(host, port, itertools.cycle(templates), share, pipeline, latencies)
+        for share in shares))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    return LoadResult(concurrency, pipeline, requests, sum(errors), seconds, latencies)
+
+
+def _spawn_service(host):
+    """Start the service in a child process and wait for its port"""
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=service.serve, args=(host, 0, ready), daemon=True)
+    process.start()
+    return process, ready.get(timeout=10)
+
+
+def main(host=service.DEFAULT_HOST, port=None, concurrency_levels=(1, 8, 64), requests=20000, pipeline=1,
+         paths=DEFAULT_PATHS):
+    """Entry point of ``hello-world-python loadgen``"""
+    process = None
+    if port is None:
+        process, port = _spawn_service(host)
+    try:
+        print(f"压测 http://{host}:{port} 路径: {', '.join(paths)}")
+        for concurrency in concurrency_levels:
+            print(asyncio.run(measure(host, port, concurrency, requests, pipeline, paths)))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+    return 0
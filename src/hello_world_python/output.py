@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Pluggable demo output
+
+Lessons report through plain ``print`` calls. When a lesson is loaded through
+``hello_world_python.lessons`` its global ``print`` is bound to ``router`` and
+every ``print(...)`` statement is compiled as::
+
+    if __output__.enabled:
+        print(...)
+
+so the active sink decides what happens to the output:
+
+* ``terminal``: the current behavior, every call is printed immediately
+* ``buffered``: calls are collected in memory and written in one go
+* ``null``: nothing is printed and the arguments (f-strings included) are
+  not even evaluated
+
+Running a lesson file as a script is unaffected.
+"""
+import ast
+import builtins
+import contextlib
+import sys
+
+MODES = ('terminal', 'buffered', 'null')
+OUTPUT_NAME = '__output__'
+
+
+class TerminalOutput:
+    """Print every call immediately"""
+    mode = 'terminal'
+    enabled = True
+
+    def print(self, *args, **kwargs):
+        builtins.print(*args, **kwargs)
+
+    def flush(self):
+        pass
+
+
+class BufferedOutput:
+    """Collect output in memory and write it once"""
+    mode = 'buffered'
+    enabled = True
+
+    def __init__(self, limit: int = 1 << 20):
+        """
+        :param limit: buffered characters that force an early flush
+        """
+        self.limit = limit
+        self._parts = []
+        self._size = 0
+
+    def print(self, *args, sep=' ', end='\n', file=None, flush=False):
+        if file is not None and file is not sys.stdout:
+            builtins.print(*args, sep=sep, end=end, file=file, flush=flush)
+            return
+        text = (' ' if sep is None else sep).join(map(str, args)) + ('\n' if end is None else end)
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            parts, self._parts, self._size = self._parts, [], 0
+            sys.stdout.write(''.join(parts))
+
+
+class NullOutput:
+    """Drop everything; guarded ``print`` statements skip their arguments"""
+    mode = 'null'
+    enabled = False
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+
+_SINKS = {sink.mode: sink for sink in (TerminalOutput, BufferedOutput, NullOutput)}
+
+
+def make(mode):
+    """Create the sink for one of ``MODES``"""
+    try:
+        return _SINKS[mode]()
+    except KeyError:
+        raise ValueError(f'output mode must be one of {MODES}, got {mode!r}') from None
+
+
+class OutputRouter:
+    """The ``print`` and ``__output__`` seen by lessons, forwarding to the active sink"""
+
+    def __init__(self):
+        self.sink = TerminalOutput()
+        self.enabled = True
+
+    def print(self, *args, **kwargs):
+        self.sink.print(*args, **kwargs)
+
+    def install(self, sink):
+        """Make ``sink`` active and return the previous one"""
+        previous, self.sink, self.enabled = self.sink, sink, sink.enabled
+        return previous
+
+
+router = OutputRouter()
+
+
+@contextlib.contextmanager
+def use(mode):
+    """Route lesson output to a new sink of ``mode`` and flush it on exit"""
+    sink = make(mode)
+    previous = router.install(sink)
+    try:
+        yield sink
+    finally:
+        sink.flush()
+        router.install(previous)
+
+
+class _GuardPrints(ast.NodeTransformer):
+    """Wrap ``print(...)`` statements in ``if __output__.enabled:``"""
+
+    def visit_Expr(self, node):  # pylint: disable=invalid-name
+        call = node.value
+        if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == 'print':
+            test = ast.Attribute(ast.Name(OUTPUT_NAME, ast.Load()), 'enabled', ast.Load())
+            return ast.copy_location(ast.If(test, [node], []), node)
+        return node
+
+
+def guard_prints(tree):
+    """Apply the ``print`` guard to a parsed module"""
+    return ast.fix_missing_locations(_GuardPrints().visit(tree))
+
+
+def bind(namespace):
+    """Point a lesson namespace's ``print`` and ``__output__`` at ``router``"""
+    namespace['print'] = router.print
+    namespace[OUTPUT_NAME] = router
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Per-demo profiling
+
+Wraps one call with cProfile and tracemalloc and writes three files named after
+the demo:
+
+* ``<name>.prof``: raw cProfile stats, for ``pstats`` or snakeviz
+* ``<name>.hotspots.txt``: the top-N functions sorted by own time
+* ``<name>.tracemalloc.txt``: allocation diff of the call, by source line
+
+Only imported when profiling is requested, so the runner pays nothing otherwise.
+cProfile sees the calling thread only; tracemalloc traces every thread.
+"""
+import cProfile
+import io
+import pstats
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_TOP = 20
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+@dataclass
+class ProfileReport:
+    """Files written for one profiled call"""
+    stats_path: Path
+    hotspots_path: Path
+    allocations_path: Path
+    peak_bytes: int
+
+    def __str__(self):
+        return (f"性能分析: {self.stats_path.name}, {self.hotspots_path.name}, {self.allocations_path.name} "
+                f"(峰值内存 {self.peak_bytes / 1024:.1f} KiB) 位于 {self.stats_path.parent}")
+
+
+def hotspot_table(profile, top=DEFAULT_TOP, sort='tottime'):
+    """Format the ``top`` entries of a profile sorted by ``sort``"""
+    stream = io.StringIO()
+    pstats.Stats(profile, stream=stream).sort_stats(sort).print_stats(top)
+    return stream.getvalue()
+
+
+def allocation_diff(before, after, top=DEFAULT_TOP):
+    """Format the ``top`` source lines whose allocations changed the most"""
+    stats = after.filter_traces(_IGNORED).compare_to(before.filter_traces(_IGNORED), 'lineno')
+    return ''.join(f'{stat}\n' for stat in stats[:top])
+
+
+def profile_call(func, out_dir, name, top=DEFAULT_TOP):
+    """
+    Call ``func()`` under cProfile and tracemalloc and write the reports
+    :param out_dir: directory for the report files, created if missing
+    :param name: file name stem, e.g. ``basics.file_operations.csv_operations``
+    :return: ``ProfileReport``; exceptions of ``func`` propagate after writing
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    profile = cProfile.Profile()
+    try:
+        profile.runcall(func)
+    finally:
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+        report = ProfileReport(out_dir / f'{name}.prof', out_dir / f'{name}.hotspots.txt',
+                               out_dir / f'{name}.tracemalloc.txt', peak)
+        profile.dump_stats(report.stats_path)
+        report.hotspots_path.write_text(hotspot_table(profile, top), encoding='utf-8')
+        report.allocations_path.write_text(allocation_diff(before, after, top), encoding='utf-8')
+    return report
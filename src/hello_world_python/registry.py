@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Account registry
+
+Indexes ``BankAccount`` objects (``oop.encapsulation``) by account number and
+by holder. Accounts opened through the registry get their numbers from blocks
+of ``BLOCK`` consecutive numbers reserved from the shared allocator and aligned
+to ``BLOCK``, so a number is found with one dict lookup on its block and an
+index into that block's list; accounts created elsewhere can be added and are
+indexed by number in a plain dict. A block number already taken by an added
+account (e.g. one restored from a snapshot) is skipped when issuing.
+
+Per account the registry keeps two list slots (all accounts, and the block or
+added ones) and one ``array`` entry chaining the holder's accounts, plus one
+dict entry per distinct holder.
+"""
+import threading
+from array import array
+
+from . import lessons
+
+BLOCK = 1 << 16
+
+
+class AccountRegistry:
+    """Open, add and look up accounts in O(1)"""
+
+    def __init__(self, block: int = BLOCK):
+        """
+        :param block: account numbers reserved at a time
+        """
+        if block < 1:
+            raise ValueError('block must be positive')
+        self._bank = lessons.load('oop.encapsulation')
+        self.block = block
+        self._accounts = []
+        self._previous = array('q')  # previous row of the same holder, -1 if first
+        self._last_row = {}          # holder -> newest row
+        self._blocks = {}            # number // block -> accounts numbered in that block
+        self._current = None         # accounts of the block numbers are issued from
+        self._start = 0              # first number of the current block
+        self._foreign = {}           # account number -> account, for added accounts
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __contains__(self, account_number):
+        return self.get(account_number) is not None
+
+    def __iter__(self):
+        return iter(self._accounts)
+
+    def _append(self, account, holder):
+        self._previous.append(self._last_row.get(holder, -1))
+        self._last_row[holder] = len(self._accounts)
+        self._accounts.append(account)
+
+    def _issue(self):
+        """
+        Next free account number of the current block, reserving a block when
+        it is full; numbers of added accounts are skipped
+        """
+        while True:
+            if self._current is None or len(self._current) == self.block:
+                self._start = self._bank.BankAccount._reserve_numbers(self.block, align=self.block)
+                self._current = self._blocks[self._start // self.block] = []
+            number = self._bank.format_account_number(self._start + len(self._current))
+            if number not in self._foreign:
+                return number
+            self._current.append(None)  # slot of an added account, found in _foreign
+
+    def open(self, holder, initial_balance=0, account_class=None):
+        """
+        Create and register an account with a fresh number
+        :param account_class: ``BankAccount`` (default) or a subclass
+        """
+        account_class = account_class or self._bank.BankAccount
+        with self._lock:
+            number = self._issue()
+            account = account_class(holder, initial_balance, account_number=number)
+            self._current.append(account)
+            self._append(account, holder)
+        return account
+
+    def add(self, account):
+        """
+        Register an existing account
+        :raises ValueError: when its number is already registered
+        """
+        info = account.get_account_info()
+        number = info['account_number']
+        with self._lock:
+            if self.get(number) is not None:
+                raise ValueError(f'账户号码重复: {number}')
+            self._foreign[number] = account
+            self._append(account, info['account_holder'])
+        return account
+
+    def get(self, account_number):
+        """The account with ``account_number``, ``None`` if not registered"""
+        number = self._bank.parse_account_number(account_number)
+        if number is not None:
+            accounts = self._blocks.get(number // self.block)
+            offset = number % self.block
+            if accounts is not None and offset < len(accounts) and accounts[offset] is not None:
+                return accounts[offset]
+        return self._foreign.get(account_number)
+
+    def by_holder(self, holder):
+        """Accounts of ``holder`` in registration order"""
+        rows = []
+        row = self._last_row.get(holder, -1)
+        while row >= 0:
+            rows.append(row)
+            row = self._previous[row]
+        return [self._accounts[row] for row in reversed(rows)]
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Parallel demo runner
+
+Finds the demo functions every lesson calls from its ``__main__`` block and
+runs them at the same time in a process pool. Each demo runs in its own scratch
+directory with stdout/stderr captured separately; results are printed in lesson
+order, so the wall time approaches the slowest demo instead of the sum of all.
+"""
+import ast
+import contextlib
+import functools
+import io
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from . import lessons, output
+
+MAX_JOBS = 64
+
+
+@dataclass
+class DemoResult:
+    """Captured outcome of one demo function"""
+    lesson: str
+    demo: str
+    output: str
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def name(self):
+        return f'{self.lesson}.{self.demo}'
+
+
+def _is_main_guard(node):
+    """Check for ``if __name__ == "__main__":``"""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    test = node.test
+    return (isinstance(test.left, ast.Name) and test.left.id == '__name__'
+            and len(test.comparators) == 1
+            and isinstance(test.comparators[0], ast.Constant)
+            and test.comparators[0].value == '__main__')
+
+
+@functools.lru_cache(maxsize=None)
+def demo_names(lesson):
+    """
+    Return the demo functions of a lesson in call order
+    A demo is a module level function called without arguments from the
+    ``__main__`` block; the source is parsed, not imported.
+    """
+    path = lessons.lesson_index()[lesson]
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    defined = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    demos = []
+    for node in filter(_is_main_guard, tree.body):
+        for stmt in node.body:
+            for call in ast.walk(stmt):
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                        and call.func.id in defined and not call.args and not call.keywords
+                        and call.func.id not in demos):
+                    demos.append(call.func.id)
+    return tuple(demos)
+
+
+def resolve(selection=()):
+    """
+    Expand topic, lesson or demo names into ``(lesson, demo)`` tasks
+    :param selection: e.g. ``concurrency``, ``oop.polymorphism`` or
+        ``concurrency.threading_examples.thread_safe_counter``; empty means all
+    """
+    index = lessons.lesson_index()
+    tasks = []
+    for name in selection or list(lessons.iter_lessons()):
+        if name in index and '.' in name:
+            tasks.extend((name, demo) for demo in demo_names(name))
+        elif name in index:
+            for lesson in lessons.iter_lessons():
+                if lesson.startswith(name + '.'):
+                    tasks.extend((lesson, demo) for demo in demo_names(lesson))
+        else:
+            lesson, _, demo = name.rpartition('.')
+            if '.' not in lesson or lesson not in index or demo not in demo_names(lesson):
+                raise ValueError(f"未知的课程或演示: {name}")
+            tasks.append((lesson, demo))
+    return list(dict.fromkeys(tasks))
+
+
+def run_demo(lesson, demo, profile_dir=None, profile_top=20, output_mode='terminal'):
+    """
+    Run one demo in a scratch directory and capture its output
+    :param output_mode: ``terminal``, ``buffered`` or ``null``, see ``output``
+    :param profile_dir: directory for cProfile/tracemalloc reports, relative
+        to the current directory; ``None`` (the default) runs the demo
+        without any profiling
+    :param profile_top: rows in the hotspot and allocation tables
+    """
+    buffer = io.StringIO()
+    error = None
+    cwd = os.getcwd()
+    if profile_dir is not None:
+        profile_dir = os.path.abspath(profile_dir)  # the demo runs in a scratch directory
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='hello-demo-') as scratch:
+        os.chdir(scratch)
+        try:
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer), \
+                    output.use(output_mode):
+                func = getattr(lessons.load(lesson), demo)
+                if profile_dir is None:
+                    func()
+                else:
+                    from . import profiling  # pylint: disable=import-outside-toplevel
+                    print(profiling.profile_call(func, profile_dir, f'{lesson}.{demo}', profile_top))
+        except Exception:  # pylint: disable=broad-except
+            error = traceback.format_exc()
+        finally:
+            os.chdir(cwd)
+    return DemoResult(lesson, demo, buffer.getvalue(), time.perf_counter() - start, error)
+
+
+def report(result, out=None):
+    """Print one captured demo"""
+    out = out or sys.stdout
+    status = '' if result.error is None else ' 失败'
+    out.write(f"=== {result.name} ({result.elapsed:.2f}s){status} ===\n")
+    out.write(result.output)
+    if result.error is not None:
+        out.write(result.error)
+    out.write('\n')
+
+
+def run(tasks, jobs=None, out=None, profile_dir=None, profile_top=20, output_mode='terminal'):
+    """
+    Run demos in a process pool and report them in task order
+    :param tasks: ``(lesson, demo)`` pairs, see ``resolve``
+    :param jobs: worker processes, defaults to one per demo up to ``MAX_JOBS``
+    :param profile_dir: write per-demo profiling reports there, see ``run_demo``
+    :param output_mode: how demos print, see ``output``
+    """
+    output.make(output_mode)
+    if profile_dir is not None:
+        profile_dir = os.path.abspath(profile_dir)
+    results = []
+    if not tasks:
+        return results
+    with ProcessPoolExecutor(max_workers=jobs or min(len(tasks), MAX_JOBS)) as pool:
+        futures = [pool.submit(run_demo, lesson, demo, profile_dir, profile_top, output_mode) for lesson, demo in tasks]
+        for future in futures:
+            result = future.result()
+            report(result, out)
+            results.append(result)
+    return results
+
+
+def main(selection=(), jobs=None, profile_dir=None, profile_top=20, output_mode='terminal'):
+    """Entry point of ``hello-world-python run``"""
+    start = time.perf_counter()
+    results = run(resolve(selection), jobs, profile_dir=profile_dir, profile_top=profile_top,
+                  output_mode=output_mode)
+    failed = sum(result.error is not None for result in results)
+    print(f"共运行 {len(results)} 个演示，失败 {failed} 个，耗时 {time.perf_counter() - start:.2f} 秒")
+    return 1 if failed else 0
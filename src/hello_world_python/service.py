@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Greeting service
+
+A small HTTP/1.1 server on asyncio streams (stdlib only) that puts ``Hello``
+behind two endpoints::
+
+    GET /hello?name=John   ->  hello, John
+    GET /add?a=2&b=3       ->  5
+
+Connections are kept alive unless the client asks otherwise, and pipelined
+requests are answered in order. The server runs a single event loop, i.e. it
+uses one core; see ``loadgen`` for the matching client.
+"""
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+from .hello import Hello
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    431: 'Request Header Fields Too Large',
+}
+
+
+def handle(method, target):
+    """
+    Answer one request
+    :return: ``(status, body)``
+    """
+    if method not in ('GET', 'HEAD'):
+        return 405, 'method not allowed'
+    url = urlsplit(target)
+    query = parse_qs(url.query)
+    if url.path == '/hello':
+        return 200, Hello(query.get('name', ['world'])[0]).greeting()
+    if url.path == '/add':
+        try:
+            return 200, str(Hello.add(int(query['a'][0]), int(query['b'][0])))
+        except (KeyError, ValueError):
+            return 400, 'a and b must be integers'
+    return 404, 'not found'
+
+
+def render_response(status, body, keep_alive=True, head=False):
+    """Encode a plain text HTTP/1.1 response"""
+    payload = body.encode('utf-8')
+    header = (f'HTTP/1.1 {status} {_REASONS[status]}\r\n'
+              f'Content-Type: text/plain; charset=utf-8\r\n'
+              f'Content-Length: {len(payload)}\r\n'
+              f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n')
+    return header.encode('latin-1') + (b'' if head else payload)
+
+
+def _parse_head(head):
+    """Split a request head into method, target, version and lower-cased headers"""
+    request_line, *lines = head[:-4].decode('latin-1').split('\r\n')
+    method, target, version = request_line.split(' ')
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+async def handle_connection(reader, writer):
+    """Serve requests from one connection until it closes"""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError:
+                writer.write(render_response(431, 'header too large', keep_alive=False))
+                break
+            try:
+                method, target, version, headers = _parse_head(head)
+                length = int(headers.get('content-length') or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                writer.write(render_response(400, 'bad request', keep_alive=False))
+                break
+            if length > MAX_BODY_SIZE:
+                writer.write(render_response(413, 'payload too large', keep_alive=False))
+                break
+            if length:
+                await reader.readexactly(length)
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+            status, body = handle(method, target)
+            writer.write(render_response(status, body, keep_alive, head=method == 'HEAD'))
+            if not keep_alive:
+                break
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Start listening; ``port=0`` picks a free port, see ``server_port``"""
+    return await asyncio.start_server(handle_connection, host, port, limit=MAX_HEADER_SIZE)
+
+
+def server_port(server):
+    """Port the server actually listens on"""
+    return server.sockets[0].getsockname()[1]
+
+
+async def _serve_forever(host, port, ready):
+    server = await start_server(host, port)
+    async with server:
+        if ready is not None:
+            ready.put(server_port(server))
+        else:
+            print(f"问候服务已启动: http://{host}:{server_port(server)}/hello?name=world")
+        await server.serve_forever()
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+    """
+    Run the service until interrupted
+    :param ready: optional queue that receives the bound port once listening
+    """
+    try:
+        asyncio.run(_serve_forever(host, port, ready))
+    except KeyboardInterrupt:
+        pass
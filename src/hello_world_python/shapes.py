@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Columnar shape collection
+
+``ShapeCollection`` stores the shapes of ``oop.polymorphism`` as per-type
+``array('d')`` columns instead of objects:
+
+* ``Rectangle``: ``widths``, ``heights``
+* ``Square``: ``sides``
+* ``Circle``: ``radii``
+* ``Triangle``: ``a``, ``b``, ``c``
+
+Areas and perimeters are computed one type at a time over whole columns
+(numpy when installed, C-level ``map`` otherwise), so there is no method
+dispatch per shape. Shapes of any other ``Shape`` subclass are kept as objects
+and measured through their own methods. Results match the object API to
+within float rounding.
+"""
+import itertools
+import math
+import operator
+from array import array
+
+from . import lessons
+from .hello import _numpy
+
+KINDS = ('Rectangle', 'Square', 'Circle', 'Triangle')
+
+
+def _columns(*columns):
+    """Copy sequences into ``array('d')`` columns of equal length"""
+    copies = [column if isinstance(column, array) and column.typecode == 'd' else array('d', column)
+              for column in columns]
+    if len({len(column) for column in copies}) > 1:
+        raise ValueError('columns must have the same length')
+    return copies
+
+
+def _descending(a, b, c):
+    """Columns ``x >= y >= z`` of the row-wise sorted sides, ``None`` without numpy"""
+    np = _numpy()
+    if np is not None:
+        stacked = np.sort(np.stack([np.frombuffer(column, dtype=np.float64) for column in (a, b, c)]), axis=0)
+        return stacked[2], stacked[1], stacked[0]
+    return None
+
+
+def heron(a, b, c):
+    """
+    Areas of the triangles with sides ``a``, ``b``, ``c``, using the stable
+    form of Heron's formula on sides sorted ``x >= y >= z``::
+
+        sqrt((x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z))) / 4
+
+    which keeps near-degenerate (needle-like) triangles accurate
+    """
+    a, b, c = _columns(a, b, c)
+    columns = _descending(a, b, c)
+    if columns is not None:
+        np = _numpy()
+        x, y, z = columns
+        area = np.sqrt((x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z))) / 4
+        return array('d', area.tobytes())
+    sqrt = math.sqrt
+    return array('d', [sqrt((x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z))) / 4
+                       for z, y, x in map(sorted, zip(a, b, c))])
+
+
+def triangle_mask(a, b, c):
+    """
+    One byte per row, 1 where ``a``, ``b``, ``c`` form a triangle: after
+    sorting, the shortest side is positive and longer than the difference
+    of the other two (``x - y`` is exact for near-degenerate rows, unlike
+    ``y + z``)
+    """
+    a, b, c = _columns(a, b, c)
+    columns = _descending(a, b, c)
+    if columns is not None:
+        x, y, z = columns
+        return bytearray(((z > 0) & (z > x - y)).astype('u1').tobytes())
+    return bytearray([z > 0 and z > x - y for z, y, x in map(sorted, zip(a, b, c))])
+
+
+def _product(x, y, scale=1.0):
+    np = _numpy()
+    if np is not None:
+        product = np.frombuffer(x, dtype=np.float64) * np.frombuffer(y, dtype=np.float64) * scale
+        return array('d', product.tobytes())
+    product = map(operator.mul, x, y)
+    return array('d', product if scale == 1.0 else map(scale.__mul__, product))
+
+
+def _scaled(x, scale):
+    np = _numpy()
+    if np is not None:
+        return array('d', (np.frombuffer(x, dtype=np.float64) * scale).tobytes())
+    return array('d', map(scale.__mul__, x))
+
+
+def _sum(x, y, scale):
+    np = _numpy()
+    if np is not None:
+        return array('d', ((np.frombuffer(x, dtype=np.float64) + np.frombuffer(y, dtype=np.float64))
+                           * scale).tobytes())
+    return array('d', map(scale.__mul__, map(operator.add, x, y)))
+
+
+class ShapeCollection:
+    """Shapes stored as per-type columns with batched geometry"""
+
+    def __init__(self, shapes=()):
+        """
+        :param shapes: ``Shape`` objects to copy into the columns
+        """
+        self._lesson = lessons.load('oop.polymorphism')
+        self.widths, self.heights = array('d'), array('d')
+        self.sides = array('d')
+        self.radii = array('d')
+        self.a, self.b, self.c = array('d'), array('d'), array('d')
+        self.others = []
+        self.extend(shapes)
+
+    def add(self, shape):
+        """Copy one shape into its columns"""
+        kind = type(shape).__name__ if type(shape).__module__ == self._lesson.__name__ else None
+        if kind == 'Rectangle':
+            self.widths.append(shape.width)
+            self.heights.append(shape.height)
+        elif kind == 'Square':
+            self.sides.append(shape.width)
+        elif kind == 'Circle':
+            self.radii.append(shape.radius)
+        elif kind == 'Triangle':
+            self.a.append(shape.a)
+            self.b.append(shape.b)
+            self.c.append(shape.c)
+        else:
+            self.others.append(shape)
+
+    def extend(self, shapes):
+        for shape in shapes:
+            self.add(shape)
+
+    def add_rectangles(self, widths, heights):
+        widths, heights = _columns(widths, heights)
+        self.widths.extend(widths)
+        self.heights.extend(heights)
+
+    def add_squares(self, sides):
+        self.sides.extend(*_columns(sides))
+
+    def add_circles(self, radii):
+        self.radii.extend(*_columns(radii))
+
+    def add_triangles(self, a, b, c, strict=True):
+        """
+        :param strict: raise for an invalid row; otherwise skip invalid rows
+        :raises ValueError: in strict mode when a row violates the triangle
+            inequality, nothing is added then
+        :return: ``array('L')`` of the rejected row indexes
+        """
+        a, b, c = _columns(a, b, c)
+        mask = triangle_mask(a, b, c)
+        rejected = array('L', itertools.compress(itertools.count(), map((1).__xor__, mask)))
+        if rejected and strict:
+            raise ValueError(f"第 {rejected[0]} 行的三边不能构成三角形")
+        if rejected:
+            a, b, c = (array('d', itertools.compress(column, mask)) for column in (a, b, c))
+        self.a.extend(a)
+        self.b.extend(b)
+        self.c.extend(c)
+        return rejected
+
+    def counts(self):
+        """Number of shapes per kind, ``others`` included"""
+        return {'Rectangle': len(self.widths), 'Square': len(self.sides), 'Circle': len(self.radii),
+                'Triangle': len(self.a), 'others': len(self.others)}
+
+    def __len__(self):
+        return sum(self.counts().values())
+
+    def __iter__(self):
+        """Materialize the shapes as objects, grouped by kind"""
+        lesson = self._lesson
+        yield from map(lesson.Rectangle, self.widths, self.heights)
+        yield from map(lesson.Square, self.sides)
+        yield from map(lesson.Circle, self.radii)
+        yield from map(lesson.Triangle, self.a, self.b, self.c)
+        yield from self.others
+
+    def areas(self):
+        """Per-shape areas by kind, in insertion order within each kind"""
+        return {
+            'Rectangle': _product(self.widths, self.heights),
+            'Square': _product(self.sides, self.sides),
+            'Circle': _product(self.radii, self.radii, math.pi),
+            'Triangle': heron(self.a, self.b, self.c),
+            'others': array('d', (shape.area() for shape in self.others)),
+        }
+
+    def perimeters(self):
+        """Per-shape perimeters by kind, in insertion order within each kind"""
+        return {
+            'Rectangle': _sum(self.widths, self.heights, 2.0),
+            'Square': _scaled(self.sides, 4.0),
+            'Circle': _scaled(self.radii, 2 * math.pi),
+            'Triangle': array('d', map(operator.add, map(operator.add, self.a, self.b), self.c)),
+            'others': array('d', (shape.perimeter() for shape in self.others)),
+        }
+
+    def total_area(self):
+        """Sum of all areas, without building per-shape columns where possible"""
+        np = _numpy()
+        if np is not None:
+            return math.fsum(math.fsum(column) for column in self.areas().values())
+        return math.fsum((
+            math.fsum(map(operator.mul, self.widths, self.heights)),
+            math.fsum(map(operator.mul, self.sides, self.sides)),
+            math.pi * math.fsum(map(operator.mul, self.radii, self.radii)),
+            math.fsum(heron(self.a, self.b, self.c)),
+            math.fsum(shape.area() for shape in self.others),
+        ))
+
+    def total_perimeter(self):
+        """Sum of all perimeters, from column sums"""
+        return math.fsum((
+            2 * (math.fsum(self.widths) + math.fsum(self.heights)),
+            4 * math.fsum(self.sides),
+            2 * math.pi * math.fsum(self.radii),
+            math.fsum(self.a) + math.fsum(self.b) + math.fsum(self.c),
+            math.fsum(shape.perimeter() for shape in self.others),
+        ))
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Binary account snapshots
+
+A snapshot holds the state of a ``BankAccount`` / ``EnhancedBankAccount``
+population (``oop.encapsulation``) so a restart does not replay transactions.
+The file is a 32 byte header followed by fixed-width little-endian records
+sorted by account number::
+
+    header  8s magic, I version, I record size, Q record count, Q highest number
+    record  16s account number, 64s holder (UTF-8, NUL padded),
+            q balance in cents, q interest rate in ppm (-1: plain BankAccount)
+
+``write`` streams the records sequentially. ``Snapshot`` maps the file with
+``mmap`` and answers ``get_balance`` by binary search over the mapping, so
+lookups work right after opening; accounts are only built by ``account`` or
+``restore``. Ledgers are not part of a snapshot.
+"""
+import mmap
+import struct
+from pathlib import Path
+
+from . import lessons
+
+MAGIC = b'HWPSNAP1'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+RECORD = struct.Struct('<16s64sqq')
+NUMBER_SIZE = 16
+HOLDER_SIZE = 64
+PLAIN = -1
+CHUNK = 4096
+
+
+def _number_key(account_number):
+    encoded = account_number.encode('utf-8')
+    if len(encoded) > NUMBER_SIZE:
+        raise ValueError(f'账户号码超过 {NUMBER_SIZE} 字节: {account_number}')
+    return encoded.ljust(NUMBER_SIZE, b'\0')
+
+
+def _decode(field):
+    return field.rstrip(b'\0').decode('utf-8')
+
+
+def _record(bank, account):
+    info = account.get_account_info()
+    holder = info['account_holder'].encode('utf-8')
+    if len(holder) > HOLDER_SIZE:
+        raise ValueError(f"持有人名称超过 {HOLDER_SIZE} 字节: {info['account_holder']}")
+    get_rate = getattr(account, 'get_interest_rate', None)
+    rate = PLAIN if get_rate is None else round(get_rate() * 1_000_000)
+    return _number_key(info['account_number']), holder, bank.to_cents(info['balance']), rate
+
+
+def write(path, accounts):
+    """
+    Write a snapshot of ``accounts``
+    :raises ValueError: for duplicate account numbers or oversized fields
+    :return: number of records written
+    """
+    bank = lessons.load('oop.encapsulation')
+    records = sorted(_record(bank, account) for account in accounts)
+    highest = 0
+    for previous, record in zip(records, records[1:]):
+        if previous[0] == record[0]:
+            raise ValueError(f'账户号码重复: {_decode(record[0])}')
+    for record in records:
+        number = bank.parse_account_number(_decode(record[0]))
+        if number is not None:
+            highest = max(highest, number)
+    path = Path(path)
+    partial = path.with_name(path.name + '.tmp')
+    buffer = bytearray(RECORD.size * CHUNK)
+    with open(partial, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, len(records), highest))
+        for start in range(0, len(records), CHUNK):
+            chunk = records[start:start + CHUNK]
+            for offset, record in enumerate(chunk):
+                RECORD.pack_into(buffer, offset * RECORD.size, *record)
+            file.write(memoryview(buffer)[:len(chunk) * RECORD.size])
+    partial.replace(path)
+    return len(records)
+
+
+class Snapshot:
+    """Read-only view of a snapshot file through ``mmap``"""
+
+    def __init__(self, path):
+        """
+        :raises ValueError: when the file is not a snapshot of this version
+        """
+        self._bank = lessons.load('oop.encapsulation')
+        self.path = Path(path)
+        with open(self.path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, size, self._count, self.highest_number = HEADER.unpack_from(self._map)
+        except struct.error:
+            self._map.close()
+            raise ValueError(f'{path}: 不是账户快照') from None
+        if magic != MAGIC or version != VERSION or size != RECORD.size \
+                or len(self._map) != HEADER.size + self._count * RECORD.size:
+            self._map.close()
+            raise ValueError(f'{path}: 不是账户快照或版本不受支持')
+        self._accounts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """``(account_number, holder, balance_cents, rate_ppm)`` of record ``index``"""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        number, holder, balance, rate = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        return _decode(number), _decode(holder), balance, rate
+
+    def find(self, account_number):
+        """Record index of ``account_number``, ``-1`` if absent"""
+        key = _number_key(account_number)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * RECORD.size
+            if self._map[offset:offset + NUMBER_SIZE] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        offset = HEADER.size + lo * RECORD.size
+        return lo if lo < self._count and self._map[offset:offset + NUMBER_SIZE] == key else -1
+
+    def get_balance(self, account_number):
+        """
+        Balance of an account straight from the mapping
+        :raises KeyError: for unknown account numbers
+        """
+        account = self._accounts.get(account_number)
+        if account is not None:
+            return account.get_balance()
+        index = self.find(account_number)
+        if index < 0:
+            raise KeyError(account_number)
+        return self._bank.from_cents(self[index][2])
+
+    def _materialize(self, record):
+        number, holder, balance, rate = record
+        if rate == PLAIN:
+            account = self._bank.BankAccount(holder, self._bank.from_cents(balance), number)
+        else:
+            account = self._bank.EnhancedBankAccount(holder, self._bank.from_cents(balance), number,
+                                                     rate / 1_000_000)
+        self._accounts[number] = account
+        return account
+
+    def _skip_numbers(self):
+        self._bank.BankAccount._skip_numbers(self.highest_number)  # pylint: disable=protected-access
+
+    def account(self, account_number):
+        """
+        The account object, built on first request and cached
+        :raises KeyError: for unknown account numbers
+        """
+        account = self._accounts.get(account_number)
+        if account is None:
+            index = self.find(account_number)
+            if index < 0:
+                raise KeyError(account_number)
+            self._skip_numbers()
+            account = self._materialize(self[index])
+        return account
+
+    def restore(self):
+        """Build (or reuse) every account, in account number order"""
+        self._skip_numbers()
+        accounts = []
+        for index in range(self._count):
+            record = self[index]
+            account = self._accounts.get(record[0])
+            accounts.append(account if account is not None else self._materialize(record))
+        return accounts
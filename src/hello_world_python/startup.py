@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Import-time and startup benchmarks
+
+Every lesson is measured in a fresh interpreter started with ``-X importtime``:
+
+* ``import_ms``: executing the lesson module (its lazy load)
+* ``first_call_ms``: first call of each demo function, output discarded
+* ``peak_rss_kb``: peak resident set size of the probe process
+* ``imports``: the slowest modules imported on behalf of the lesson
+
+A ``__startup__`` record measures the interpreter plus the lesson registry
+alone. Results can be saved as a JSON baseline; later runs flag metrics that
+grew by more than a threshold (and by more than a small absolute floor, so
+sub-millisecond noise is not reported).
+"""
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from . import lessons, runner
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FORMAT_VERSION = 1
+STARTUP = '__startup__'
+MARKER = '--- lesson import ---'
+TOP_IMPORTS = 10
+# a change is only a regression when it also exceeds these absolute deltas
+MIN_DELTA = {'_ms': 1.0, '_kb': 1024}
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _probe(name, demos, out_path):
+    """Runs inside the measured interpreter"""
+    result = {'first_call_ms': {}}
+    if name != STARTUP:
+        sys.stderr.write(MARKER + '\n')
+        sys.stderr.flush()
+        start = time.perf_counter()
+        module = lessons.load(name)
+        vars(module)  # first attribute access executes the lazy module
+        result['import_ms'] = (time.perf_counter() - start) * 1000
+        result['import_rss_kb'] = _peak_rss_kb()
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            for demo in demos:
+                start = time.perf_counter()
+                try:
+                    getattr(module, demo)()
+                except Exception:  # pylint: disable=broad-except
+                    pass
+                result['first_call_ms'][demo] = (time.perf_counter() - start) * 1000
+    else:
+        lessons.lesson_index()
+    result['peak_rss_kb'] = _peak_rss_kb()
+    Path(out_path).write_text(json.dumps(result), encoding='utf-8')
+
+
+def parse_importtime(text, top=TOP_IMPORTS):
+    """
+    Return the slowest imports logged after ``MARKER``
+    :return: ``[module, self_us, cumulative_us]`` sorted by self time
+    """
+    _, found, text = text.partition(MARKER)
+    if not found:
+        return []
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        if self_us.strip().isdigit():
+            entries.append([module.strip(), int(self_us), int(cumulative_us)])
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return entries[:top]
+
+
+def measure(name, demos=()):
+    """Measure one lesson (or ``STARTUP``) in a fresh interpreter"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    with tempfile.TemporaryDirectory(prefix='hello-startup-') as scratch:
+        out_path = os.path.join(scratch, 'result.json')
+        code = (f'import importlib; '
+                f'importlib.import_module({__name__!r})._probe({name!r}, {list(demos)!r}, {out_path!r})')
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=scratch, env=env,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+        process_ms = (time.perf_counter() - start) * 1000
+        if process.returncode != 0:
+            raise RuntimeError(f"测量 {name} 失败:\n{process.stderr[-2000:]}")
+        result = json.loads(Path(out_path).read_text(encoding='utf-8'))
+    result['process_ms'] = process_ms
+    result['imports'] = parse_importtime(process.stderr)
+    return result
+
+
+def run_suite(selection=(), calls=True):
+    """Measure the startup record and every selected lesson"""
+    selected = defaultdict(list)
+    for lesson, demo in runner.resolve(selection):
+        selected[lesson].append(demo)
+    modules = {STARTUP: measure(STARTUP)}
+    for lesson, demos in selected.items():
+        modules[lesson] = measure(lesson, demos if calls else ())
+    return {'version': FORMAT_VERSION, 'python': sys.version.split()[0], 'modules': modules}
+
+
+def _metrics(record):
+    """Flatten a module record into comparable ``metric -> value`` pairs"""
+    metrics = {key: record[key] for key in ('process_ms', 'import_ms', 'peak_rss_kb')
+               if record.get(key) is not None}
+    for demo, value in record.get('first_call_ms', {}).items():
+        metrics[f'first_call_ms.{demo}'] = value
+    return metrics
+
+
+def compare(current, baseline, threshold=0.2):
+    """
+    Find metrics that grew beyond ``threshold`` (0.2 = 20%) against a baseline
+    :return: ``[(module, metric, old, new, change)]``
+    """
+    regressions = []
+    for name, record in current['modules'].items():
+        old_metrics = _metrics(baseline['modules'].get(name, {}))
+        for metric, new in _metrics(record).items():
+            old = old_metrics.get(metric)
+            if not old:
+                continue
+            floor = next((delta for suffix, delta in MIN_DELTA.items() if metric.split('.')[0].endswith(suffix)), 0)
+            change = (new - old) / old
+            if change > threshold and new - old > floor:
+                regressions.append((name, metric, old, new, change))
+    return regressions
+
+
+def report(results, out=None):
+    """Print one line per module"""
+    out = out or sys.stdout
+    out.write(f"{'模块':<40}{'进程(ms)':>10}{'导入(ms)':>10}{'首次调用(ms)':>14}{'峰值RSS(MB)':>12}  最慢导入\n")
+    for name, record in results['modules'].items():
+        first_call = sum(record['first_call_ms'].values())
+        rss = record['peak_rss_kb']
+        slowest = record['imports'][0][0] if record['imports'] else '-'
+        out.write(f"{name:<40}{record['process_ms']:>10.1f}{record.get('import_ms', 0):>10.2f}"
+                  f"{first_call:>14.1f}{(rss or 0) / 1024:>12.1f}  {slowest}\n")
+
+
+def main(selection=(), calls=True, baseline=None, save=False, threshold=0.2):
+    """Entry point of ``hello-world-python startup``"""
+    if save and baseline is None:
+        raise ValueError('保存基线需要指定 --baseline 路径')
+    results = run_suite(selection, calls)
+    report(results)
+    status = 0
+    if baseline is not None and Path(baseline).exists() and not save:
+        previous = json.loads(Path(baseline).read_text(encoding='utf-8'))
+        regressions = compare(results, previous, threshold)
+        for name, metric, old, new, change in regressions:
+            print(f"性能退化: {name} {metric} {old:.2f} -> {new:.2f} (+{change:.0%})")
+        print(f"与基线 {baseline} 比较: {len(regressions)} 项超过阈值 {threshold:.0%}")
+        status = 1 if regressions else 0
+    if save:
+        Path(baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(baseline).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"基线已保存到 {baseline}")
+    return status
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Streaming queries over shape areas
+
+``AreaQuery`` consumes shapes of ``oop.polymorphism`` (anything with an
+``area()`` method) from an iterable of unknown length and answers:
+
+* ``largest()``: the ``k`` shapes with the largest areas, kept in a min-heap
+  of ``k`` entries (``TopK``)
+* ``quantile(q)`` / ``percentile(p)``: area quantiles from ``QuantileSketch``,
+  a log-bucketed histogram whose answers are within ``accuracy`` relative
+  error of an exact quantile of the input (bucketed with numpy when
+  installed)
+
+Memory is bounded by ``k`` plus the number of sketch buckets, whatever the
+length of the stream. Both structures pickle and ``merge``, so shards
+processed in separate processes can be combined; a merged sketch is identical
+to the sketch of the concatenated input.
+"""
+import heapq
+import itertools
+import math
+import operator
+from array import array
+from collections import Counter
+
+from .hello import _numpy
+
+CHUNK = 4096
+MAX_BUCKETS = 2048
+
+
+class TopK:
+    """The ``k`` items with the largest keys seen so far"""
+
+    def __init__(self, k: int = 100):
+        if k < 1:
+            raise ValueError('k 必须为正数')
+        self.k = k
+        self._heap = []   # (key, sequence, item), smallest key first
+        self._sequence = 0   # tie-breaker, so items are never compared
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, key, item):
+        self._sequence += 1
+        entry = (key, self._sequence, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, keys, items):
+        """Push pairs from two parallel iterables"""
+        heap = self._heap
+        pairs = zip(keys, items)
+        if len(heap) < self.k:
+            for key, item in pairs:
+                self.push(key, item)
+                if len(heap) == self.k:
+                    break
+        for key, item in pairs:
+            # only keys beating the current minimum touch the heap
+            if key > heap[0][0]:
+                self._sequence += 1
+                heapq.heapreplace(heap, (key, self._sequence, item))
+
+    def merge(self, other):
+        """Add the entries of another ``TopK``; returns ``self``"""
+        for key, _, item in other._heap:  # pylint: disable=protected-access
+            self.push(key, item)
+        return self
+
+    def largest(self):
+        """``(key, item)`` pairs, largest key first"""
+        return [(key, item) for key, _, item in sorted(self._heap, key=operator.itemgetter(0, 1),
+                                                       reverse=True)]
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch of non-negative values with relative error"""
+
+    def __init__(self, accuracy: float = 0.01, max_buckets: int = MAX_BUCKETS):
+        """
+        :param accuracy: relative error bound of the quantiles, e.g. 0.01
+        :param max_buckets: past this many buckets the smallest ones are
+            collapsed, trading accuracy of low quantiles for bounded memory
+        """
+        if not 0 < accuracy < 1:
+            raise ValueError('accuracy 必须在 0 和 1 之间')
+        self.accuracy = accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._scale = 1 / math.log(self._gamma)
+        self._buckets = Counter()   # index -> count, value v lands in ceil(log_gamma(v))
+        self.zeros = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        self.add_many((value,))
+
+    def add_many(self, values):
+        """
+        :raises ValueError: for negative values, nothing is added then
+        """
+        values = array('d', values)
+        if not values:
+            return
+        low, high = min(values), max(values)
+        if low < 0:
+            raise ValueError(f'不支持负数: {low}')
+        zeros = values.count(0.0)
+        np = _numpy()
+        if np is not None:
+            column = np.frombuffer(values, dtype=np.float64)
+            indexes, counts = np.unique(np.ceil(np.log(column[column > 0]) * self._scale).astype(np.int64),
+                                        return_counts=True)
+            self._buckets.update(dict(zip(indexes.tolist(), counts.tolist())))
+        else:
+            logs = map(self._scale.__mul__, map(math.log, filter(None, values)))
+            self._buckets.update(map(math.ceil, logs))
+        self.zeros += zeros
+        self.count += len(values)
+        self.min, self.max = min(self.min, low), max(self.max, high)
+        self._collapse()
+
+    def _collapse(self):
+        buckets = self._buckets
+        if len(buckets) > self.max_buckets:
+            indexes = sorted(buckets)
+            excess = len(indexes) - self.max_buckets
+            target = indexes[excess]
+            buckets[target] += sum(buckets.pop(index) for index in indexes[:excess])
+
+    def merge(self, other):
+        """
+        Add the counts of another sketch; returns ``self``
+        :raises ValueError: when the sketches have different accuracies
+        """
+        if other.accuracy != self.accuracy:
+            raise ValueError('只能合并精度相同的分位数草图')
+        self._buckets.update(other._buckets)  # pylint: disable=protected-access
+        self.zeros += other.zeros
+        self.count += other.count
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        self._collapse()
+        return self
+
+    def quantile(self, q):
+        """
+        Value at quantile ``q`` (0 to 1)
+        :raises ValueError: for an empty sketch or ``q`` out of range
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('q 必须在 0 和 1 之间')
+        if not self.count:
+            raise ValueError('分位数草图为空')
+        rank = q * (self.count - 1)
+        if rank == 0 or rank == self.count - 1:
+            return self.min if rank == 0 else self.max
+        if rank < self.zeros:
+            return 0.0
+        seen = self.zeros
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentile(self, p):
+        """Value at percentile ``p`` (0 to 100)"""
+        return self.quantile(p / 100)
+
+
+class AreaQuery:
+    """Top-K shapes by area and area quantiles over a stream of shapes"""
+
+    def __init__(self, k: int = 100, accuracy: float = 0.01):
+        self.top = TopK(k)
+        self.sketch = QuantileSketch(accuracy)
+
+    def __len__(self):
+        return self.sketch.count
+
+    def add(self, shape):
+        self.extend((shape,))
+
+    def extend(self, shapes):
+        """Consume an iterable of shapes ``CHUNK`` at a time"""
+        shapes = iter(shapes)
+        while True:
+            chunk = list(itertools.islice(shapes, CHUNK))
+            if not chunk:
+                return
+            areas = array('d', map(operator.methodcaller('area'), chunk))
+            self.sketch.add_many(areas)
+            self.top.extend(areas, chunk)
+
+    def merge(self, other):
+        """Combine with the query of another shard; returns ``self``"""
+        self.top.merge(other.top)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def largest(self):
+        """``(area, shape)`` pairs, largest area first"""
+        return self.top.largest()
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def percentile(self, p):
+        return self.sketch.percentile(p)
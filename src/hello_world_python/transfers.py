@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Concurrent transfer engine
+
+``BankAccount.transfer`` (``oop.encapsulation``) validates, debits and credits
+without any locking, so two threads moving money between the same accounts can
+lose updates. ``TransferEngine`` gives every account a lock and a rank on first
+use; a transfer holds both account locks, always taken in rank order, so two
+transfers in opposite directions can never wait on each other (no deadlock).
+
+Only transfers routed through the engine are serialized; plain ``deposit`` or
+``withdraw`` calls on the same accounts from other threads are not.
+"""
+import itertools
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+from . import lessons, output
+
+DEFAULT_WORKERS = 8
+DEFAULT_CHUNK = 256
+
+
+@dataclass
+class BatchResult:
+    """Outcome of ``TransferEngine.run_batch``, ``applied`` in submission order"""
+    applied: List[bool]
+    seconds: float
+
+    @property
+    def succeeded(self):
+        return sum(self.applied)
+
+    @property
+    def rejected(self):
+        return len(self.applied) - self.succeeded
+
+    @property
+    def transfers_per_second(self):
+        return len(self.applied) / self.seconds if self.seconds else float('inf')
+
+    def __str__(self):
+        return (f"{len(self.applied)} 笔转账（成功 {self.succeeded}，拒绝 {self.rejected}），"
+                f"耗时 {self.seconds:.3f} 秒，{self.transfers_per_second:,.0f} 笔/秒")
+
+
+class TransferEngine:
+    """Run ``source.transfer(target, amount)`` safely from many threads"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, chunk_size: int = DEFAULT_CHUNK):
+        """
+        :param workers: threads used by ``run_batch``
+        :param chunk_size: transfers handed to a thread at a time
+        """
+        if workers < 1 or chunk_size < 1:
+            raise ValueError('workers and chunk_size must be positive')
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._locks = weakref.WeakKeyDictionary()
+        self._ranks = itertools.count()
+        self._registry_lock = threading.Lock()
+
+    def lock_for(self, account):
+        """``(rank, lock)`` of an account, created on first use"""
+        entry = self._locks.get(account)
+        if entry is None:
+            with self._registry_lock:
+                entry = self._locks.get(account)
+                if entry is None:
+                    entry = self._locks[account] = (next(self._ranks), threading.Lock())
+        return entry
+
+    def transfer(self, source, target, amount):
+        """
+        Move ``amount`` from ``source`` to ``target`` holding both account locks
+        :return: whether the transfer was applied
+        """
+        if source is target:
+            return False
+        (first_rank, first), (second_rank, second) = self.lock_for(source), self.lock_for(target)
+        if second_rank < first_rank:
+            first, second = second, first
+        with first, second:
+            return source.transfer(target, amount)
+
+    def _run_chunk(self, transfers, applied, start):
+        transfer = self.transfer
+        for offset, (source, target, amount) in enumerate(transfers):
+            applied[start + offset] = transfer(source, target, amount)
+
+    def run_batch(self, transfers):
+        """
+        Apply ``(source, target, amount)`` transfers in parallel threads
+        Transfers touching different accounts run concurrently; the order in
+        which conflicting transfers apply is not the submission order.
+        :return: ``BatchResult``
+        """
+        transfers = list(transfers)
+        applied = [False] * len(transfers)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(self._run_chunk, transfers[i:i + self.chunk_size], applied, i)
+                       for i in range(0, len(transfers), self.chunk_size)]
+            for future in futures:
+                future.result()
+        return BatchResult(applied, time.perf_counter() - start)
+
+
+def random_transfers(accounts, count, max_amount=100, seed=None):
+    """``count`` random transfers between distinct ``accounts``"""
+    rng = random.Random(seed)
+    transfers = []
+    for _ in range(count):
+        source, target = rng.sample(accounts, 2)
+        transfers.append((source, target, rng.randint(1, max_amount)))
+    return transfers
+
+
+def main(accounts=1000, transfers=200_000, workers=DEFAULT_WORKERS, chunk_size=DEFAULT_CHUNK, seed=None):
+    """Entry point of ``hello-world-python transfers``"""
+    bank = lessons.load('oop.encapsulation')
+    with output.use('null'):
+        population = [bank.BankAccount(f'客户{i}', 1000) for i in range(accounts)]
+        before = sum(account.get_balance() for account in population)
+        batch = random_transfers(population, transfers, seed=seed)
+        result = TransferEngine(workers, chunk_size).run_batch(batch)
+    after = sum(account.get_balance() for account in population)
+    print(result)
+    print(f"总余额 {before} -> {after}")
+    return 0 if before == after else 1
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Test aggregates"""
+import random
+import unittest
+
+from src.hello_world_python import aggregates, lessons, transfers
+from tests.helpers import NullOutputMixin
+
+
+class TestAggregates(NullOutputMixin, unittest.TestCase):
+    """Test 增量维护的全行统计"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+
+    def test_sorted_keys_matches_sorted_list(self):
+        """
+        TC001：验证分桶有序集合在随机增删后与排序列表一致
+        """
+        rng = random.Random(3)
+        keys, expected = aggregates.SortedKeys(load=4), []
+        for _ in range(2000):
+            if expected and rng.random() < 0.4:
+                key = expected.pop(rng.randrange(len(expected)))
+                keys.remove(key)
+            else:
+                key = (rng.randint(0, 100), rng.random())
+                keys.add(key)
+                expected.append(key)
+        self.assertEqual(keys.largest(len(expected) + 5), sorted(expected, reverse=True))
+        self.assertEqual(len(keys), len(expected))
+        with self.assertRaises(KeyError):
+            keys.remove((1000, 0.0))
+
+    def test_totals_follow_every_change(self):
+        """
+        TC002：验证存取款、转账和计息后统计值与逐个账户计算的结果一致
+        """
+        stats = aggregates.BankAggregates(load=2)
+        accounts = [self.bank.EnhancedBankAccount(f'客户{i}', 100 * i) for i in range(10)]
+        for account in accounts:
+            stats.track(account)
+        accounts[1].deposit(50)
+        accounts[2].withdraw(30)
+        accounts[9].transfer(accounts[0], 450)
+        accounts[5].add_interest()
+        outsider = self.bank.BankAccount('外部', 0)
+        accounts[8].transfer(outsider, 100)
+        self.assertEqual(stats.total_balance, sum(account.get_balance() for account in accounts))
+        self.assertEqual((stats.total_deposits, stats.total_withdrawals), (50, 30))
+        richest = sorted((account.get_balance() for account in accounts), reverse=True)[:3]
+        self.assertEqual([balance for _, balance in stats.top(3)], richest)
+        account, balance = stats.top(1)[0]
+        self.assertEqual(account.get_balance(), balance)
+
+    def test_untrack_and_duplicates(self):
+        """
+        TC003：验证取消统计后不再更新，重复加入抛出 ValueError
+        """
+        stats = aggregates.BankAggregates()
+        account = self.bank.BankAccount('张三', 100)
+        stats.track(account)
+        with self.assertRaises(ValueError):
+            stats.track(account)
+        stats.untrack(account)
+        account.deposit(10)
+        self.assertEqual((stats.total_balance, len(stats), stats.top()), (0, 0, []))
+
+    def test_concurrent_transfers_keep_totals(self):
+        """
+        TC004：验证并发转账时总余额不变、排名与实际余额一致
+        """
+        stats = aggregates.BankAggregates(load=8)
+        accounts = [self.bank.BankAccount(f'客户{i}', 100) for i in range(40)]
+        for account in accounts:
+            stats.track(account)
+        batch = transfers.random_transfers(accounts, 5000, max_amount=50, seed=5)
+        transfers.TransferEngine(workers=4, chunk_size=32).run_batch(batch)
+        self.assertEqual(stats.total_balance, 4000)
+        ranked = [balance for _, balance in stats.top(40)]
+        self.assertEqual(ranked, sorted((account.get_balance() for account in accounts), reverse=True))
+
+    def test_transfer_from_untracked_account(self):
+        """
+        TC005：验证未统计账户转入已统计账户时，统计值随转入方更新且不重复计算
+        """
+        stats = aggregates.BankAggregates()
+        first, second = self.bank.BankAccount('张三', 100), self.bank.BankAccount('李四', 100)
+        outsider = self.bank.BankAccount('外部', 100)
+        stats.track(first)
+        stats.track(second)
+        outsider.transfer(first, 40)
+        second.transfer(first, 10)
+        self.assertEqual(stats.total_balance, 240)
+        self.assertEqual(stats.top(), [(first, 150), (second, 90)])
+        self.assertEqual((stats.total_deposits, stats.total_withdrawals), (0, 0))
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Test bench"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.hello_world_python import bench
+
+
+class TestBench(unittest.TestCase):
+    """Test 微基准框架"""
+
+    def test_reject_outliers_uses_tukey_fences(self):
+        """
+        TC001：验证超出 1.5 倍 IQR 的样本被剔除
+        """
+        kept, rejected = bench.reject_outliers([1.0, 1.1, 0.9, 1.0, 1.05, 10.0])
+        self.assertNotIn(10.0, kept)
+        self.assertEqual(rejected, 1)
+
+    def test_mann_whitney_and_significance_markers(self):
+        """
+        TC002：验证相同分布不显著、明显分离的分布显著
+        """
+        same = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+        self.assertEqual(bench.significance(bench.mann_whitney(same, list(same))), '')
+        shifted = [value + 100 for value in same]
+        self.assertEqual(bench.significance(bench.mann_whitney(same, shifted)), '***')
+        self.assertEqual(bench.significance(0.03), '*')
+
+    def test_measure_calibrates_loops(self):
+        """
+        TC003：验证循环次数经过校准，使每个样本至少运行 min_time
+        """
+        result = bench.measure('noop', lambda: None, repeat=5, min_time=0.001, warmup=0)
+        self.assertGreater(result.loops, 1)
+        self.assertGreater(result.median, 0)
+        self.assertEqual(len(result.samples) + result.rejected, 5)
+
+    def test_run_save_load_and_compare(self):
+        """
+        TC004：验证运行结果写入带版本的 JSON 文件，并能比较两次结果
+        给定：两次运行 Hello.add 基准
+        当：保存、读取并比较时
+        则：比较结果包含该基准的变化率与 p 值
+        """
+        first = bench.run(['Hello.add'], repeat=5, min_time=0.001, warmup=0)
+        second = bench.run(['Hello.add'], repeat=5, min_time=0.001, warmup=0)
+        self.assertEqual(list(first['benchmarks']), ['Hello.add'])
+        self.assertEqual(first['format_version'], bench.FORMAT_VERSION)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = bench.save(first, Path(tmp) / 'old.json')
+            rows = bench.compare(bench.load(path), second)
+            path.write_text('{"format_version": 0}', encoding='utf-8')
+            with self.assertRaises(ValueError):
+                bench.load(path)
+
+        name, _, _, _, p = rows[0]
+        self.assertEqual(name, 'Hello.add')
+        self.assertTrue(0 <= p <= 1)
+
+    def test_registered_lesson_targets(self):
+        """
+        TC005：验证课程热点函数已注册，且在 null 输出下可以调用
+        """
+        bench.run(['BankAccount'], repeat=1, min_time=0.0001, warmup=0)
+        for name in ('Hello.add', 'DataProcessor.process_batch[1000]', 'BankAccount.transfer[round trip]',
+                     'fibonacci[memoized, practical_examples]', 'regex.basic_regex'):
+            self.assertIn(name, bench.BENCHMARKS)
+        with self.assertRaises(ValueError):
+            bench.run(['no-such-benchmark'])
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Test eventlog"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.hello_world_python import eventlog, lessons
+from tests.helpers import NullOutputMixin
+
+
+class TestEventLog(NullOutputMixin, unittest.TestCase):
+    """Test 事件日志与重放"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        directory = Path(scratch.name)
+        self.path, self.checkpoint = directory / 'events.log', directory / 'events.ckpt'
+
+    def _numbers(self, accounts):
+        return [account.get_account_info()['account_number'] for account in accounts]
+
+    def _expected(self, accounts):
+        return {info['account_number']: self.bank.to_cents(info['balance'])
+                for info in (account.get_account_info() for account in accounts)}
+
+    def test_replay_rebuilds_balances(self):
+        """
+        TC001：验证存取款、转账和利息写入日志后，重放得到相同余额
+        """
+        first, second = self.bank.BankAccount('张三', 1000), self.bank.EnhancedBankAccount('李四', 500)
+        with eventlog.EventLog(self.path, buffer_events=2) as log:
+            log.attach(first)
+            log.attach(second)
+            first.deposit(250.5)
+            first.withdraw(100)
+            first.transfer(second, 300)
+            second.add_interest()
+            first.withdraw(10_000)  # 余额不足，不产生事件
+        result = eventlog.replay(self.path)
+        self.assertEqual(result.balances, self._expected([first, second]))
+        self.assertEqual(result.events, 6)
+
+    def test_checkpoint_resumes_replay(self):
+        """
+        TC002：验证从检查点继续重放只处理新事件，结果与完整重放一致
+        """
+        accounts = [self.bank.BankAccount(f'客户{i}', 100) for i in range(5)]
+        with eventlog.EventLog(self.path) as log:
+            for account in accounts:
+                log.attach(account)
+            accounts[0].transfer(accounts[1], 50)
+        first = eventlog.replay(self.path, self.checkpoint, checkpoint_every=1)
+        self.assertEqual(first.offset, 6)
+        with eventlog.EventLog(self.path) as log:
+            log.attach(accounts[2])
+            accounts[2].withdraw(30)
+        resumed = eventlog.replay(self.path, self.checkpoint)
+        self.assertEqual(resumed.events, 2)
+        self.assertEqual(resumed.balances, eventlog.replay(self.path).balances)
+        self.assertEqual(resumed.balances, self._expected(accounts))
+
+    def test_torn_tail_is_ignored_and_cut(self):
+        """
+        TC003：验证日志末尾的半条记录在重放时被忽略，重新打开时被截掉
+        """
+        account = self.bank.BankAccount('张三', 100)
+        with eventlog.EventLog(self.path) as log:
+            log.attach(account)
+        with open(self.path, 'ab') as file:
+            file.write(b'\x01' * 10)
+        self.assertEqual(eventlog.replay(self.path).balances, self._expected([account]))
+        with eventlog.EventLog(self.path) as log:
+            log.attach(account)
+            account.deposit(1)
+        self.assertEqual(eventlog.replay(self.path).balances, self._expected([account]))
+
+    def test_rejects_foreign_files(self):
+        """
+        TC004：验证非日志文件和非检查点文件抛出 ValueError
+        """
+        self.path.write_bytes(b'x' * 64)
+        with self.assertRaises(ValueError):
+            eventlog.EventLog(self.path)
+        with self.assertRaises(ValueError):
+            eventlog.replay(self.path)
+        self.checkpoint.write_bytes(b'x')
+        with self.assertRaises(ValueError):
+            eventlog.read_checkpoint(self.checkpoint)
+
+    def test_transfer_into_attached_account(self):
+        """
+        TC005：验证从未记录的账户转入已记录账户时，重放得到转入方的余额
+        """
+        outsider, account = self.bank.BankAccount('外部', 100), self.bank.BankAccount('李四', 100)
+        with eventlog.EventLog(self.path) as log:
+            log.attach(account)
+            outsider.transfer(account, 40)
+        result = eventlog.replay(self.path)
+        self.assertEqual(result.balances, self._expected([account]))
+        self.assertEqual(result.balances[self._numbers([account])[0]], 14000)
+
+    def test_transfer_out_of_attached_account(self):
+        """
+        TC006：验证从已记录账户转给未记录账户时，重放不为转入方虚构余额
+        """
+        account, outsider = self.bank.BankAccount('张三', 100), self.bank.BankAccount('外部', 500)
+        with eventlog.EventLog(self.path) as log:
+            log.attach(account)
+            account.transfer(outsider, 40)
+        self.assertEqual(eventlog.replay(self.path).balances, self._expected([account]))
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Test footprint"""
+import unittest
+
+from src.hello_world_python import footprint
+
+
+class TestFootprint(unittest.TestCase):
+    """Test 实例内存占用"""
+
+    def test_domain_classes_have_no_instance_dict(self):
+        """
+        TC001：验证所有领域类的实例都没有 __dict__，且属性照常读写
+        """
+        for name, (factory, args) in footprint.TARGETS.items():
+            with self.subTest(name=name):
+                instance = factory()(*args)
+                self.assertFalse(hasattr(instance, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    instance.undeclared = 1
+
+    def test_slotted_classes_keep_their_api(self):
+        """
+        TC002：验证加入 __slots__ 后方法行为不变
+        """
+        square = footprint.TARGETS['Square'][0]()(6)
+        self.assertEqual((square.area(), square.perimeter()), (36, 24))
+        self.assertEqual(square.describe(), '这是一个正方形，边长: 6')
+        dog = footprint.TARGETS['inheritance.Dog'][0]()('旺财', '金毛')
+        dog.energy -= 10
+        self.assertIn('品种: 金毛', dog.get_info())
+        self.assertIn('精力: 90', dog.get_info())
+
+    def test_dict_variant_is_larger(self):
+        """
+        TC003：验证 __dict__ 对照类每个实例占用更多内存，且保持同名
+        """
+        result = footprint.measure('Car', count=2000)
+        self.assertLess(result.bytes, result.dict_bytes)
+        self.assertGreater(result.saving, 0)
+        self.assertGreater(result.per_second, 0)
+        cls = footprint.TARGETS['Car'][0]()
+        self.assertEqual(footprint.dict_variant(cls).__name__, 'Car')
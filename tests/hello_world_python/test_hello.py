@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """Test hello"""
+import io
 import unittest
+from array import array
 from unittest.mock import patch
 
-from src.hello_world_python.hello import Hello
+from src.hello_world_python import hello
+from src.hello_world_python.hello import GreetingRenderer, Hello
+
+INT64_MAX = 2 ** 63 - 1
 
 
 class TestHello(unittest.TestCase):
@@ -84,4 +89,96 @@ class TestHello(unittest.TestCase):
         则：应返回0
         """
         result = Hello.add(0, 0)
-        self.assertEqual(result, 0)
\ No newline at end of file
+        self.assertEqual(result, 0)
+
+    @patch('src.hello_world_python.hello._numpy', return_value=None)
+    def test_add_many_returns_int64_array_of_sums(self, _):
+        """
+        TC008：验证批量相加返回紧凑的 int64 数组（纯 Python 实现）
+        给定：列表、array.array 和 bytes 三种输入
+        当：调用add_many方法
+        则：应返回 array('q')，且每一项等于 add 的结果
+        """
+        result = Hello.add_many([1, -2, 3], array('q', [10, 20, -30]))
+        self.assertEqual(result, array('q', [11, 18, -27]))
+        self.assertEqual(Hello.add_many(b'\x01\x02', [3, 4]), array('q', [4, 6]))
+
+    @patch('src.hello_world_python.hello._numpy', return_value=None)
+    def test_add_many_overflow_modes(self, _):
+        """
+        TC009：验证溢出语义
+        给定：和超出 int64 范围的输入
+        当：overflow='raise' 时
+        则：应抛出 OverflowError；overflow='wrap' 时按补码回绕
+        """
+        with self.assertRaises(OverflowError):
+            Hello.add_many([INT64_MAX], [1])
+        self.assertEqual(Hello.add_many([INT64_MAX, -INT64_MAX - 1], [1, -1], overflow='wrap'),
+                         array('q', [-INT64_MAX - 1, INT64_MAX]))
+
+    def test_add_many_rejects_bad_arguments(self):
+        """
+        TC010：验证长度不一致或溢出模式无效时抛出 ValueError
+        """
+        with self.assertRaises(ValueError):
+            Hello.add_many([1, 2], [1])
+        with self.assertRaises(ValueError):
+            Hello.add_many([1], [1], overflow='saturate')
+
+    @unittest.skipIf(hello._numpy() is None, 'numpy is not installed')
+    def test_add_many_numpy_matches_pure_python(self):
+        """
+        TC011：验证 numpy 加速结果与纯 Python 实现一致
+        """
+        a = array('q', [INT64_MAX, 5, -7])
+        b = array('q', [1, 6, -8])
+        with patch('src.hello_world_python.hello._numpy', return_value=None):
+            expected = Hello.add_many(a, b, overflow='wrap')
+        self.assertEqual(Hello.add_many(a, b, overflow='wrap'), expected)
+        with self.assertRaises(OverflowError):
+            Hello.add_many(a, b)
+
+    def test_say_hello_many_writes_to_text_sink(self):
+        """
+        TC012：验证批量问候写入文本输出，内容与逐个 say_hello 一致
+        给定：三个名称和一个 StringIO
+        当：调用say_hello_many方法
+        则：应写入三行问候，并返回行数统计
+        """
+        sink = io.StringIO()
+        stats = Hello.say_hello_many(['John', 'Jane', 42], sink)
+
+        self.assertEqual(sink.getvalue(), 'hello, John\nhello, Jane\nhello, 42\n')
+        self.assertEqual(stats.lines, 3)
+        self.assertEqual(stats.size, len(sink.getvalue()))
+
+    def test_say_hello_many_writes_encoded_bytes_to_binary_sink(self):
+        """
+        TC013：验证二进制输出按编码写入字节
+        """
+        sink = io.BytesIO()
+        Hello.say_hello_many(['张三'], sink)
+        self.assertEqual(sink.getvalue(), 'hello, 张三\n'.encode('utf-8'))
+
+    def test_renderer_flushes_at_threshold(self):
+        """
+        TC014：验证达到阈值时才写入，写入次数远少于行数
+        给定：100 个名称、每批 10 个、阈值 50 字节
+        当：渲染时
+        则：每批写入一次，共 10 次，且缓冲区可重复使用
+        """
+        sink = io.BytesIO()
+        renderer = GreetingRenderer(sink, flush_threshold=50, batch_size=10)
+        stats = renderer.render(f'n{i:02d}' for i in range(100))
+
+        self.assertEqual(stats.flushes, 10)
+        self.assertEqual(sink.getvalue().count(b'\n'), 100)
+        renderer.render(['again'])
+        self.assertTrue(sink.getvalue().endswith(b'n99\nhello, again\n'))
+
+    def test_renderer_rejects_non_positive_threshold(self):
+        """
+        TC015：验证阈值非正时抛出 ValueError
+        """
+        with self.assertRaises(ValueError):
+            GreetingRenderer(io.StringIO(), flush_threshold=0)
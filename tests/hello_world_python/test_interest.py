@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Test interest"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from decimal import ROUND_HALF_UP, Decimal
+from unittest.mock import patch
+
+from src.hello_world_python import interest, lessons
+
+
+class TestInterest(unittest.TestCase):
+    """Test 批量计息"""
+
+    def setUp(self):
+        self.bank = lessons.load('oop.encapsulation')
+
+    def test_interest_matches_decimal_rounding(self):
+        """
+        TC001：验证整数分计算的利息与 Decimal 四舍五入结果一致
+        """
+        balances = [0, 1, 25, 75, 125, 100005, 123456789, -500]
+        rates = [interest.rate_to_ppm(0.02)] * len(balances)
+        expected = [int((Decimal(max(b, 0)) * Decimal('0.02')).quantize(Decimal(1), ROUND_HALF_UP))
+                    for b in balances]
+        with patch('src.hello_world_python.interest._numpy', return_value=None):
+            self.assertEqual(list(interest.interest_cents(balances, rates)), expected)
+
+    def test_accrue_books_interest_without_printing(self):
+        """
+        TC002：验证批量计息更新余额、按利息类型记账且不打印
+        """
+        accounts = [self.bank.EnhancedBankAccount(f'客户{i}', 1000 + i) for i in range(100)]
+        accounts.append(self.bank.EnhancedBankAccount('零余额', 0))
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            result = interest.accrue(accounts, timestamp=1.0)
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertEqual(result.credited, 100)
+        self.assertEqual(accounts[1].get_balance(), 1021.02)
+        self.assertEqual(accounts[1].get_transaction_history(), ['利息: +20.02'])
+        self.assertEqual(result.total_cents,
+                         sum(account.get_ledger().sum_cents([self.bank.INTEREST]) for account in accounts))
+        self.assertEqual(result.interest[-1], 0)
+
+    def test_accrue_with_explicit_rate(self):
+        """
+        TC003：验证指定统一利率时普通账户也可以计息
+        """
+        account = self.bank.BankAccount('张三', 1000)
+        interest.accrue([account], rate=0.015)
+        self.assertEqual(account.get_balance(), 1015)
+
+    @unittest.skipIf(interest._numpy() is None, 'numpy is not installed')
+    def test_numpy_matches_pure_python(self):
+        """
+        TC004：验证 numpy 加速结果与纯 Python 实现一致
+        """
+        balances = list(range(-50, 100000, 37))
+        rates = [interest.rate_to_ppm(0.0125)] * len(balances)
+        fast = interest.interest_cents(balances, rates)
+        with patch('src.hello_world_python.interest._numpy', return_value=None):
+            self.assertEqual(fast, interest.interest_cents(balances, rates))
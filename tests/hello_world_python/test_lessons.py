@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Test lessons"""
+import sys
+import types
+import unittest
+
+from src.hello_world_python import lessons
+
+
+class TestLessons(unittest.TestCase):
+    """Test 课程注册表的功能"""
+
+    def test_index_maps_numbered_files_to_valid_names(self):
+        """
+        TC001：验证以数字开头的课程文件被映射为合法的导入名
+        给定：src/05_concurrency/01_threading_examples.py
+        当：查询课程索引时
+        则：应以 concurrency.threading_examples 为名出现，且所有名称均为合法标识符
+        """
+        index = lessons.lesson_index()
+        self.assertEqual(index['concurrency.threading_examples'].name, '01_threading_examples.py')
+        for name in index:
+            self.assertTrue(all(part.isidentifier() for part in name.split('.')), name)
+
+    def test_iter_lessons_keeps_learning_order(self):
+        """
+        TC002：验证课程按目录编号顺序排列，且不包含主题包本身
+        """
+        names = list(lessons.iter_lessons())
+        self.assertEqual(names[0], 'basics.basic_syntax')
+        self.assertNotIn('basics', names)
+        self.assertLess(names.index('oop.polymorphism'), names.index('concurrency.threading_examples'))
+
+    def test_load_is_lazy_until_attribute_access(self):
+        """
+        TC003：验证课程模块在首次访问属性时才执行
+        给定：一个课程名
+        当：调用 load 时
+        则：返回尚未执行的惰性模块，访问属性后变为普通模块
+        """
+        sys.modules.pop(f'{lessons.__name__}.oop.class_definition', None)
+        module = lessons.load('oop.class_definition')
+        self.assertIsNot(type(module), types.ModuleType)
+
+        self.assertTrue(callable(module.class_demo))
+        self.assertIs(type(module), types.ModuleType)
+
+    def test_attribute_access_on_topics(self):
+        """
+        TC004：验证可以通过主题属性访问课程模块
+        """
+        self.assertEqual(lessons.oop.polymorphism.Circle(1).perimeter(), lessons.oop.polymorphism.math.tau)
+        self.assertIn('oop', dir(lessons))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """
+        TC005：验证访问不存在的课程时抛出 AttributeError
+        """
+        with self.assertRaises(AttributeError):
+            lessons.no_such_topic  # pylint: disable=pointless-statement
+        self.assertIsNone(lessons.lesson_spec('basics.no_such_lesson'))
+
+    def test_spec_is_cached(self):
+        """
+        TC006：验证模块 spec 被缓存，重复查询不会重新创建
+        """
+        self.assertIs(lessons.lesson_spec('basics.operators'), lessons.lesson_spec('basics.operators'))
+
+    def test_reload_after_execution_is_lazy(self):
+        """
+        TC007：验证课程执行过一次后，再次导入仍得到惰性模块
+        """
+        name = f'{lessons.__name__}.oop.class_definition'
+        lessons.load('oop.class_definition').class_demo  # pylint: disable=expression-not-assigned
+        sys.modules.pop(name, None)
+        module = lessons.load('oop.class_definition')
+        self.assertIsNot(type(module), types.ModuleType)
+        self.assertTrue(callable(module.class_demo))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test output"""
+import ast
+import contextlib
+import io
+import unittest
+from unittest.mock import MagicMock
+
+from src.hello_world_python import lessons, output, runner
+
+
+def _capture(mode, func):
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), output.use(mode):
+        func()
+    return buffer.getvalue()
+
+
+class TestOutput(unittest.TestCase):
+    """Test 可插拔的演示输出"""
+
+    def test_null_mode_skips_argument_evaluation(self):
+        """
+        TC001：验证 null 模式下被保护的 print 语句不会计算参数
+        给定：一段 print 参数带副作用的代码
+        当：在 null 模式下执行
+        则：副作用不会发生；在 terminal 模式下正常发生
+        """
+        tree = output.guard_prints(ast.parse('print(f"{probe()}")'))
+        code = compile(tree, '<test>', 'exec')
+        probe = MagicMock(return_value='x')
+        namespace = {'probe': probe}
+        output.bind(namespace)
+
+        self.assertEqual(_capture('null', lambda: exec(code, namespace)), '')
+        probe.assert_not_called()
+        self.assertEqual(_capture('terminal', lambda: exec(code, namespace)), 'x\n')
+        probe.assert_called_once_with()
+
+    def test_buffered_mode_writes_once_on_exit(self):
+        """
+        TC002：验证 buffered 模式收集输出并在退出时一次写出
+        """
+        stdout = MagicMock()
+        with contextlib.redirect_stdout(stdout), output.use('buffered'):
+            output.router.print('a', 1, sep='-')
+            output.router.print('b', end='')
+            output.router.print('c', 2, sep='')
+            stdout.write.assert_not_called()
+        stdout.write.assert_called_once_with('a-1\nbc2\n')
+
+    def test_buffered_mode_flushes_at_limit(self):
+        """
+        TC003：验证超过上限时提前写出
+        """
+        sink = output.BufferedOutput(limit=4)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            sink.print('abc')
+            self.assertEqual(stdout.getvalue(), 'abc\n')
+
+    def test_lesson_output_follows_mode(self):
+        """
+        TC004：验证通过注册表加载的课程使用当前输出模式，且恢复原模式
+        """
+        demo = lessons.load('oop.polymorphism').polymorphism_demo
+        terminal = _capture('terminal', demo)
+
+        self.assertIn('所有形状的总面积: 107.27', terminal)
+        self.assertEqual(_capture('buffered', demo), terminal)
+        self.assertEqual(_capture('null', demo), '')
+        self.assertIsInstance(output.router.sink, output.TerminalOutput)
+
+    def test_runner_output_mode(self):
+        """
+        TC005：验证运行器的 null 模式不产生输出
+        """
+        self.assertEqual(runner.run_demo('oop.abstraction', 'processor_demo', output_mode='null').output, '')
+        with self.assertRaises(ValueError):
+            output.make('loud')
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Test profiling"""
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from src.hello_world_python import profiling, runner
+
+
+def _allocate():
+    return [str(i) for i in range(10000)]
+
+
+class TestProfiling(unittest.TestCase):
+    """Test 单个演示的性能分析"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_profile_call_writes_three_reports(self):
+        """
+        TC001：验证生成 cProfile 数据、热点表和内存分配差异
+        给定：一个分配大量字符串的函数
+        当：调用profile_call时
+        则：三个报告文件存在，热点表包含该函数，分配差异指向本文件
+        """
+        report = profiling.profile_call(_allocate, self.out_dir, 'demo', top=5)
+
+        self.assertGreater(pstats.Stats(str(report.stats_path)).total_calls, 0)
+        self.assertIn('_allocate', report.hotspots_path.read_text(encoding='utf-8'))
+        self.assertIn('test_profiling.py', report.allocations_path.read_text(encoding='utf-8'))
+        self.assertGreater(report.peak_bytes, 10000)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_run_demo_profiles_only_when_requested(self):
+        """
+        TC002：验证运行器只在指定目录时进行分析
+        """
+        plain = runner.run_demo('oop.abstraction', 'processor_demo')
+        self.assertNotIn('性能分析', plain.output)
+        self.assertEqual(list(self.out_dir.iterdir()), [])
+
+        profiled = runner.run_demo('oop.abstraction', 'processor_demo', profile_dir=str(self.out_dir))
+        self.assertIsNone(profiled.error)
+        self.assertIn('性能分析', profiled.output)
+        self.assertTrue((self.out_dir / 'oop.abstraction.processor_demo.prof').exists())
+
+    def test_run_demo_keeps_relative_profile_dir(self):
+        """
+        TC003：验证直接调用 run_demo 时相对目录按当前目录解析，报告不会随临时目录删除
+        """
+        cwd = os.getcwd()
+        os.chdir(self.out_dir)
+        self.addCleanup(os.chdir, cwd)
+        result = runner.run_demo('oop.abstraction', 'processor_demo', profile_dir='reports')
+        self.assertIsNone(result.error)
+        self.assertTrue((self.out_dir / 'reports' / 'oop.abstraction.processor_demo.prof').exists())
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Test registry"""
+import unittest
+
+from src.hello_world_python import lessons, registry
+from tests.helpers import NullOutputMixin
+
+
+class TestAccountRegistry(NullOutputMixin, unittest.TestCase):
+    """Test 账户注册表"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+
+    def test_numbers_are_unique(self):
+        """
+        TC001：验证大量开户时账户号码不重复，且与直接创建的账户也不冲突
+        """
+        first, second = registry.AccountRegistry(block=64), registry.AccountRegistry(block=64)
+        numbers = set()
+        for i in range(500):
+            for target in (first, second):
+                numbers.add(target.open(f'客户{i}').get_account_info()['account_number'])
+            numbers.add(self.bank.BankAccount(f'散户{i}')._account_number)
+        self.assertEqual(len(numbers), 1500)
+
+    def test_lookup_by_number_and_holder(self):
+        """
+        TC002：验证按号码和持有人查找账户，持有人的账户按开户顺序返回
+        """
+        accounts = registry.AccountRegistry(block=4)
+        opened = [accounts.open(holder, 100) for holder in ('张三', '李四', '张三', '王五', '张三', '李四')]
+        for account in opened:
+            self.assertIs(accounts.get(account.get_account_info()['account_number']), account)
+        self.assertEqual(accounts.by_holder('张三'), [opened[0], opened[2], opened[4]])
+        self.assertEqual(accounts.by_holder('赵六'), [])
+        self.assertIsNone(accounts.get('ACC000001'))
+        self.assertNotIn('无效号码', accounts)
+        self.assertEqual(len(accounts), 6)
+
+    def test_add_existing_accounts(self):
+        """
+        TC003：验证登记已有账户（含增强版），重复号码抛出 ValueError
+        """
+        accounts = registry.AccountRegistry()
+        enhanced = accounts.open('王五', 2000, account_class=self.bank.EnhancedBankAccount)
+        outside = accounts.add(self.bank.BankAccount('张三', account_number='旧号码-1'))
+        self.assertIsInstance(enhanced, self.bank.EnhancedBankAccount)
+        self.assertIs(accounts.get('旧号码-1'), outside)
+        with self.assertRaises(ValueError):
+            accounts.add(outside)
+        self.assertEqual(list(accounts), [enhanced, outside])
+
+    def test_added_number_in_reserved_block_is_not_reissued(self):
+        """
+        TC004：验证登记的账户号码落在已预留的号段内时，开户会跳过该号码
+        """
+        accounts = registry.AccountRegistry(block=64)
+        first = accounts.open('张三')
+        start = self.bank.parse_account_number(first.get_account_info()['account_number'])
+        number = self.bank.format_account_number(start + 2)
+        restored = accounts.add(self.bank.BankAccount('李四', account_number=number))
+        opened = [accounts.open('王五'), accounts.open('王五')]
+        self.assertIs(accounts.get(number), restored)
+        self.assertEqual([account.get_account_info()['account_number'] for account in opened],
+                         [self.bank.format_account_number(start + offset) for offset in (1, 3)])
+        self.assertIs(accounts.get(self.bank.format_account_number(start + 3)), opened[1])
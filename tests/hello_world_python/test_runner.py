@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Test runner"""
+import io
+import os
+import unittest
+
+from src.hello_world_python import runner
+
+
+class TestRunner(unittest.TestCase):
+    """Test 并行演示运行器的功能"""
+
+    def test_demo_names_follow_main_block(self):
+        """
+        TC001：验证从 __main__ 块中按调用顺序找到无参演示函数
+        给定：threading_examples 课程
+        当：解析演示函数时
+        则：应按 __main__ 中的顺序返回四个演示
+        """
+        self.assertEqual(runner.demo_names('concurrency.threading_examples'),
+                         ('basic_threading', 'thread_synchronization', 'producer_consumer', 'thread_safe_counter'))
+
+    def test_demo_names_skip_calls_with_arguments(self):
+        """
+        TC002：验证带参数的调用不会被当作演示
+        """
+        demos = runner.demo_names('basics.functions')
+        self.assertIn('basic_function', demos)
+        self.assertNotIn('function_with_parameters', demos)
+
+    def test_resolve_topic_lesson_and_demo(self):
+        """
+        TC003：验证主题、课程和演示名都能展开为任务
+        """
+        self.assertEqual(runner.resolve(['oop.polymorphism']),
+                         [('oop.polymorphism', 'polymorphism_demo'),
+                          ('oop.polymorphism', 'advanced_polymorphism_demo')])
+        self.assertEqual(runner.resolve(['oop.abstraction.processor_demo']),
+                         [('oop.abstraction', 'processor_demo')])
+        topic = runner.resolve(['advanced'])
+        self.assertTrue(topic and all(lesson.startswith('advanced.') for lesson, _ in topic))
+        with self.assertRaises(ValueError):
+            runner.resolve(['no_such_lesson'])
+        with self.assertRaises(ValueError):
+            runner.resolve(['oop.polymorphism.nope'])
+
+    def test_run_demo_captures_output_in_scratch_directory(self):
+        """
+        TC004：验证演示的输出被单独捕获，且不会在当前目录留下文件
+        """
+        before = set(os.listdir())
+        result = runner.run_demo('data_processing.file_handling', 'basic_file_operations')
+        self.assertIsNone(result.error)
+        self.assertIn('Hello, Python!', result.output)
+        self.assertEqual(set(os.listdir()), before)
+
+    def test_run_reports_in_task_order(self):
+        """
+        TC005：验证并行运行后按任务顺序输出结果
+        """
+        out = io.StringIO()
+        tasks = runner.resolve(['oop.polymorphism', 'basics.operators'])
+        results = runner.run(tasks, jobs=2, out=out)
+
+        self.assertEqual([(result.lesson, result.demo) for result in results], tasks)
+        report = out.getvalue()
+        positions = [report.index(f'=== {result.name} ') for result in results]
+        self.assertEqual(positions, sorted(positions))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Test service"""
+import asyncio
+import unittest
+
+from src.hello_world_python import loadgen, service
+
+
+class TestHandle(unittest.TestCase):
+    """Test 请求处理函数"""
+
+    def test_hello_and_add(self):
+        """
+        TC001：验证问候和加法接口的返回值
+        """
+        self.assertEqual(service.handle('GET', '/hello?name=John'), (200, 'hello, John'))
+        self.assertEqual(service.handle('GET', '/add?a=2&b=-5'), (200, '-3'))
+
+    def test_bad_requests(self):
+        """
+        TC002：验证参数错误、路径不存在和方法不支持时的状态码
+        """
+        self.assertEqual(service.handle('GET', '/add?a=x&b=1')[0], 400)
+        self.assertEqual(service.handle('GET', '/nope')[0], 404)
+        self.assertEqual(service.handle('POST', '/hello')[0], 405)
+
+    def test_percentile(self):
+        """
+        TC003：验证最近秩百分位
+        """
+        values = list(range(1, 101))
+        self.assertEqual(loadgen.percentile(values, 50), 50)
+        self.assertEqual(loadgen.percentile(values, 99), 99)
+        self.assertEqual(loadgen.percentile([], 50), 0.0)
+
+
+class TestService(unittest.IsolatedAsyncioTestCase):
+    """Test 问候服务的连接处理"""
+
+    async def asyncSetUp(self):
+        self.server = await service.start_server(port=0)
+        self.port = service.server_port(self.server)
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_pipelined_requests_are_answered_in_order(self):
+        """
+        TC004：验证同一连接上流水线发送的请求按顺序应答，最后一个请求关闭连接
+        """
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write(b'GET /hello?name=a HTTP/1.1\r\n\r\n'
+                     b'GET /add?a=1&b=2 HTTP/1.1\r\n\r\n'
+                     b'GET /hello?name=b HTTP/1.1\r\nConnection: close\r\n\r\n')
+        data = await reader.read()
+        writer.close()
+
+        self.assertEqual(data.count(b'HTTP/1.1 200 OK'), 3)
+        bodies = [data.index(b'hello, a'), data.index(b'\r\n\r\n3'), data.index(b'hello, b')]
+        self.assertEqual(bodies, sorted(bodies))
+        self.assertTrue(data.endswith(b'Connection: close\r\n\r\nhello, b'))
+
+    async def test_malformed_request_gets_400(self):
+        """
+        TC005：验证请求行格式错误时返回 400 并关闭连接
+        """
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write(b'garbage\r\n\r\n')
+        data = await reader.read()
+        writer.close()
+        self.assertTrue(data.startswith(b'HTTP/1.1 400 Bad Request'))
+
+    async def test_measure_reports_all_requests(self):
+        """
+        TC006：验证压测客户端统计请求数、错误数和延迟
+        """
+        result = await loadgen.measure('127.0.0.1', self.port, concurrency=3, requests=100, pipeline=4)
+
+        self.assertEqual(result.requests, 100)
+        self.assertEqual(result.errors, 0)
+        self.assertEqual(len(result.latencies), 100)
+        self.assertLessEqual(result.p50, result.p99)
+        self.assertGreater(result.rps, 0)
+
+    async def test_bad_content_length(self):
+        """
+        TC007：验证负数 Content-Length 返回 400，超过上限返回 413，并关闭连接
+        """
+        for length, status in ((-5, b'400 Bad Request'), (service.MAX_BODY_SIZE + 1, b'413 Payload Too Large')):
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+            writer.write(b'GET /hello HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % length)
+            data = await reader.read()
+            writer.close()
+            self.assertTrue(data.startswith(b'HTTP/1.1 ' + status), data)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test shapes"""
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+from src.hello_world_python import lessons, shapes
+
+
+class TestShapeCollection(unittest.TestCase):
+    """Test 列式形状集合"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.polymorphism')
+        rng = random.Random(11)
+        self.objects = []
+        for _ in range(300):
+            x, y = rng.uniform(0.1, 50), rng.uniform(0.1, 50)
+            self.objects += [self.lesson.Rectangle(x, y), self.lesson.Square(x), self.lesson.Circle(y),
+                             self.lesson.Triangle(x, y, rng.uniform(abs(x - y) + 0.01, x + y - 0.01))]
+
+    def test_matches_object_api(self):
+        """
+        TC001：验证列式计算的面积、周长和总量与对象 API 在浮点误差内一致
+        """
+        collection = shapes.ShapeCollection(self.objects)
+        by_kind = {kind: [shape for shape in self.objects if type(shape).__name__ == kind] for kind in shapes.KINDS}
+        areas, perimeters = collection.areas(), collection.perimeters()
+        for kind in shapes.KINDS:
+            for shape, area, perimeter in zip(by_kind[kind], areas[kind], perimeters[kind]):
+                self.assertAlmostEqual(area, shape.area(), delta=1e-9 * max(1.0, shape.area()))
+                self.assertAlmostEqual(perimeter, shape.perimeter(), delta=1e-9 * shape.perimeter())
+        self.assertTrue(math.isclose(collection.total_area(), sum(s.area() for s in self.objects), rel_tol=1e-12))
+        self.assertTrue(math.isclose(collection.total_perimeter(), sum(s.perimeter() for s in self.objects),
+                                     rel_tol=1e-12))
+        self.assertEqual(len(collection), len(self.objects))
+
+    def test_pure_python_path(self):
+        """
+        TC002：验证没有 numpy 时结果相同
+        """
+        collection = shapes.ShapeCollection(self.objects)
+        expected = collection.total_area()
+        with patch('src.hello_world_python.shapes._numpy', return_value=None):
+            self.assertTrue(math.isclose(collection.total_area(), expected, rel_tol=1e-12))
+
+    def test_bulk_columns_and_other_shapes(self):
+        """
+        TC003：验证按列批量添加、其他形状走对象方法、非法三角形整批拒绝
+        """
+        class Hexagon(self.lesson.Shape):
+            __slots__ = ()
+
+            def area(self):
+                return 10.0
+
+            def perimeter(self):
+                return 6.0
+        collection = shapes.ShapeCollection([Hexagon()])
+        collection.add_rectangles([1, 2], [3, 4])
+        collection.add_circles([1])
+        with self.assertRaises(ValueError):
+            collection.add_triangles([3, 1], [4, 1], [5, 3])
+        with self.assertRaises(ValueError):
+            collection.add_rectangles([1], [1, 2])
+        self.assertEqual(collection.counts(), {'Rectangle': 2, 'Square': 0, 'Circle': 1, 'Triangle': 0, 'others': 1})
+        self.assertAlmostEqual(collection.total_area(), 3 + 8 + math.pi + 10)
+        self.assertEqual([type(shape).__name__ for shape in collection], ['Rectangle', 'Rectangle', 'Circle', 'Hexagon'])
+
+    def test_lenient_triangles(self):
+        """
+        TC004：验证非严格模式只加入合法行并返回被拒绝的行号，近退化三角形面积精确
+        """
+        collection = shapes.ShapeCollection()
+        rejected = collection.add_triangles([3, 1, 100000, 0], [4, 1, 99999.99979, 1], [5, 3, 0.00029, 1],
+                                            strict=False)
+        self.assertEqual(list(rejected), [1, 3])
+        self.assertEqual(list(collection.a), [3, 100000])
+        self.assertEqual(list(shapes.triangle_mask([3, 1], [4, 1], [5, 3])), [1, 0])
+        self.assertAlmostEqual(collection.areas()['Triangle'][1], 10.000000077021038, delta=1e-12)
+        self.assertEqual(list(shapes.heron([3, 6], [4, 8], [5, 10])), [6.0, 24.0])
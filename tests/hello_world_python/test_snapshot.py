@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test snapshot"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.hello_world_python import lessons, snapshot
+from tests.helpers import NullOutputMixin
+
+
+class TestSnapshot(NullOutputMixin, unittest.TestCase):
+    """Test 账户快照"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.path = Path(scratch.name) / 'accounts.snap'
+
+    def test_round_trip(self):
+        """
+        TC001：验证写入快照后可按号码查询余额并恢复出相同的账户
+        给定：普通账户和增强版账户混合的账户集合
+        当：写入快照并通过 mmap 打开时
+        则：未构造对象即可查询余额，恢复后的持有人、余额和利率一致
+        """
+        accounts = [self.bank.BankAccount(f'客户{i}', 100 + i) for i in range(50)]
+        accounts.append(self.bank.EnhancedBankAccount('王五', 2000.5, interest_rate=0.035))
+        self.assertEqual(snapshot.write(self.path, reversed(accounts)), 51)
+        with snapshot.Snapshot(self.path) as snap:
+            number = accounts[17].get_account_info()['account_number']
+            self.assertEqual(snap.get_balance(number), 117)
+            self.assertEqual(snap._accounts, {})
+            restored = {account.get_account_info()['account_number']: account for account in snap.restore()}
+        for account in accounts:
+            info = account.get_account_info()
+            self.assertEqual(restored[info['account_number']].get_account_info(), info)
+        enhanced = restored[accounts[-1].get_account_info()['account_number']]
+        self.assertEqual(enhanced.get_interest_rate(), 0.035)
+        self.assertEqual(enhanced.get_balance(), 2000.5)
+
+    def test_lookup_misses_and_lazy_accounts(self):
+        """
+        TC002：验证查询不存在的号码抛出 KeyError，单个账户按需构造并缓存
+        """
+        accounts = [self.bank.BankAccount('张三', 10), self.bank.BankAccount('李四', 20)]
+        snapshot.write(self.path, accounts)
+        with snapshot.Snapshot(self.path) as snap:
+            with self.assertRaises(KeyError):
+                snap.get_balance('ACC000001')
+            self.assertEqual(snap.find('不存在'), -1)
+            number = accounts[1].get_account_info()['account_number']
+            account = snap.account(number)
+            self.assertIs(snap.account(number), account)
+            account.deposit(5)
+            self.assertEqual(snap.get_balance(number), 25)
+            self.assertEqual(len(snap), 2)
+
+    def test_new_numbers_do_not_collide_with_restored(self):
+        """
+        TC003：验证恢复快照后新开账户的号码大于快照中的最大号码
+        """
+        snapshot.write(self.path, [self.bank.BankAccount('张三', 0, account_number='ACC9000000')])
+        with snapshot.Snapshot(self.path) as snap:
+            snap.restore()
+            self.assertEqual(snap.highest_number, 9000000)
+        fresh = self.bank.BankAccount('李四')
+        self.assertGreater(self.bank.parse_account_number(fresh._account_number), 9000000)
+
+    def test_invalid_files_and_fields(self):
+        """
+        TC004：验证非快照文件、重复号码和超长持有人名称抛出 ValueError
+        """
+        self.path.write_bytes(b'not a snapshot')
+        with self.assertRaises(ValueError):
+            snapshot.Snapshot(self.path)
+        account = self.bank.BankAccount('张三')
+        with self.assertRaises(ValueError):
+            snapshot.write(self.path, [account, account])
+        with self.assertRaises(ValueError):
+            snapshot.write(self.path, [self.bank.BankAccount('长' * 30)])
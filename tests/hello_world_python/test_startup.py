@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Test startup"""
+import unittest
+
+from src.hello_world_python import startup
+
+IMPORTTIME = '''import time: self [us] | cumulative | imported package
+import time:       100 |        100 | _before
+--- lesson import ---
+import time:       300 |        300 |   _csv
+import time:       900 |       1200 | csv
+import time:        50 |         50 | json
+'''
+
+
+class TestStartup(unittest.TestCase):
+    """Test 启动与导入基准"""
+
+    def test_parse_importtime_only_after_marker(self):
+        """
+        TC001：验证只统计标记之后的导入，并按自身耗时排序
+        """
+        self.assertEqual(startup.parse_importtime(IMPORTTIME),
+                         [['csv', 900, 1200], ['_csv', 300, 300], ['json', 50, 50]])
+        self.assertEqual(startup.parse_importtime('import time: 1 | 1 | x'), [])
+
+    def test_compare_flags_regressions_beyond_threshold_and_floor(self):
+        """
+        TC002：验证超过相对阈值且超过绝对下限的指标才算退化
+        给定：import_ms 从 10 增加到 15，process_ms 从 0.1 增加到 0.5
+        当：阈值为 20% 时
+        则：只有 import_ms 被标记为退化
+        """
+        baseline = {'modules': {'a.b': {'import_ms': 10.0, 'process_ms': 0.1, 'first_call_ms': {'demo': 5.0}}}}
+        current = {'modules': {'a.b': {'import_ms': 15.0, 'process_ms': 0.5, 'first_call_ms': {'demo': 5.5}},
+                               'new.lesson': {'import_ms': 99.0, 'first_call_ms': {}}}}
+
+        regressions = startup.compare(current, baseline, threshold=0.2)
+
+        self.assertEqual([(name, metric) for name, metric, *_ in regressions], [('a.b', 'import_ms')])
+        self.assertEqual(startup.compare(current, baseline, threshold=1.0), [])
+
+    def test_measure_lesson_in_fresh_interpreter(self):
+        """
+        TC003：验证在新解释器中测量课程的导入、首次调用和峰值内存
+        """
+        record = startup.measure('data_processing.file_handling', ['path_operations'])
+
+        self.assertGreater(record['import_ms'], 0)
+        self.assertIn('path_operations', record['first_call_ms'])
+        self.assertGreater(record['process_ms'], record['import_ms'])
+        self.assertTrue(any(name == 'csv' for name, *_ in record['imports']))
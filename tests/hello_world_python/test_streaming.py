@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Test streaming"""
+import pickle
+import random
+import unittest
+import warnings
+from unittest.mock import patch
+
+from src.hello_world_python import lessons, streaming
+
+
+class TestAreaQuery(unittest.TestCase):
+    """Test 面积的流式 Top-K 与分位数"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.polymorphism')
+        rng = random.Random(5)
+        self.shapes = []
+        for _ in range(5000):
+            x, y = rng.uniform(0.1, 50), rng.uniform(0.1, 50)
+            self.shapes += [self.lesson.Rectangle(x, y), self.lesson.Circle(y),
+                            self.lesson.Triangle(x, y, rng.uniform(abs(x - y) + 0.01, x + y - 0.01))]
+        self.areas = sorted(shape.area() for shape in self.shapes)
+
+    def test_top_k(self):
+        """
+        TC001：验证流式 Top-K 与完整排序结果一致，且只保留 k 个元素
+        """
+        query = streaming.AreaQuery(k=100)
+        query.extend(iter(self.shapes))
+        largest = query.largest()
+        self.assertEqual(len(query.top), 100)
+        self.assertEqual([area for area, _ in largest], self.areas[::-1][:100])
+        self.assertTrue(all(shape.area() == area for area, shape in largest))
+
+    def test_quantiles_within_accuracy(self):
+        """
+        TC002：验证分位数与精确值的相对误差不超过设定精度
+        """
+        query = streaming.AreaQuery(accuracy=0.01)
+        query.extend(self.shapes)
+        self.assertEqual(len(query), len(self.shapes))
+        for q in (0, 0.01, 0.25, 0.5, 0.9, 0.99, 1):
+            exact = self.areas[round(q * (len(self.areas) - 1))]
+            self.assertLessEqual(abs(query.quantile(q) - exact), 0.01 * exact, q)
+        self.assertEqual(query.percentile(50), query.quantile(0.5))
+
+    def test_merge_shards(self):
+        """
+        TC003：验证分片经 pickle 传输后合并，结果与整体处理相同
+        """
+        whole = streaming.AreaQuery(k=10)
+        whole.extend(self.shapes)
+        merged = streaming.AreaQuery(k=10)
+        for start in range(0, len(self.shapes), 4000):
+            shard = streaming.AreaQuery(k=10)
+            shard.extend(self.shapes[start:start + 4000])
+            merged.merge(pickle.loads(pickle.dumps(shard)))
+        self.assertEqual([area for area, _ in merged.largest()], [area for area, _ in whole.largest()])
+        for q in (0.1, 0.5, 0.95):
+            self.assertEqual(merged.quantile(q), whole.quantile(q))
+        with self.assertRaises(ValueError):
+            merged.sketch.merge(streaming.QuantileSketch(accuracy=0.05))
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')  # pickling itertools objects is deprecated since 3.12
+            top = pickle.loads(pickle.dumps(merged.top))
+        self.assertEqual([area for area, _ in top.largest()], [area for area, _ in merged.largest()])
+
+    def test_sketch_edge_cases(self):
+        """
+        TC004：验证零值、负数、空草图以及桶数上限的处理
+        """
+        sketch = streaming.QuantileSketch(max_buckets=16)
+        with self.assertRaises(ValueError):
+            sketch.quantile(0.5)
+        sketch.add_many([0.0, 0.0, 1.0, 2.0])
+        self.assertEqual(sketch.quantile(0), 0.0)
+        with self.assertRaises(ValueError):
+            sketch.add_many([3.0, -1.0])
+        self.assertEqual(sketch.count, 4)
+        sketch.add_many(10.0 ** e for e in range(-6, 7))
+        self.assertLessEqual(len(sketch._buckets), 16)
+        self.assertEqual(sketch.quantile(1), 1e6)
+        with self.assertRaises(ValueError):
+            streaming.TopK(0)
+
+    @unittest.skipIf(streaming._numpy() is None, 'numpy is not installed')
+    def test_numpy_matches_pure_python(self):
+        """
+        TC005：验证 numpy 与纯 Python 分桶得到相同的草图
+        """
+        with_numpy = streaming.QuantileSketch()
+        with_numpy.add_many(self.areas + [0.0])
+        with patch('src.hello_world_python.streaming._numpy', return_value=None):
+            pure = streaming.QuantileSketch()
+            pure.add_many(self.areas + [0.0])
+        self.assertEqual(with_numpy._buckets, pure._buckets)
+        self.assertEqual(with_numpy.zeros, pure.zeros)
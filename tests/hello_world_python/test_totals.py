@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Test totals"""
+import math
+import unittest
+
+from src.hello_world_python import lessons, totals
+from src.hello_world_python.shapes import ShapeCollection
+
+
+class Hexagon(lessons.load('oop.polymorphism').Shape):
+    """模块级的自定义形状，可以被 pickle 送往工作进程"""
+
+    def area(self):
+        return 10.0
+
+    def perimeter(self):
+        return 6.0
+
+
+class TestShapeTotals(unittest.TestCase):
+    """Test 多进程形状汇总"""
+
+    def test_record_round_trip(self):
+        """
+        TC001：验证紧凑记录编码后再解码得到相同的列，切分覆盖全部形状
+        """
+        collection = totals.workload(1003)
+        copy = totals.decode(totals.encode(collection))
+        for name in totals.COLUMNS:
+            self.assertEqual(getattr(copy, name), getattr(collection, name))
+        parts = [totals.decode(totals.encode(collection, part, part + 1, 3)) for part in range(3)]
+        self.assertEqual(sum(map(len, parts)), 1003)
+        self.assertEqual(len(totals.encode(collection)), totals.COUNTS.size + 8 * sum(
+            len(getattr(collection, name)) for name in totals.COLUMNS))
+
+    def test_collection_total(self):
+        """
+        TC002：验证多进程汇总结果与单进程直接计算一致
+        """
+        collection = totals.workload(20_000)
+        collection.others.append(Hexagon())
+        result = totals.total(collection, workers=2, chunk_size=3000)
+        self.assertEqual(result.count, 20_001)
+        self.assertTrue(math.isclose(result.area, collection.total_area(), rel_tol=1e-12))
+        self.assertTrue(math.isclose(result.perimeter, collection.total_perimeter(), rel_tol=1e-12))
+
+    def test_object_total(self):
+        """
+        TC003：验证形状对象流按块编码后汇总正确，空输入返回零
+        """
+        lesson = lessons.load('oop.polymorphism')
+        objects = [lesson.Rectangle(2, 3), lesson.Square(4), lesson.Circle(1), lesson.Triangle(3, 4, 5), Hexagon()] * 7
+        result = totals.total(iter(objects), workers=2, chunk_size=4)
+        self.assertEqual(result.count, len(objects))
+        self.assertAlmostEqual(result.area, sum(shape.area() for shape in objects))
+        self.assertAlmostEqual(result.perimeter, sum(shape.perimeter() for shape in objects))
+        empty = totals.total(ShapeCollection(), workers=1)
+        self.assertEqual((empty.area, empty.count), (0.0, 0))
+        with self.assertRaises(ValueError):
+            totals.total(objects, chunk_size=0)
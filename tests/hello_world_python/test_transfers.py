@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Test transfers"""
+import sys
+import threading
+import unittest
+
+from src.hello_world_python import lessons, transfers
+from tests.helpers import NullOutputMixin
+
+
+class TestTransferEngine(NullOutputMixin, unittest.TestCase):
+    """Test 并发转账引擎"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # 频繁切换线程，放大竞争
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def test_stress_conserves_money(self):
+        """
+        TC001：验证多线程随机转账后总余额守恒且没有负余额
+        给定：50 个账户、20000 笔随机转账、8 个线程
+        当：批量执行时
+        则：总余额不变，成功笔数与账本记录一致
+        """
+        accounts = [self.bank.BankAccount(f'客户{i}', 100) for i in range(50)]
+        batch = transfers.random_transfers(accounts, 20000, max_amount=60, seed=7)
+        result = transfers.TransferEngine(workers=8, chunk_size=64).run_batch(batch)
+        self.assertEqual(sum(account.get_balance() for account in accounts), 5000)
+        self.assertTrue(all(account.get_balance() >= 0 for account in accounts))
+        recorded = sum(len(account.get_ledger()) for account in accounts)
+        self.assertEqual(recorded, 2 * result.succeeded)
+        self.assertEqual(len(result.applied), 20000)
+        self.assertGreater(result.transfers_per_second, 0)
+
+    def test_opposite_directions_do_not_deadlock(self):
+        """
+        TC002：验证两个线程反向对转时不会死锁
+        """
+        engine = transfers.TransferEngine()
+        first, second = self.bank.BankAccount('张三', 1000), self.bank.BankAccount('李四', 1000)
+
+        def shuttle(source, target):
+            for _ in range(5000):
+                engine.transfer(source, target, 1)
+        threads = [threading.Thread(target=shuttle, args=pair) for pair in ((first, second), (second, first))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(first.get_balance() + second.get_balance(), 2000)
+
+    def test_rejections_are_reported_in_order(self):
+        """
+        TC003：验证批量结果按提交顺序报告，自转账和余额不足被拒绝
+        """
+        first, second = self.bank.BankAccount('张三', 100), self.bank.BankAccount('李四', 0)
+        result = transfers.TransferEngine(workers=2, chunk_size=1).run_batch(
+            [(first, second, 50), (first, first, 10), (second, first, 500)])
+        self.assertEqual(result.applied, [True, False, False])
+        self.assertEqual(result.rejected, 2)
+
+    def test_invalid_settings(self):
+        """
+        TC004：验证线程数或分块大小非正时抛出 ValueError
+        """
+        with self.assertRaises(ValueError):
+            transfers.TransferEngine(workers=0)
+        with self.assertRaises(ValueError):
+            transfers.TransferEngine(chunk_size=0)
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""Test helpers"""
+import contextlib
+
+from src.hello_world_python import output
+
+
+class NullOutputMixin:
+    """Route ``output`` to the null sink for the duration of each test"""
+
+    def setUp(self):
+        super().setUp()
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
+        stack.enter_context(output.use('null'))
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Test abstraction lesson"""
+import asyncio
+import itertools
+import tracemalloc
+import unittest
+
+from src.hello_world_python import lessons
+
+
+class TestProcessBatch(unittest.TestCase):
+    """Test 分块与并行批处理"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.abstraction')
+        self.numbers = list(range(1000)) + [None, 'x', 2.5]
+        self.expected = [n ** 2 for n in range(1000)] + [0, 0, 6.25]
+
+    def test_modes_keep_order(self):
+        """
+        TC001：验证当前线程、线程池和进程池三种方式的结果与逐个处理一致且顺序不变
+        """
+        processor = self.lesson.NumberProcessor()
+        self.assertEqual(processor.process_batch(self.numbers), self.expected)
+        self.assertEqual(processor.process_batch(iter(self.numbers), chunk_size=7), self.expected)
+        self.assertEqual(processor.process_batch(self.numbers, mode='thread', workers=4, chunk_size=10),
+                         self.expected)
+        self.assertEqual(processor.process_batch(self.numbers, mode='process', workers=2, chunk_size=300),
+                         self.expected)
+        strings = self.lesson.StringProcessor().process_batch(['a', 1, 'bc'], mode='thread', chunk_size=1)
+        self.assertEqual(strings, ['A', '', 'BC'])
+        self.assertEqual(processor.process_batch([], mode='thread'), [])
+
+    def test_chunks_stream(self):
+        """
+        TC002：验证分块结果带起始下标产出，覆盖全部输入；非法参数报错
+        """
+        processor = self.lesson.NumberProcessor()
+        chunks = dict(processor.process_chunks(self.numbers, mode='thread', workers=3, chunk_size=100))
+        self.assertEqual(sorted(chunks), list(range(0, 1003, 100)))
+        self.assertEqual(chunks[1000], [0, 0, 6.25])
+        stream = processor.process_chunks(self.numbers, mode='thread', workers=1, chunk_size=10)
+        self.assertEqual(next(stream)[0], 0)
+        stream.close()
+        with self.assertRaises(ValueError):
+            processor.process_batch(self.numbers, mode='fiber')
+        with self.assertRaises(ValueError):
+            processor.process_batch(self.numbers, mode='thread', chunk_size=0)
+
+
+class TestProcessStream(unittest.TestCase):
+    """Test 流式处理与背压"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.abstraction')
+        self.processor = self.lesson.NumberProcessor()
+        self.consumed = 0
+
+    def _source(self):
+        """无限长的输入，记录被读取了多少个元素"""
+        for n in itertools.count():
+            self.consumed += 1
+            yield n
+
+    def test_stream_keeps_order(self):
+        """
+        TC003：验证三种方式的流式结果与输入顺序一致
+        """
+        expected = [n ** 2 for n in range(1000)]
+        for mode in ('inline', 'thread', 'process'):
+            stream = self.processor.process_stream(iter(range(1000)), mode=mode, workers=2, chunk_size=64,
+                                                   max_in_flight=256)
+            self.assertEqual(list(stream), expected, mode)
+        with self.assertRaises(ValueError):
+            next(self.processor.process_stream([1], chunk_size=8, max_in_flight=4))
+
+    def test_backpressure(self):
+        """
+        TC004：验证消费者不取结果时生产者不会继续读取，处理中的元素有上限
+        """
+        stream = self.processor.process_stream(self._source(), mode='thread', chunk_size=8, max_in_flight=32)
+        self.assertEqual(list(itertools.islice(stream, 10)), [n ** 2 for n in range(10)])
+        self.assertLessEqual(self.consumed, 10 + 32 + 8)
+        stream.close()
+
+    def test_async_stream(self):
+        """
+        TC005：验证异步版本接受普通和异步可迭代对象，结果有序且有背压
+        """
+        async def numbers():
+            for n in range(100):
+                yield n
+
+        async def collect(items, **kwargs):
+            return [result async for result in self.processor.aprocess_stream(items, **kwargs)]
+
+        expected = [n ** 2 for n in range(100)]
+        self.assertEqual(asyncio.run(collect(numbers(), chunk_size=7, max_in_flight=21)), expected)
+        self.assertEqual(asyncio.run(collect(range(100), mode='thread', workers=2, chunk_size=10)), expected)
+
+        async def first_ten():
+            stream = self.processor.aprocess_stream(self._source(), mode='thread', chunk_size=8, max_in_flight=32)
+            results = [result async for result in _take(stream, 10)]
+            await stream.aclose()
+            return results
+
+        async def _take(stream, count):
+            async for result in stream:
+                yield result
+                count -= 1
+                if not count:
+                    return
+
+        self.assertEqual(asyncio.run(first_ten()), expected[:10])
+        self.assertLessEqual(self.consumed, 10 + 32 + 8)
+
+    def test_memory_stays_flat(self):
+        """
+        TC006：验证输入长度增加 10 倍时峰值内存基本不变
+        """
+        def peak(count):
+            tracemalloc.start()
+            for _ in self.processor.process_stream(iter(range(count)), mode='thread', workers=2,
+                                                   chunk_size=256, max_in_flight=1024):
+                pass
+            _, high = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return high
+
+        small, large = peak(20_000), peak(200_000)
+        self.assertLess(large, 2 * small + 64 * 1024)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Test encapsulation lesson"""
+import random
+import unittest
+
+from src.hello_world_python import lessons
+from tests.helpers import NullOutputMixin
+
+
+class TestLedger(NullOutputMixin, unittest.TestCase):
+    """Test 银行账户的交易账本"""
+
+    def setUp(self):
+        super().setUp()
+        self.bank = lessons.load('oop.encapsulation')
+
+    def test_history_is_formatted_on_demand(self):
+        """
+        TC001：验证存取款和转账记录在查询时按原格式输出
+        """
+        first, second = self.bank.BankAccount('张三', 1000), self.bank.BankAccount('李四', 0)
+        first.deposit(500)
+        first.withdraw(200)
+        first.transfer(second, 300)
+        self.assertEqual(first.get_transaction_history(),
+                         ['存款: +500', '取款: -200', f'转出: -300 ({second._account_number})'])
+        self.assertEqual(second.get_transaction_history(), [f'转入: +300 ({first._account_number})'])
+        self.assertEqual((first.get_balance(), second.get_balance()), (1000, 300))
+
+    def test_columns_are_typed_arrays(self):
+        """
+        TC002：验证交易按列保存在 array 中，金额以分为单位
+        """
+        ledger = self.bank.Ledger()
+        ledger.append(self.bank.DEPOSIT, 1050, timestamp=1.0)
+        ledger.append(self.bank.TRANSFER_OUT, 25, 'ACC1', timestamp=2.0)
+        ledger.append(self.bank.TRANSFER_OUT, 25, 'ACC1', timestamp=3.0)
+        self.assertEqual(ledger._amounts.typecode, 'q')
+        self.assertEqual(list(ledger._parties), [-1, 0, 0])
+        self.assertEqual(ledger.entry(1), (self.bank.TRANSFER_OUT, 25, 2.0, 'ACC1'))
+        self.assertEqual(ledger.format(), ['存款: +10.50', '转出: -0.25 (ACC1)', '转出: -0.25 (ACC1)'])
+
+    def test_range_queries_and_sums(self):
+        """
+        TC003：验证按时间范围查询和求和，并在追加后继续正确
+        """
+        ledger = self.bank.Ledger()
+        for second, (kind, cents) in enumerate([(self.bank.DEPOSIT, 100), (self.bank.WITHDRAWAL, 30),
+                                                (self.bank.INTEREST, 5), (self.bank.DEPOSIT, 200)]):
+            ledger.append(kind, cents, timestamp=float(second))
+        self.assertEqual(ledger.rows(1.0, 3.0), (1, 3))
+        self.assertEqual(ledger.sum_cents(), 275)
+        self.assertEqual(ledger.sum_cents([self.bank.DEPOSIT]), 300)
+        self.assertEqual(ledger.sum_cents(start=1.0, end=3.0), -25)
+        ledger.append(self.bank.WITHDRAWAL, 75, timestamp=4.0)
+        self.assertEqual(ledger.sum_cents(), 200)
+        self.assertEqual(ledger.format(start=3.0), ['存款: +2', '取款: -0.75'])
+
+    def test_prefix_sums_per_kind(self):
+        """
+        TC007：验证每种类型只索引自己的行，任意范围的合计与逐行相加一致
+        """
+        rng = random.Random(3)
+        ledger = self.bank.Ledger()
+        rows = [(rng.randrange(5), rng.randrange(1, 10_000)) for _ in range(500)]
+        for second, (kind, cents) in enumerate(rows[:300]):
+            ledger.append(kind, cents, timestamp=float(second))
+        ledger.sum_cents()
+        for second, (kind, cents) in enumerate(rows[300:], 300):
+            ledger.append(kind, cents, timestamp=float(second))
+        self.assertEqual(sum(len(indexed) for indexed, _ in ledger._prefix), 300)
+        for _ in range(50):
+            lo, hi = sorted(rng.randrange(501) for _ in range(2))
+            for kind in range(5):
+                self.assertEqual(ledger.sum_cents([kind], float(lo), float(hi)),
+                                 sum(cents for k, cents in rows[lo:hi] if k == kind))
+        self.assertEqual(sum(len(indexed) for indexed, _ in ledger._prefix), 500)
+
+    def test_timestamps_stay_sorted(self):
+        """
+        TC004：验证时钟回拨时时间戳仍保持单调不减
+        """
+        ledger = self.bank.Ledger()
+        ledger.append(self.bank.DEPOSIT, 1, timestamp=10.0)
+        ledger.append(self.bank.DEPOSIT, 1, timestamp=5.0)
+        self.assertEqual(list(ledger._timestamps), [10.0, 10.0])
+
+    def test_interest_is_recorded_as_interest(self):
+        """
+        TC005：验证增强版账户的利息以利息类型记账
+        """
+        account = self.bank.EnhancedBankAccount('王五', 2000)
+        account.add_interest()
+        self.assertEqual(account.get_balance(), 2040)
+        self.assertEqual(account.get_ledger().sum_cents([self.bank.INTEREST]), 4000)
+
+    def test_transfer_uses_public_methods(self):
+        """
+        TC006：验证转账和计息经过 withdraw/deposit，子类的重写不会被绕过
+        """
+        calls = []
+
+        class AuditedAccount(self.bank.EnhancedBankAccount):
+            def withdraw(self, amount):
+                calls.append(('withdraw', amount))
+                return super().withdraw(amount)
+
+            def deposit(self, amount):
+                calls.append(('deposit', amount))
+                super().deposit(amount)
+
+        first, second = AuditedAccount('张三', 1000), AuditedAccount('李四', 0)
+        self.assertTrue(first.transfer(second, 300))
+        second.add_interest()
+        self.assertEqual(calls, [('withdraw', 300), ('deposit', 300), ('deposit', 6.0)])
+        self.assertEqual(second.get_transaction_history(), [f'转入: +300 ({first._account_number})', '利息: +6'])
+        second.deposit(1)
+        self.assertEqual(second.get_transaction_history()[-1], '存款: +1')
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Test polymorphism lesson"""
+import contextlib
+import io
+import math
+import unittest
+
+from src.hello_world_python import lessons, output
+
+
+class TestCachedGeometry(unittest.TestCase):
+    """Test 形状几何量的缓存与失效"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.polymorphism')
+
+    def test_values_are_cached(self):
+        """
+        TC001：验证面积、周长和描述计算一次后被缓存
+        """
+        circle = self.lesson.Circle(2)
+        self.assertIsNone(circle._area)
+        self.assertAlmostEqual(circle.area(), math.pi * 4)
+        self.assertEqual(circle._area, circle.area())
+        self.assertEqual(circle.describe(), '这是一个圆形，半径: 2')
+        self.assertIs(circle.describe(), circle.describe())
+
+    def test_reassignment_invalidates(self):
+        """
+        TC002：验证重新赋值几何属性后缓存失效，结果随之更新
+        """
+        rectangle, square = self.lesson.Rectangle(5, 3), self.lesson.Square(6)
+        triangle = self.lesson.Triangle(3, 4, 5)
+        for shape in (rectangle, square, triangle):
+            shape.area(), shape.perimeter(), shape.describe()
+        rectangle.height = 4
+        square.width = square.height = 2
+        triangle.c = 6
+        self.assertEqual((rectangle.area(), rectangle.perimeter()), (20, 18))
+        self.assertEqual(rectangle.describe(), '这是一个矩形，宽: 5, 高: 4')
+        self.assertEqual((square.area(), square.describe()), (4, '这是一个正方形，边长: 2'))
+        self.assertAlmostEqual(triangle.area(), math.sqrt(6.5 * 3.5 * 2.5 * 0.5))
+        self.assertEqual(triangle.perimeter(), 13)
+
+    def test_bulk_triangles(self):
+        """
+        TC003：验证批量构造返回合法三角形和被拒绝的行号，且不抛出异常
+        """
+        triangles, rejected = self.lesson.Triangle.from_sides(
+            [3, 1, 5, -3, 2, float('nan')], [4, 1, 5, -4, 2, 1], [5, 3, 8, -5, 4, 1])
+        self.assertEqual(list(rejected), [1, 3, 4, 5])
+        self.assertEqual([(t.a, t.b, t.c) for t in triangles], [(3, 4, 5), (5, 5, 8)])
+        self.assertEqual([t.area() for t in triangles], [6.0, 12.0])
+        self.assertEqual(triangles[0].describe(), '这是一个三角形，三边长: 3, 4, 5')
+        with self.assertRaises(ValueError):
+            self.lesson.Triangle(2, 2, 4)
+
+    def test_needle_triangle_precision(self):
+        """
+        TC004：验证近退化三角形的面积使用稳定的海伦公式计算，不丢失精度
+        """
+        # 精确面积由有理数计算得到
+        triangle = self.lesson.Triangle(100000, 99999.99979, 0.00029)
+        self.assertAlmostEqual(triangle.area(), 10.000000077021038, delta=1e-12)
+        self.assertEqual(self.lesson.Triangle(1e8, 1e8, 1e-3).area(), 50000.0)
+
+
+class TestGroupedDispatch(unittest.TestCase):
+    """Test 按类型分组执行"""
+
+    def setUp(self):
+        self.lesson = lessons.load('oop.polymorphism')
+        Dog, Cat, Bird = self.lesson.Dog, self.lesson.Cat, self.lesson.Bird
+        self.animals = [Cat('咪咪'), Dog('旺财'), Cat('花花'), Bird('小鸟'), Dog('小黑')]
+
+    def _capture(self, function, *args, **kwargs):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer), output.use('terminal'):
+            function(*args, **kwargs)
+        return buffer.getvalue().splitlines()[2:]
+
+    def test_groups_are_stable(self):
+        """
+        TC005：验证分组按类第一次出现的顺序排列，组内保持原顺序
+        """
+        groups = self.lesson.group_by_type(self.animals)
+        self.assertEqual([cls.__name__ for cls in groups], ['Cat', 'Dog', 'Bird'])
+        self.assertEqual([animal.name for animal in groups[self.lesson.Cat]], ['咪咪', '花花'])
+
+    def test_grouped_output(self):
+        """
+        TC006：验证分组执行的输出与逐个执行的输出是同一组行，并按组稳定排列
+        """
+        for function in (self.lesson.animal_concert, self.lesson.animal_parade):
+            per_object = self._capture(function, self.animals)
+            grouped = self._capture(function, self.animals, grouped=True)
+            self.assertEqual(sorted(grouped), sorted(per_object))
+            self.assertEqual(grouped, [per_object[i] for i in (0, 2, 1, 4, 3)])
+            groups = self.lesson.group_by_type(self.animals)
+            self.assertEqual(self._capture(function, groups, grouped=True), grouped)